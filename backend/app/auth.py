@@ -5,8 +5,8 @@ from uuid import UUID
 from dotenv import load_dotenv
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import httpx
 import jwt
-from jwt import PyJWKClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from clerk_backend_api import Clerk
@@ -14,6 +14,8 @@ from clerk_backend_api import Clerk
 from db.session import get_session
 from models.user import User
 from core.config import settings
+from core.jwks import JWKSManager
+from core.principal_cache import Principal, principal_cache
 from repositories.user_repo import UserRepository
 
 security = HTTPBearer()
@@ -50,29 +52,27 @@ def _build_jwks_url(domain: str) -> str:
 
 try:
     jwks_url = _build_jwks_url(settings.clerk_domain)
-    jwks_client = PyJWKClient(
+    jwks_manager = JWKSManager(
         jwks_url,
-        cache_keys=True,
-        max_cached_keys=16,
+        refresh_interval=settings.clerk_jwks_refresh_seconds,
     )
 except Exception as e:
     print(f"Warning: Could not initialize JWKS client (domain='{settings.clerk_domain}'): {e}")
-    jwks_client = None
+    jwks_manager = None
 
 
 async def verify_clerk_token(token: str) -> dict:
-    if not jwks_client:
+    if not jwks_manager:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Authentication service unavailable",
         )
 
     try:
-        signing_key = jwks_client.get_signing_key_from_jwt(token)
-
-        decoded = jwt.decode(
+        # Key lookup is served from memory and the RS256 check runs in a
+        # worker thread, so verification never blocks the event loop.
+        decoded = await jwks_manager.decode(
             token,
-            signing_key.key,
             algorithms=["RS256"],
             options={"verify_exp": True, "verify_aud": False},
         )
@@ -102,6 +102,11 @@ async def verify_clerk_token(token: str) -> dict:
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid token: {str(e)}",
         )
+    except httpx.HTTPError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Could not fetch signing keys: {str(e)}",
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -160,31 +165,19 @@ async def sync_user_service(request: Request, db: AsyncSession):
 
     await db.commit()
     await db.refresh(user)
+    principal_cache.invalidate_user(user.user_id)
 
     internal_token = _create_internal_jwt(user)
 
     return {"token": internal_token, "user": user}
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_session)
-) -> User:
-    token = credentials.credentials
-
+def _decode_internal_token(token: str) -> dict:
     try:
         payload = jwt.decode(
             token,
             settings.jwt_secret_key,
             algorithms=[settings.jwt_algorithm]
         )
-
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication credentials"
-            )
-
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -196,6 +189,56 @@ async def get_current_user(
             detail="Invalid token"
         )
 
+    if payload.get("sub") is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials"
+        )
+    return payload
+
+
+def _principal_from_user(user: User) -> Principal:
+    return Principal(
+        user_id=user.user_id,
+        role=user.role,
+        username=user.username,
+        is_verified=user.is_verified,
+    )
+
+
+async def _load_principal(payload: dict, db: AsyncSession) -> Principal | None:
+    """Resolve the token's subject to a Principal, hitting the DB only on a
+    cache miss.  Returns None when the user no longer exists."""
+    user_id: str = payload["sub"]
+    exp = int(payload.get("exp") or 0)
+
+    cached = principal_cache.get(user_id, exp)
+    if cached is not None:
+        return cached
+
+    stmt = select(User.user_id, User.role, User.username, User.is_verified).where(User.user_id == user_id)
+    result = await db.execute(stmt)
+    row = result.one_or_none()
+    if row is None:
+        return None
+
+    principal = Principal(
+        user_id=row.user_id,
+        role=row.role,
+        username=row.username,
+        is_verified=row.is_verified,
+    )
+    principal_cache.put(user_id, exp, principal)
+    return principal
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_session)
+) -> User:
+    payload = _decode_internal_token(credentials.credentials)
+    user_id: str = payload["sub"]
+
     stmt = select(User).where(User.user_id == user_id)
     result = await db.execute(stmt)
     user = result.scalar_one_or_none()
@@ -206,6 +249,8 @@ async def get_current_user(
             detail="User not found"
         )
 
+    # The row is already loaded, so warm the principal cache for free.
+    principal_cache.put(user_id, int(payload.get("exp") or 0), _principal_from_user(user))
     return user
 
 
@@ -238,7 +283,41 @@ async def get_optional_current_user(
     return user
 
 
-def require_admin(current_user: User = Depends(get_current_user)) -> User:
+async def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_session),
+) -> Principal:
+    """Stateless fast path for routes that only need the caller's id/role.
+
+    Served from the principal cache when possible, so a warm request costs a
+    token decode and no database round trip.
+    """
+    payload = _decode_internal_token(credentials.credentials)
+    principal = await _load_principal(payload, db)
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    return principal
+
+
+async def get_optional_current_principal(
+    credentials: HTTPAuthorizationCredentials | None = Depends(optional_security),
+    db: AsyncSession = Depends(get_session),
+) -> Principal | None:
+    if credentials is None:
+        return None
+
+    try:
+        payload = _decode_internal_token(credentials.credentials)
+    except HTTPException:
+        return None
+
+    return await _load_principal(payload, db)
+
+
+def require_admin(current_user: Principal = Depends(get_current_principal)) -> Principal:
     if current_user.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -248,7 +327,7 @@ def require_admin(current_user: User = Depends(get_current_user)) -> User:
 
 
 
-def require_verified_creator(current_user: User = Depends(get_current_user)) -> User:
+def require_verified_creator(current_user: Principal = Depends(get_current_principal)) -> Principal:
     if current_user.role not in ("verified_creator", "admin"):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -257,7 +336,7 @@ def require_verified_creator(current_user: User = Depends(get_current_user)) ->
     return current_user
 
 
-def check_owner_or_admin(user_id: UUID, current_user: User) -> None:
+def check_owner_or_admin(user_id: UUID, current_user: User | Principal) -> None:
     if user_id != current_user.user_id and current_user.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
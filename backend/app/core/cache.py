@@ -0,0 +1,288 @@
+"""
+Read-through cache layer
+========================
+
+Hot read endpoints (featured, nearby, search, places) used to keep their own
+module-level dicts with hand-rolled TTLs.  ``Cache`` replaces them with one
+implementation:
+
+- **L1** — a bounded in-process LRU of decoded values with per-entry TTL.
+- **L2 (optional)** — a backend shared by every worker.  ``cache_backend =
+  "postgres"`` stores entries in the UNLOGGED ``cache_entries`` table, so one
+  worker's load serves the others; the default ``"local"`` is a no-op
+  stand-in and the cache behaves as L1 only.
+- **Single-flight** — concurrent misses for the same key on a worker share a
+  single load instead of stampeding the database.
+- **Metrics** — per-cache hit/miss/load counters, exposed via
+  ``cache_stats()`` (and ``GET /admin/cache-stats``).
+
+Values travel through L2 as JSON, so every cache is declared with the
+pydantic type it holds.
+
+Usage
+-----
+    from core.cache import Cache
+
+    _NEARBY = Cache("nearby", list[EventRead], ttl_seconds=60, max_entries=500)
+
+    return await _NEARBY.get_or_load((lat, lng, radius), lambda: _load(...))
+
+A failing L2 never fails a request — it is logged and the value is loaded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Generic, Hashable, Optional, Protocol, TypeVar
+
+from pydantic import TypeAdapter
+from sqlalchemy import text
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> Optional[bytes]: ...
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+
+class NullBackend:
+    """Local stand-in used when no shared backend is configured."""
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        return None
+
+    async def delete(self, key: str) -> None:
+        return None
+
+
+class PostgresBackend:
+    """Shared entries in the UNLOGGED ``cache_entries`` table."""
+
+    def __init__(self, engine=None):
+        self._engine = engine
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from db.session import async_engine
+
+            self._engine = async_engine
+        return self._engine
+
+    async def get(self, key: str) -> Optional[bytes]:
+        async with self.engine.connect() as conn:
+            res = await conn.execute(
+                text("SELECT value FROM cache_entries WHERE key = :key AND expires_at > now()"),
+                {"key": key},
+            )
+            return res.scalar_one_or_none()
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "INSERT INTO cache_entries (key, value, expires_at) "
+                    "VALUES (:key, :value, now() + make_interval(secs => :ttl)) "
+                    "ON CONFLICT (key) DO UPDATE "
+                    "SET value = EXCLUDED.value, expires_at = EXCLUDED.expires_at"
+                ),
+                {"key": key, "value": value, "ttl": float(ttl_seconds)},
+            )
+
+    async def delete(self, key: str) -> None:
+        async with self.engine.begin() as conn:
+            await conn.execute(text("DELETE FROM cache_entries WHERE key = :key"), {"key": key})
+
+    async def purge_expired(self) -> int:
+        async with self.engine.begin() as conn:
+            res = await conn.execute(text("DELETE FROM cache_entries WHERE expires_at <= now()"))
+            return res.rowcount or 0
+
+
+def _make_backend(name: str) -> CacheBackend:
+    if name == "postgres":
+        return PostgresBackend()
+    if name != "local":
+        logger.warning(f"Unknown cache_backend {name!r}; using in-process cache only")
+    return NullBackend()
+
+
+shared_backend: CacheBackend = _make_backend(settings.cache_backend)
+
+_REGISTRY: dict[str, "Cache"] = {}
+
+
+class Cache(Generic[T]):
+    def __init__(
+        self,
+        name: str,
+        value_type: Any,
+        *,
+        ttl_seconds: float,
+        max_entries: int = 1024,
+        backend: Optional[CacheBackend] = None,
+    ):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._adapter = TypeAdapter(value_type)
+        self._backend = backend if backend is not None else shared_backend
+        self._entries: "OrderedDict[str, tuple[float, T]]" = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.load_errors = 0
+        _REGISTRY[name] = self
+
+    # ------------------------------------------------------------------ API
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        cache_key = self._key(key)
+
+        value = self._get_local(cache_key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if inflight.cancelled():
+                    # The leading request was cancelled; load for ourselves.
+                    return await self.get_or_load(key, loader)
+                raise
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            value = await self._load(cache_key, loader)
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Retrieve once so an exception nobody awaited is not logged.
+                future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(cache_key, None)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop *key* locally; the shared copy is removed in the background."""
+        cache_key = self._key(key)
+        self._entries.pop(cache_key, None)
+        if not isinstance(self._backend, NullBackend):
+            asyncio.get_running_loop().create_task(self._shared_delete(cache_key))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.shared_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "maxEntries": self.max_entries,
+            "ttlSeconds": self.ttl_seconds,
+            "hits": self.hits,
+            "sharedHits": self.shared_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "loadErrors": self.load_errors,
+            "hitRate": round((self.hits + self.shared_hits) / lookups, 4) if lookups else None,
+        }
+
+    # -------------------------------------------------------------- helpers
+
+    def _key(self, key: Hashable) -> str:
+        parts = key if isinstance(key, tuple) else (key,)
+        return f"{self.name}:" + ":".join(str(part) for part in parts)
+
+    def _get_local(self, cache_key: str) -> Optional[T]:
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[cache_key]
+            return None
+        self._entries.move_to_end(cache_key)
+        return value
+
+    def _put_local(self, cache_key: str, value: T, ttl_seconds: float) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[cache_key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _load(self, cache_key: str, loader: Callable[[], Awaitable[T]]) -> T:
+        raw = await self._shared_get(cache_key)
+        if raw is not None:
+            try:
+                value = self._adapter.validate_json(raw)
+            except ValueError as e:
+                logger.warning(f"Discarding undecodable shared cache entry {cache_key}: {e}")
+            else:
+                self.shared_hits += 1
+                self._put_local(cache_key, value, self.ttl_seconds)
+                return value
+
+        self.misses += 1
+        try:
+            value = await loader()
+        except Exception:
+            self.load_errors += 1
+            raise
+        self._put_local(cache_key, value, self.ttl_seconds)
+        await self._shared_set(cache_key, value)
+        return value
+
+    async def _shared_get(self, cache_key: str) -> Optional[bytes]:
+        if isinstance(self._backend, NullBackend):
+            return None
+        try:
+            return await self._backend.get(cache_key)
+        except Exception as e:
+            logger.warning(f"Shared cache read failed for {cache_key}: {e}")
+            return None
+
+    async def _shared_set(self, cache_key: str, value: T) -> None:
+        if isinstance(self._backend, NullBackend):
+            return
+        try:
+            await self._backend.set(cache_key, self._adapter.dump_json(value), self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Shared cache write failed for {cache_key}: {e}")
+
+    async def _shared_delete(self, cache_key: str) -> None:
+        try:
+            await self._backend.delete(cache_key)
+        except Exception as e:
+            logger.warning(f"Shared cache delete failed for {cache_key}: {e}")
+
+
+def cache_stats() -> dict[str, dict[str, Any]]:
+    return {name: cache.stats() for name, cache in _REGISTRY.items()}
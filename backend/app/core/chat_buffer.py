@@ -0,0 +1,232 @@
+"""
+In-memory ring buffer for hot event chats
+=========================================
+
+Busy chat rooms are polled every few seconds by every open tab, and each poll
+used to be an indexed ``SELECT`` plus a ``selectinload`` of the authors.  This
+module keeps the most recent ``capacity`` messages of up to ``max_rooms``
+events as already-serialised ``EventChatRead`` objects so those polls are
+answered from memory.
+
+A room's buffer is authoritative for every message with a timestamp strictly
+after its ``floor``; anything older (or any room we have never seeded) falls
+back to SQL.  Coherence across workers comes from the ``event_chat``
+LISTEN/NOTIFY channel (see ``core.chat_notifier``):
+
+- a ``post`` notification for a message the buffer does not hold marks the
+  room stale; the next reader runs one catch-up query and merges the result,
+- a ``delete`` notification drops the message,
+- losing the listener connection clears every room, and the repository only
+  consults the buffer while the listener is up.
+
+Usage
+-----
+    from core.chat_buffer import chat_buffer
+
+    cached = chat_buffer.read(event_id, limit=50, since=since_dt)
+    if cached is None:
+        ...  # fall back to SQL
+"""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Iterable, Optional
+from uuid import UUID
+
+from core.chat_notifier import chat_notifier
+from core.config import settings
+from schemas.event_chat import EventChatRead
+
+CatchUpFetch = Callable[[Optional[datetime], int], Awaitable[Iterable[EventChatRead]]]
+
+# Commits can become visible slightly out of timestamp order, so catch-up
+# queries re-read a short window behind the newest buffered message.
+CATCH_UP_OVERLAP = timedelta(seconds=5)
+
+
+class _Room:
+    __slots__ = ("messages", "ids", "floor", "stale", "version", "lock")
+
+    def __init__(self) -> None:
+        # Oldest-first, ordered by timestamp.
+        self.messages: list[EventChatRead] = []
+        self.ids: set[UUID] = set()
+        # None means the buffer holds the room's entire history.
+        self.floor: Optional[datetime] = None
+        # Not authoritative until the first seed (or catch-up) lands.
+        self.stale = True
+        # Bumped on every remote change so an in-flight catch-up can tell
+        # whether it raced with another notification.
+        self.version = 0
+        self.lock = asyncio.Lock()
+
+    @property
+    def newest(self) -> Optional[datetime]:
+        return self.messages[-1].timestamp if self.messages else None
+
+
+class EventChatBuffer:
+    def __init__(self, capacity: int = 200, max_rooms: int = 256):
+        self.capacity = capacity
+        self.max_rooms = max_rooms
+        self._rooms: "OrderedDict[str, _Room]" = OrderedDict()
+
+    # ------------------------------------------------------------------ reads
+
+    def read(
+        self,
+        event_id: UUID,
+        limit: int,
+        since: Optional[datetime] = None,
+    ) -> Optional[list[EventChatRead]]:
+        """Return messages in the same shape as ``list_for_event_service``,
+        or ``None`` when the buffer cannot answer authoritatively."""
+        room = self._rooms.get(str(event_id))
+        if room is None or room.stale:
+            return None
+        self._rooms.move_to_end(str(event_id))
+
+        if since is None:
+            if room.floor is not None and len(room.messages) < limit:
+                return None
+            return room.messages[-limit:]
+
+        if room.floor is not None and since < room.floor:
+            return None
+        start = bisect_right(room.messages, since, key=lambda m: m.timestamp)
+        return room.messages[start:start + limit]
+
+    def is_stale(self, event_id: UUID) -> bool:
+        room = self._rooms.get(str(event_id))
+        return room is not None and room.stale
+
+    async def refresh_stale(self, event_id: UUID, fetch: CatchUpFetch) -> None:
+        """Bring a stale room up to date with one catch-up query.
+
+        ``fetch(since, limit)`` must return messages oldest-first, like a
+        ``since`` poll.  Concurrent readers of the same room wait for the
+        first one's query instead of issuing their own.
+        """
+        room = self._rooms.get(str(event_id))
+        if room is None or not room.stale:
+            return
+        async with room.lock:
+            if not room.stale:
+                return
+            version = room.version
+            newest = room.newest
+            since = newest - CATCH_UP_OVERLAP if newest is not None else None
+            messages = list(await fetch(since, self.capacity))
+            if len(messages) >= self.capacity:
+                # More arrived than we can hold; let the next initial load reseed.
+                self._rooms.pop(str(event_id), None)
+                return
+            self._merge(room, messages)
+            if room.version == version:
+                room.stale = False
+
+    # ----------------------------------------------------------------- writes
+
+    def begin_seed(self, event_id: UUID) -> int:
+        """Reserve a room before its seed query runs.
+
+        Returns a version token for ``seed``; notifications that land while
+        the query is in flight bump it, and the seeded room is then marked
+        stale so the next reader catches up.
+        """
+        room = self._room(event_id, create=True)
+        return room.version
+
+    def seed(self, event_id: UUID, messages: Iterable[EventChatRead], limit: int, version: int) -> None:
+        """Replace a room with the result of an initial-load query for *limit* rows."""
+        room = self._room(event_id, create=True)
+        messages = list(messages)
+        room.messages = []
+        room.ids = set()
+        room.floor = None
+        self._merge(room, messages)
+        # A short page means we saw the whole history.
+        if len(messages) >= limit and room.floor is None:
+            room.floor = messages[0].timestamp
+        room.stale = room.version != version
+
+    def add(self, message: EventChatRead) -> None:
+        room = self._rooms.get(str(message.event_id))
+        if room is not None:
+            self._merge(room, [message])
+
+    def discard(self, message_id: UUID) -> None:
+        for room in self._rooms.values():
+            if message_id in room.ids:
+                room.ids.discard(message_id)
+                room.messages = [m for m in room.messages if m.message_id != message_id]
+                return
+
+    def clear(self) -> None:
+        self._rooms.clear()
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+    # ------------------------------------------------------- notifier hooks
+
+    def on_notification(self, event_id: str, op: str, message_id: str) -> None:
+        try:
+            message_uuid = UUID(message_id)
+        except ValueError:
+            message_uuid = None
+
+        if op == "delete":
+            if message_uuid is not None:
+                self.discard(message_uuid)
+            return
+
+        room = self._rooms.get(event_id)
+        if room is not None and (message_uuid is None or message_uuid not in room.ids):
+            room.stale = True
+            room.version += 1
+
+    # ---------------------------------------------------------------- helpers
+
+    def _room(self, event_id: UUID, create: bool = False) -> Optional[_Room]:
+        key = str(event_id)
+        room = self._rooms.get(key)
+        if room is None and create:
+            room = _Room()
+            self._rooms[key] = room
+            while len(self._rooms) > self.max_rooms:
+                self._rooms.popitem(last=False)
+        if room is not None:
+            self._rooms.move_to_end(key)
+        return room
+
+    def _merge(self, room: _Room, messages: Iterable[EventChatRead]) -> None:
+        for message in messages:
+            if message.message_id in room.ids:
+                continue
+            if room.floor is not None and message.timestamp <= room.floor:
+                continue
+            # Usually an append; commits can land slightly out of timestamp order.
+            pos = bisect_right(room.messages, message.timestamp, key=lambda m: m.timestamp)
+            room.messages.insert(pos, message)
+            room.ids.add(message.message_id)
+
+        overflow = len(room.messages) - self.capacity
+        if overflow > 0:
+            dropped = room.messages[:overflow]
+            del room.messages[:overflow]
+            for message in dropped:
+                room.ids.discard(message.message_id)
+            room.floor = dropped[-1].timestamp
+
+
+chat_buffer = EventChatBuffer(
+    capacity=settings.event_chat_buffer_size,
+    max_rooms=settings.event_chat_buffer_rooms,
+)
+chat_notifier.add_message_handler(chat_buffer.on_notification)
+chat_notifier.add_disconnect_handler(chat_buffer.clear)
@@ -0,0 +1,215 @@
+"""
+Event-chat wake-ups via Postgres LISTEN/NOTIFY
+==============================================
+
+Long-poll requests on ``/event-chats/event/{event_id}?wait=N`` park on an
+``asyncio.Event`` here instead of re-querying the database.  Each worker keeps
+one dedicated asyncpg connection that ``LISTEN``s on ``event_chat`` and fans
+each notification out to every waiter for that ``event_id``, so idle chats
+cost no queries at all.
+
+Writers call ``publish_event_chat(db, event_id, message_id)`` inside the transaction that
+inserts the message.  ``NOTIFY`` is transactional, so waiters only wake once
+the row is committed and visible to their follow-up query.
+
+Payloads are ``"{event_id}:{op}:{message_id}"`` where ``op`` is ``post`` or
+``delete``.  Only posts wake long-poll waiters; every notification is also
+passed to registered message handlers (the in-memory chat buffer uses this to
+stay coherent with writes made on other workers).
+
+Other per-worker caches can ride the same connection on their own channel:
+``add_channel_handler(channel, handler)`` LISTENs on *channel* and passes
+each payload to *handler*.  Register at import time; channels added after
+the listener connected take effect on its next reconnect.
+
+If the listener connection cannot be opened the endpoint degrades to plain
+SQL polls rather than failing.  Connect attempts are bounded by
+``event_chat_listen_connect_timeout_seconds`` and, after a failure, not
+retried for ``event_chat_listen_retry_seconds``; ordinary polls never wait on
+a connect — ``listening_or_reconnect()`` starts one in the background.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Optional
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "event_chat"
+
+MessageHandler = Callable[[str, str, str], None]
+
+
+def _asyncpg_dsn(sqlalchemy_url: str) -> str:
+    url = make_url(sqlalchemy_url).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+class EventChatNotifier:
+    def __init__(
+        self,
+        dsn: str,
+        connect_timeout: float = settings.event_chat_listen_connect_timeout_seconds,
+        retry_after: float = settings.event_chat_listen_retry_seconds,
+    ):
+        self._dsn = dsn
+        self._connect_timeout = connect_timeout
+        self._retry_after = retry_after
+        self._conn: Optional[asyncpg.Connection] = None
+        self._connect_lock = asyncio.Lock()
+        self._failed_at: Optional[float] = None
+        self._reconnect: Optional[asyncio.Task] = None
+        self._waiters: dict[str, set[asyncio.Event]] = {}
+        self._message_handlers: list[MessageHandler] = []
+        self._channel_handlers: dict[str, list[Callable[[str], None]]] = {}
+        self._disconnect_handlers: list[Callable[[], None]] = []
+
+    @property
+    def is_listening(self) -> bool:
+        return self._conn is not None and not self._conn.is_closed()
+
+    def add_message_handler(self, handler: MessageHandler) -> None:
+        """Call ``handler(event_id, op, message_id)`` for every notification."""
+        self._message_handlers.append(handler)
+
+    def add_channel_handler(self, channel: str, handler: Callable[[str], None]) -> None:
+        """Call ``handler(payload)`` for every notification on *channel*."""
+        self._channel_handlers.setdefault(channel, []).append(handler)
+
+    def add_disconnect_handler(self, handler: Callable[[], None]) -> None:
+        """Call ``handler()`` when the listener connection drops."""
+        self._disconnect_handlers.append(handler)
+
+    def listening_or_reconnect(self) -> bool:
+        """Whether the listener is up; if not, start reconnecting in the background without waiting."""
+        if self.is_listening:
+            return True
+        if not self._backing_off() and (self._reconnect is None or self._reconnect.done()):
+            self._reconnect = asyncio.create_task(self._ensure_listener())
+        return False
+
+    def _backing_off(self) -> bool:
+        return self._failed_at is not None and time.monotonic() - self._failed_at < self._retry_after
+
+    async def _ensure_listener(self) -> bool:
+        if self.is_listening:
+            return True
+        if self._backing_off():
+            return False
+        async with self._connect_lock:
+            if self.is_listening:
+                return True
+            # A concurrent attempt may have just failed.
+            if self._backing_off():
+                return False
+            try:
+                conn = await asyncpg.connect(self._dsn, timeout=self._connect_timeout)
+                await conn.add_listener(CHANNEL, self._on_notify)
+                for channel in self._channel_handlers:
+                    await conn.add_listener(channel, self._on_channel_notify)
+                conn.add_termination_listener(self._on_terminate)
+                self._conn = conn
+                self._failed_at = None
+                logger.info("Event-chat listener connected")
+            except Exception as e:
+                self._failed_at = time.monotonic()
+                logger.warning(
+                    f"Event-chat listener unavailable, retrying in {self._retry_after:.0f}s; "
+                    f"serving chat from SQL: {e}"
+                )
+                return False
+        return True
+
+    def _on_notify(self, _connection, _pid, _channel, payload: str) -> None:
+        event_id, _, rest = payload.partition(":")
+        op, _, message_id = rest.partition(":")
+        op = op or "post"
+
+        if op == "post":
+            for waiter in self._waiters.get(event_id, ()):
+                waiter.set()
+
+        for handler in self._message_handlers:
+            try:
+                handler(event_id, op, message_id)
+            except Exception:
+                logger.exception("Event-chat message handler failed")
+
+    def _on_channel_notify(self, _connection, _pid, channel, payload: str) -> None:
+        for handler in self._channel_handlers.get(channel, ()):
+            try:
+                handler(payload)
+            except Exception:
+                logger.exception(f"Handler for {channel} notification failed")
+
+    def _on_terminate(self, _connection) -> None:
+        # Drop the handle; the next subscriber reconnects.  Wake everyone so
+        # they re-query instead of sleeping through messages we may have missed.
+        self._conn = None
+        for waiters in self._waiters.values():
+            for waiter in waiters:
+                waiter.set()
+        for handler in self._disconnect_handlers:
+            handler()
+
+    @asynccontextmanager
+    async def subscribe(self, event_id: UUID) -> AsyncIterator[asyncio.Event]:
+        """Register interest in *event_id* for the lifetime of the block.
+
+        Subscribe *before* running the catch-up query so a message committed
+        between the query and the wait still wakes the caller.  Check
+        ``is_listening`` before waiting: without the listener nothing will
+        set the event.
+        """
+        key = str(event_id)
+        waiter = asyncio.Event()
+        await self._ensure_listener()
+        self._waiters.setdefault(key, set()).add(waiter)
+        try:
+            yield waiter
+        finally:
+            waiters = self._waiters.get(key)
+            if waiters is not None:
+                waiters.discard(waiter)
+                if not waiters:
+                    del self._waiters[key]
+
+    async def close(self) -> None:
+        if self._reconnect is not None and not self._reconnect.done():
+            self._reconnect.cancel()
+        if self._conn is not None and not self._conn.is_closed():
+            await self._conn.close()
+        self._conn = None
+
+
+async def wait_for_wakeup(waiter: asyncio.Event, timeout: float) -> bool:
+    try:
+        await asyncio.wait_for(waiter.wait(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+async def publish_event_chat(
+    db: AsyncSession,
+    event_id: UUID,
+    message_id: UUID,
+    op: str = "post",
+) -> None:
+    """Queue a NOTIFY for *event_id*; delivered when *db* commits."""
+    await db.execute(select(func.pg_notify(CHANNEL, f"{event_id}:{op}:{message_id}")))
+
+
+chat_notifier = EventChatNotifier(_asyncpg_dsn(settings.database_url_async))
@@ -12,14 +12,47 @@ class Settings(BaseSettings):
 
     database_url: str
     database_url_async: str
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    # Extra sessions one request may open at once for independent reads
+    # (db.parallel.gather_reads); 0 means half of db_pool_size.
+    db_parallel_reads: int = 0
 
     clerk_secret_key: str
     clerk_domain: str
+    clerk_jwks_refresh_seconds: float = 3600.0
 
     jwt_secret_key: str = "dev-internal-jwt-secret"
     jwt_algorithm: str = "HS256"
     jwt_exp_minutes: int = 720
 
+    auth_principal_cache_size: int = 4096
+    auth_principal_cache_ttl_seconds: float = 60.0
+
+    # "local" (per-worker only) or "postgres" (shared via cache_entries).
+    cache_backend: str = "local"
+
+    event_chat_buffer_size: int = 200
+    event_chat_buffer_rooms: int = 256
+    # LISTEN connection: bound each connect attempt and back off after a failure.
+    event_chat_listen_connect_timeout_seconds: float = 5.0
+    event_chat_listen_retry_seconds: float = 30.0
+
+    # Conditional ESPN fetches; an empty dir means a folder under the system temp dir.
+    espn_response_cache: bool = True
+    espn_response_cache_dir: str = ""
+    # Entries not fetched for this long are pruned at the start of a run.
+    espn_response_cache_max_age_days: int = 7
+
+    geocode_min_interval_seconds: float = 1.1  # Nominatim: 1 request per second
+    geocode_ttl_days: int = 180
+    geocode_miss_ttl_days: int = 14
+
+    # Nightly cleanup deletes in chunks of this many rows, one transaction each.
+    cleanup_chunk_size: int = 1000
+    cleanup_archive: bool = False
+    cleanup_archive_retention_days: int = 90
+
     foursquare_api_key: str = ""
     foursquare_base_url: str = "https://places-api.foursquare.com"
     foursquare_api_version: str = "2025-06-17"
@@ -0,0 +1,104 @@
+"""
+Fixed lat/lng grid for nearby queries
+=====================================
+
+``events`` and ``venues`` carry a ``geo_cell`` column: the index of the
+``CELL_DEGREES`` × ``CELL_DEGREES`` cell containing the row's coordinates,
+numbered row-major from (-90, -180).  It is a Postgres generated column, so
+it stays correct however the coordinates are written.
+
+Because cells are numbered row-major, the cells a search circle touches in
+one grid row form a contiguous integer range.  ``cell_ranges`` returns those
+ranges, which turn a nearby search into a few ``geo_cell BETWEEN lo AND hi``
+index scans; ``haversine_miles_sql`` then filters and orders by exact
+distance in SQL.
+
+``CELL_DEGREES`` is baked into the generated columns (migration
+``c5d6e7f8a9b0``); changing it requires a migration that rewrites them.
+"""
+
+from __future__ import annotations
+
+import math
+
+from sqlalchemy import func, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+CELL_DEGREES = 0.5
+GRID_ROWS = int(180 / CELL_DEGREES)
+GRID_COLS = int(360 / CELL_DEGREES)
+
+EARTH_RADIUS_MILES = 3959.0
+MILES_PER_DEGREE_LAT = 69.0
+
+
+def geo_cell_sql(lat_column: str, lng_column: str) -> str:
+    """SQL for the generated ``geo_cell`` column; mirrors ``cell_for``."""
+    return (
+        f"(LEAST(FLOOR(({lat_column} + 90) / {CELL_DEGREES}), {GRID_ROWS - 1})::integer * {GRID_COLS}"
+        f" + LEAST(FLOOR(({lng_column} + 180) / {CELL_DEGREES}), {GRID_COLS - 1})::integer)"
+    )
+
+
+def _row(lat: float) -> int:
+    return max(0, min(int(math.floor((lat + 90) / CELL_DEGREES)), GRID_ROWS - 1))
+
+
+def _col(lng: float) -> int:
+    return max(0, min(int(math.floor((lng + 180) / CELL_DEGREES)), GRID_COLS - 1))
+
+
+def cell_for(lat: float, lng: float) -> int:
+    return _row(lat) * GRID_COLS + _col(lng)
+
+
+def cell_ranges(lat: float, lng: float, radius_miles: float) -> list[tuple[int, int]]:
+    """Inclusive ``geo_cell`` ranges covering every point within *radius_miles*."""
+    lat_span = radius_miles / MILES_PER_DEGREE_LAT
+    south = max(-90.0, lat - lat_span)
+    north = min(90.0, lat + lat_span)
+
+    # A degree of longitude is shortest at the edge nearest the pole, so size
+    # the longitude span there to keep the whole circle inside the box.
+    widest_lat = max(abs(south), abs(north))
+    cos_lat = max(math.cos(math.radians(widest_lat)), 1e-6)
+    lng_span = radius_miles / (MILES_PER_DEGREE_LAT * cos_lat)
+
+    col_spans: list[tuple[int, int]]
+    if lng_span >= 180:
+        col_spans = [(0, GRID_COLS - 1)]
+    else:
+        west, east = lng - lng_span, lng + lng_span
+        if west < -180:
+            col_spans = [(0, _col(east)), (_col(west + 360), GRID_COLS - 1)]
+        elif east > 180:
+            col_spans = [(0, _col(east - 360)), (_col(west), GRID_COLS - 1)]
+        else:
+            col_spans = [(_col(west), _col(east))]
+
+    ranges: list[tuple[int, int]] = []
+    for row in range(_row(south), _row(north) + 1):
+        base = row * GRID_COLS
+        for first, last in col_spans:
+            lo, hi = base + first, base + last
+            # Full-width rows are contiguous with the next row; merge them.
+            if ranges and ranges[-1][1] + 1 >= lo:
+                ranges[-1] = (ranges[-1][0], max(ranges[-1][1], hi))
+            else:
+                ranges.append((lo, hi))
+    return ranges
+
+
+def haversine_miles_sql(lat_column, lng_column, lat: float, lng: float) -> ColumnElement:
+    """Great-circle distance in miles from (*lat*, *lng*) to the given columns."""
+    d_lat = func.radians(lat_column - lat)
+    d_lng = func.radians(lng_column - lng)
+    a = (
+        func.power(func.sin(d_lat / 2.0), 2)
+        + math.cos(math.radians(lat)) * func.cos(func.radians(lat_column)) * func.power(func.sin(d_lng / 2.0), 2)
+    )
+    return 2 * EARTH_RADIUS_MILES * func.asin(func.sqrt(func.least(a, 1.0)))
+
+
+def cells_filter(cell_column, ranges: list[tuple[int, int]]) -> ColumnElement:
+    return or_(*(cell_column.between(lo, hi) for lo, hi in ranges))
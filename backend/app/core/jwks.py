@@ -0,0 +1,132 @@
+"""
+Async JWKS manager for Clerk token verification
+================================================
+
+``PyJWKClient`` fetches keys with a blocking ``urllib`` call, which stalls the
+whole event loop on a cache miss.  ``JWKSManager`` keeps the key set in memory
+and refreshes it with ``httpx.AsyncClient`` instead:
+
+- ``start()`` warms the keys at startup and launches a background task that
+  refreshes them every ``refresh_interval`` seconds, well before Clerk rotates.
+- Concurrent refreshes are deduplicated — callers that arrive while a fetch is
+  in flight await the same task instead of issuing their own request.
+- An unknown ``kid`` triggers one forced refresh (rate-limited by
+  ``min_refresh_interval``) so key rotation is picked up without a restart.
+- ``decode()`` runs the RS256 signature check in a worker thread so bursts of
+  ``/auth/sync`` calls do not serialise on the event loop.
+
+If ``start()`` was never called (e.g. the Azure Functions host skipping ASGI
+startup events) the first ``get_signing_key`` call loads the keys lazily.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+import httpx
+import jwt
+
+logger = logging.getLogger(__name__)
+
+
+class JWKSManager:
+    def __init__(
+        self,
+        jwks_url: str,
+        *,
+        refresh_interval: float = 3600.0,
+        min_refresh_interval: float = 30.0,
+        timeout: float = 5.0,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        self.jwks_url = jwks_url
+        self.refresh_interval = refresh_interval
+        self.min_refresh_interval = min_refresh_interval
+        self._client = client or httpx.AsyncClient(timeout=timeout)
+        self._keys: dict[str, jwt.PyJWK] = {}
+        self._fetched_at: float = 0.0
+        self._inflight: Optional[asyncio.Task] = None
+        self._background: Optional[asyncio.Task] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return bool(self._keys)
+
+    async def start(self) -> None:
+        try:
+            await self.refresh()
+        except Exception as e:
+            # Keep serving; the next verification will retry the fetch.
+            logger.warning(f"Initial JWKS fetch from {self.jwks_url} failed: {e}")
+        if self._background is None or self._background.done():
+            self._background = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        if self._background is not None:
+            self._background.cancel()
+            try:
+                await self._background
+            except asyncio.CancelledError:
+                pass
+            self._background = None
+        await self._client.aclose()
+
+    async def refresh(self) -> None:
+        """Fetch the key set, sharing one in-flight request between callers."""
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._fetch())
+        await asyncio.shield(self._inflight)
+
+    async def get_signing_key(self, kid: Optional[str]) -> jwt.PyJWK:
+        if not self._keys:
+            await self.refresh()
+
+        key = self._lookup(kid)
+        if key is not None:
+            return key
+
+        # Unknown kid: Clerk may have rotated keys.  Refresh once, but don't let
+        # a stream of bogus tokens hammer the JWKS endpoint.
+        if time.monotonic() - self._fetched_at >= self.min_refresh_interval:
+            await self.refresh()
+            key = self._lookup(kid)
+            if key is not None:
+                return key
+
+        raise jwt.PyJWKClientError(f'Unable to find a signing key that matches: "{kid}"')
+
+    async def decode(self, token: str, **kwargs) -> dict:
+        header = jwt.get_unverified_header(token)
+        signing_key = await self.get_signing_key(header.get("kid"))
+        return await asyncio.to_thread(jwt.decode, token, signing_key.key, **kwargs)
+
+    def _lookup(self, kid: Optional[str]) -> Optional[jwt.PyJWK]:
+        if kid is None and len(self._keys) == 1:
+            return next(iter(self._keys.values()))
+        return self._keys.get(kid) if kid is not None else None
+
+    async def _fetch(self) -> None:
+        response = await self._client.get(self.jwks_url)
+        response.raise_for_status()
+        jwk_set = jwt.PyJWKSet.from_dict(response.json())
+        keys = {
+            key.key_id: key
+            for key in jwk_set.keys
+            if key.key_id and key.public_key_use in (None, "sig")
+        }
+        if not keys:
+            raise jwt.PyJWKClientError("The JWKS endpoint did not contain any signing keys")
+        self._keys = keys
+        self._fetched_at = time.monotonic()
+        logger.info(f"Loaded {len(keys)} JWKS signing key(s)")
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Background JWKS refresh failed: {e}")
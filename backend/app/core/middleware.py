@@ -1,5 +1,7 @@
 from fastapi.middleware.cors import CORSMiddleware
 
+from db.pagination import NEXT_CURSOR_HEADER
+
 def setup_cors(app):
     app.add_middleware(
         CORSMiddleware,
@@ -13,6 +15,8 @@ def setup_cors(app):
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Lets the browser read the keyset cursor on paged list responses.
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
 
     return app
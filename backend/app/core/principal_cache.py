@@ -0,0 +1,101 @@
+"""
+Authenticated principal cache
+=============================
+
+Every authenticated request used to decode the internal HS256 token and then
+``SELECT`` the full ``users`` row before doing any real work.  Most routes only
+need the caller's id and role, so this module keeps a small, bounded LRU of
+``Principal`` objects keyed by the token's ``sub`` + ``exp`` claims.
+
+Entries expire after ``ttl_seconds`` or when the token itself expires,
+whichever comes first.  Anything that changes a user's role, verification
+status or existence must call ``principal_cache.invalidate_user(user_id)`` so
+the next request re-reads the row.  The cache is per-process; the TTL bounds
+how stale another worker's copy can get.
+
+Usage
+-----
+    from core.principal_cache import principal_cache
+
+    principal_cache.invalidate_user(user.user_id)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+from core.config import settings
+
+
+class Principal(BaseModel):
+    """Lightweight stand-in for the ORM ``User`` on routes that only need
+    identity and role."""
+    model_config = ConfigDict(frozen=True)
+
+    user_id: UUID
+    role: str
+    username: str
+    is_verified: bool = False
+
+
+class PrincipalCache:
+    def __init__(self, max_entries: int = 4096, ttl_seconds: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[tuple[str, int], tuple[float, Principal]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, sub: str, exp: int) -> Optional[Principal]:
+        key = (sub, exp)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if now >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return principal
+
+    def put(self, sub: str, exp: int, principal: Principal) -> None:
+        # Never outlive the token: a cached principal for an expired token
+        # would otherwise keep answering after jwt.decode started rejecting it.
+        token_ttl = exp - time.time()
+        ttl = min(self.ttl_seconds, token_ttl)
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+
+        key = (sub, exp)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, principal)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: UUID | str) -> None:
+        sub = str(user_id)
+        with self._lock:
+            stale_keys = [key for key in self._entries if key[0] == sub]
+            for key in stale_keys:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+principal_cache = PrincipalCache(
+    max_entries=settings.auth_principal_cache_size,
+    ttl_seconds=settings.auth_principal_cache_ttl_seconds,
+)
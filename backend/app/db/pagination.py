@@ -0,0 +1,109 @@
+"""
+Keyset pagination
+=================
+
+``LIMIT n OFFSET k`` makes Postgres produce and throw away ``k`` rows, so
+deep pages get slower the further a client scrolls.  List endpoints instead
+page by the last row seen: a ``Keyset`` orders by one or more sort columns
+ending in the primary key, and the next page starts strictly after that
+row's values (``(date_time, game_id) < (:d, :id)``).  With a composite index
+on the same columns each page is one index range scan.
+
+The cursor is opaque to clients — url-safe base64 of the key values as JSON.
+Routes return the rows as before and put the cursor for the following page
+in the ``X-Next-Cursor`` header (absent on the last page); clients pass it
+back as ``?cursor=``.  ``offset`` is still honoured when no cursor is given.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import uuid
+from datetime import date, datetime
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import Select, literal, tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class Page(list):
+    """A page of results; ``next_cursor`` is None on the last page."""
+
+    def __init__(self, items: Iterable = (), next_cursor: Optional[str] = None):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _from_json(value: Any, python_type: type) -> Any:
+    if value is None:
+        return None
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is uuid.UUID:
+        return uuid.UUID(value)
+    return python_type(value)
+
+
+class Keyset:
+    """An ORDER BY over *columns* (last one unique), all ascending or all descending."""
+
+    def __init__(self, *columns, descending: bool = False):
+        self.columns = columns
+        self.descending = descending
+
+    def encode(self, values: Sequence[Any]) -> str:
+        raw = json.dumps([_to_json(value) for value in values], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> list[Any]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            values = json.loads(raw)
+            if not isinstance(values, list) or len(values) != len(self.columns):
+                raise ValueError("wrong number of key values")
+            return [_from_json(value, column.type.python_type) for value, column in zip(values, self.columns)]
+        except (ValueError, TypeError, binascii.Error) as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from e
+
+    def paginate(self, stmt: Select, *, limit: int, cursor: Optional[str] = None, offset: int = 0) -> Select:
+        """Order *stmt*, start it after *cursor* (or at *offset*) and fetch one row past *limit*."""
+        if cursor is not None:
+            after = tuple_(*(literal(value, column.type) for value, column in zip(self.decode(cursor), self.columns)))
+            key = tuple_(*self.columns)
+            stmt = stmt.where(key < after if self.descending else key > after)
+        elif offset:
+            stmt = stmt.offset(offset)
+        ordering = [column.desc() if self.descending else column.asc() for column in self.columns]
+        # The extra row only tells whether another page exists.
+        return stmt.order_by(*ordering).limit(limit + 1)
+
+    def page(self, rows: Sequence[Any], limit: int, key: Optional[Callable[[Any], Sequence[Any]]] = None) -> Page:
+        """Trim the look-ahead row off *rows*; *key* reads a row's sort values (default: column attributes)."""
+        if len(rows) <= limit:
+            return Page(rows)
+        rows = rows[:limit]
+        last = rows[-1]
+        values = key(last) if key is not None else [getattr(last, column.key) for column in self.columns]
+        return Page(rows, self.encode(values))
+
+
+def with_next_cursor(response: Response, page: Sequence[Any]) -> Sequence[Any]:
+    """Expose *page*'s cursor on *response*; returns *page* for the route to return."""
+    next_cursor = getattr(page, "next_cursor", None)
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return page
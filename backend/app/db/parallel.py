@@ -0,0 +1,56 @@
+"""
+Parallel reads
+==============
+
+An ``AsyncSession`` runs one statement at a time, so endpoints that need
+several independent reads (the admin overview counts, the profile page,
+search result hydration, nearby events and games) used to pay for the sum
+of their queries.  ``gather_reads`` runs each read in its own short-lived
+pooled session and awaits them together, so the endpoint takes about as long
+as its slowest query.
+
+Each loader is an ``async (session) -> result`` callable.  Its session is
+closed (and its connection returned to the pool) as soon as it finishes;
+ORM objects it returns are detached, so load relationships eagerly.  The
+sessions do not share the caller's transaction: use this only for reads that
+need not see the caller's uncommitted writes.
+
+One semaphore per worker caps how many of these extra sessions are open at
+once — ``settings.db_parallel_reads``, by default half of ``db_pool_size`` —
+so a burst of fan-out requests cannot take every pooled connection from
+ordinary requests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+
+Loader = Callable[[AsyncSession], Awaitable[Any]]
+
+
+def parallel_read_limit() -> int:
+    return settings.db_parallel_reads or max(1, settings.db_pool_size // 2)
+
+
+_READ_SLOTS = asyncio.Semaphore(parallel_read_limit())
+
+
+async def gather_reads(*loaders: Loader, session_factory=None) -> list[Any]:
+    """Run each loader in its own session concurrently; results come back in loader order."""
+    if session_factory is None:
+        from db.session import AsyncSessionLocal
+        session_factory = AsyncSessionLocal
+
+    async def run(loader: Loader) -> Any:
+        async with _READ_SLOTS:
+            async with session_factory() as session:
+                return await loader(session)
+
+    if len(loaders) == 1:
+        return [await run(loaders[0])]
+    return list(await asyncio.gather(*(run(loader) for loader in loaders)))
@@ -8,8 +8,8 @@ async_engine = create_async_engine(
     echo=False,
     future=True,
     pool_pre_ping=True,
-    pool_size=10,        # keep 10 connections open (default is 5)
-    max_overflow=20,     # allow 20 extra connections under burst load
+    pool_size=settings.db_pool_size,        # connections kept open (default is 5)
+    max_overflow=settings.db_max_overflow,  # extra connections allowed under burst load
     pool_timeout=30,
     pool_recycle=1800,   # recycle connections every 30 min to avoid stale Azure TCP drops
 )
@@ -24,6 +24,7 @@ async def init_db() -> None:
     try:
         async with async_engine.begin() as conn:
             await conn.execute(text("CREATE EXTENSION IF NOT EXISTS citext"))
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
     except Exception as e:
         print(f"Warning: Could not initialize database extensions: {e}")
 
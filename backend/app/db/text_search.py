@@ -0,0 +1,42 @@
+"""
+Trigram text matching helpers
+=============================
+
+Search paths match user input with ``ILIKE '%q%'``.  A leading wildcard
+cannot use a B-tree, so the ``pg_trgm`` GIN indexes added in migration
+``b4c5d6e7f8a9`` back those filters instead; they serve ``ILIKE``, the ``%``
+similarity operator and ``similarity()`` ranking alike.
+
+``contains_any`` keeps the original substring semantics.  The ranked mode
+(``similar_any`` + ``similarity_score``) also accepts near-misses such as
+typos and orders rows by how closely they match.
+
+``users.username`` is ``CITEXT``; its index is on ``username::text``, so
+callers must pass ``as_text(User.username)`` for the planner to use it.
+"""
+
+from typing import Iterable
+
+from sqlalchemy import Text, cast, func, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def as_text(column) -> ColumnElement:
+    return cast(column, Text)
+
+
+def contains_any(columns: Iterable, query: str) -> ColumnElement:
+    pattern = f"%{query}%"
+    return or_(*(column.ilike(pattern) for column in columns))
+
+
+def similar_any(columns: Iterable, query: str) -> ColumnElement:
+    """Substring match or trigram similarity above ``pg_trgm.similarity_threshold``."""
+    pattern = f"%{query}%"
+    return or_(*(column.ilike(pattern) | column.op("%")(query) for column in columns))
+
+
+def similarity_score(columns: Iterable, query: str) -> ColumnElement:
+    """Best trigram similarity (0–1) of *query* against any of *columns*."""
+    scores = [func.coalesce(func.similarity(column, query), 0.0) for column in columns]
+    return scores[0] if len(scores) == 1 else func.greatest(*scores)
@@ -28,8 +28,8 @@ async def nightly_task_timer(myTimer: func.TimerRequest) -> None:
     logging.info('Nightly task timer trigger function executed.')
     
     try:
-        from scheduled.nightly_tasks import run_nightly_task
-        await run_nightly_task()
+        from scheduled.jobs import run_scheduled_nightly
+        await run_scheduled_nightly()
     except Exception as e:
         logging.exception("Error running nightly task")
         raise
@@ -1,6 +1,9 @@
 from fastapi import FastAPI
 from fastapi.middleware.gzip import GZipMiddleware
+from auth import jwks_manager
+from core.chat_notifier import chat_notifier
 from db.session import init_db
+from repositories.reference_data_repo import warm_reference_data
 from core.middleware import setup_cors
 from routes.api import api_router
 
@@ -17,4 +20,14 @@ app.include_router(api_router)
 @app.on_event("startup")
 async def _startup() -> None:
     await init_db()
-    print("Database initialized.")
\ No newline at end of file
+    print("Database initialized.")
+    await warm_reference_data()
+    if jwks_manager is not None:
+        await jwks_manager.start()
+
+
+@app.on_event("shutdown")
+async def _shutdown() -> None:
+    if jwks_manager is not None:
+        await jwks_manager.stop()
+    await chat_notifier.close()
@@ -2,6 +2,7 @@ from .league import League
 from .team import Team
 from .venue import Venue
 from .game import Game
+from .game_synthetic_id import GameSyntheticId
 from .event import Event
 from .safety_alert import SafetyAlert
 from .team_chat import TeamChat
@@ -15,12 +16,19 @@ from .friend_request import FriendRequest
 from .friendship import Friendship
 from .direct_message import DirectMessage
 from .user_alert_acknowledgment import UserAlertAcknowledgment
+from .cache_entry import CacheEntry
+from .geocode_cache import GeocodeCache
+from .league_sync_window import LeagueSyncWindow
+from .archived_row import ArchivedRow
+from .scrape_job import ScrapeJob
+from .reference_data_version import ReferenceDataVersion
 
 __all__ = [
     "League",
     "Team",
     "Venue",
     "Game",
+    "GameSyntheticId",
     "Event",
     "SafetyAlert",
     "TeamChat",
@@ -34,4 +42,10 @@ __all__ = [
     "Friendship",
     "DirectMessage",
     "UserAlertAcknowledgment",
+    "CacheEntry",
+    "GeocodeCache",
+    "LeagueSyncWindow",
+    "ArchivedRow",
+    "ScrapeJob",
+    "ReferenceDataVersion",
 ]
\ No newline at end of file
@@ -0,0 +1,25 @@
+from __future__ import annotations
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.base import Base
+
+
+class ArchivedRow(Base):
+    """Rows removed by nightly maintenance, kept as JSON when archiving is on.
+
+    Only the purged row itself is archived; children removed by FK cascades
+    (event chats, favorites, acknowledgments) are not.
+    """
+    __tablename__ = "archived_rows"
+    __table_args__ = (
+        Index("ix_archived_rows_archived_at", "archived_at"),
+    )
+
+    source_table: Mapped[str] = mapped_column(String(32), primary_key=True)
+    row_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -0,0 +1,24 @@
+from __future__ import annotations
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, LargeBinary, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.base import Base
+
+
+class CacheEntry(Base):
+    """Shared read-through cache entries (see ``core.cache.PostgresBackend``).
+
+    UNLOGGED: writes skip the WAL and the table is emptied after a crash,
+    which is exactly the durability a cache needs.
+    """
+    __tablename__ = "cache_entries"
+    __table_args__ = (
+        Index("ix_cache_entries_expires_at", "expires_at"),
+        {"prefixes": ["UNLOGGED"]},
+    )
+
+    key: Mapped[str] = mapped_column(Text, primary_key=True)
+    value: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
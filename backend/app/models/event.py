@@ -4,9 +4,10 @@ from datetime import datetime
 from typing import Optional
 
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy import ForeignKey, Index, CheckConstraint, func
+from sqlalchemy import Computed, ForeignKey, Index, Integer, CheckConstraint, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from core.geo_grid import geo_cell_sql
 from db.base import Base
 
 class Event(Base):
@@ -33,6 +34,12 @@ class Event(Base):
     game_date: Mapped[Optional[datetime]]
     latitude: Mapped[float | None]
     longitude: Mapped[float | None]
+    # Only the event's own coordinates; events without them are found via venues.geo_cell.
+    geo_cell: Mapped[int | None] = mapped_column(
+        Integer, Computed(geo_cell_sql("latitude", "longitude"), persisted=True)
+    )
+    # Maintained by repositories.favorite_repo.adjust_favorite_count; ranks featured events.
+    favorite_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
     created_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime | None] = mapped_column(onupdate=func.now())
     creator = relationship("User", back_populates="events")
@@ -43,6 +50,14 @@ class Event(Base):
 
     __table_args__ = (
         Index("ix_events_game_date", "game_date"),
+        Index("ix_events_geo_cell_game_date", "geo_cell", "game_date"),
+        Index("ix_events_venue_id_game_date", "venue_id", "game_date"),
+        Index(
+            "ix_events_favorite_count", "favorite_count",
+            postgresql_where=text("favorite_count > 0"),
+        ),
         CheckConstraint("latitude IS NULL OR (latitude BETWEEN -90 AND 90)", name="chk_event_lat_range"),
         CheckConstraint("longitude IS NULL OR (longitude BETWEEN -180 AND 180)", name="chk_event_lon_range"),
+        Index("ix_events_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+        Index("ix_events_description_trgm", "description", postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"}),
     )
@@ -48,4 +48,5 @@ class Favorite(Base):
             unique=True,
             postgresql_where=text("game_id IS NOT NULL"),
         ),
+        Index("ix_favorites_user_id_date_time", "user_id", "date_time", "favorite_id"),
     )
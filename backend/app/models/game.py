@@ -1,7 +1,7 @@
 from __future__ import annotations
 from datetime import datetime
 
-from sqlalchemy import Integer, String, ForeignKey, UniqueConstraint, CheckConstraint, DateTime, func
+from sqlalchemy import Index, Integer, String, ForeignKey, UniqueConstraint, CheckConstraint, DateTime, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.base import Base
@@ -27,6 +27,8 @@ class Game(Base):
 
     date_time: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # Maintained by repositories.favorite_repo.adjust_favorite_count; ranks featured events.
+    favorite_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
 
     league = relationship("League", back_populates="games")
     home_team = relationship("Team", foreign_keys=[home_team_id])
@@ -39,4 +41,12 @@ class Game(Base):
             "league_id", "home_team_id", "away_team_id", "date_time",
             name="uq_games_league_teams_datetime",
         ),
+        Index("ix_games_venue_id_date_time", "venue_id", "date_time"),
+        # Keyset order for game listings (see db.pagination); also serves date-range scans.
+        Index("ix_games_date_time_game_id", "date_time", "game_id"),
+        Index("ix_games_league_id_date_time", "league_id", "date_time", "game_id"),
+        Index(
+            "ix_games_favorite_count", "favorite_count",
+            postgresql_where=text("favorite_count > 0"),
+        ),
     )
@@ -0,0 +1,26 @@
+from __future__ import annotations
+import uuid
+
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from db.base import Base
+
+
+class GameSyntheticId(Base):
+    """Persisted uuid5(NAMESPACE_DNS, "game:{game_id}") -> game_id mapping.
+
+    Games without an events row are exposed to clients under a synthetic
+    event UUID. Storing the mapping lets us resolve it with a single PK probe
+    instead of hashing every game_id in Python.
+    """
+    __tablename__ = "game_synthetic_ids"
+
+    synthetic_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+
+    game_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("games.game_id", ondelete="CASCADE"), nullable=False, unique=True
+    )
+
+    game = relationship("Game")
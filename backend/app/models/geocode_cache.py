@@ -0,0 +1,25 @@
+from __future__ import annotations
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, Index, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.base import Base
+
+
+class GeocodeCache(Base):
+    """Geocoder answers keyed by normalized query text.
+
+    A row with null coordinates is a cached miss, so a venue Nominatim
+    cannot place is not looked up again every night.
+    """
+    __tablename__ = "geocode_cache"
+    __table_args__ = (
+        Index("ix_geocode_cache_expires_at", "expires_at"),
+    )
+
+    query_key: Mapped[str] = mapped_column(Text, primary_key=True)
+    latitude: Mapped[float | None] = mapped_column(Float)
+    longitude: Mapped[float | None] = mapped_column(Float)
+    fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,21 @@
+from __future__ import annotations
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.base import Base
+
+
+class LeagueSyncWindow(Base):
+    """Last schedule sync of one date window for a league (see ``scheduled.sync_windows``)."""
+    __tablename__ = "league_sync_windows"
+
+    league_code: Mapped[str] = mapped_column(
+        String(10), ForeignKey("leagues.league_code", ondelete="CASCADE"), primary_key=True
+    )
+    window_start: Mapped[date] = mapped_column(Date, primary_key=True)
+    window_end: Mapped[date] = mapped_column(Date, nullable=False)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    game_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    synced_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
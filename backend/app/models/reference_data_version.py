@@ -0,0 +1,20 @@
+from __future__ import annotations
+from datetime import datetime
+
+from sqlalchemy import BigInteger, CheckConstraint, DateTime, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.base import Base
+
+
+class ReferenceDataVersion(Base):
+    """Single-row counter bumped whenever teams, leagues, venues or types change (see ``repositories.reference_data_repo``)."""
+    __tablename__ = "reference_data_version"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, default=1)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=1, server_default="1")
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    __table_args__ = (CheckConstraint("id = 1", name="chk_reference_data_version_single_row"),)
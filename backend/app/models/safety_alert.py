@@ -44,6 +44,7 @@ class SafetyAlert(Base):
 
     __table_args__ = (
         Index("ix_alerts_game_id", "game_id"),
+        Index("ix_alerts_created_at_alert_id", "created_at", "alert_id"),
         CheckConstraint("latitude IS NULL OR (latitude BETWEEN -90 AND 90)", name="chk_alert_lat_range"),
         CheckConstraint("longitude IS NULL OR (longitude BETWEEN -180 AND 180)", name="chk_alert_lon_range"),
         CheckConstraint("severity IN ('low', 'medium', 'high')", name="chk_alert_severity"),
@@ -0,0 +1,47 @@
+from __future__ import annotations
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import Boolean, CheckConstraint, DateTime, Index, Integer, String, Text, func, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.base import Base
+
+
+class ScrapeJob(Base):
+    """One nightly scrape run (see ``scheduled.jobs``).
+
+    ``checkpoint`` holds ``{"leagues": {code: {...}}, "stage": ..., "maintenance": [...]}``;
+    a resumed job skips leagues already recorded as done.  At most one job
+    per kind may be queued or running at a time.
+    """
+    __tablename__ = "scrape_jobs"
+
+    job_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    kind: Mapped[str] = mapped_column(String(20), default="nightly", server_default="nightly", nullable=False)
+    # status: 'queued' | 'running' | 'succeeded' | 'failed'
+    status: Mapped[str] = mapped_column(String(10), default="queued", server_default="queued", nullable=False)
+    trigger: Mapped[str] = mapped_column(String(10), nullable=False)
+    full_refresh: Mapped[bool] = mapped_column(Boolean, default=False, server_default="false", nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    leagues_total: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    leagues_done: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    checkpoint: Mapped[dict] = mapped_column(
+        JSONB, default=lambda: {"leagues": {}}, server_default=text("""'{"leagues": {}}'::jsonb"""), nullable=False
+    )
+    error: Mapped[Optional[str]] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    __table_args__ = (
+        CheckConstraint("status IN ('queued', 'running', 'succeeded', 'failed')", name="chk_scrape_job_status"),
+        Index("ix_scrape_jobs_created_at", "created_at"),
+        Index(
+            "uq_scrape_jobs_active_kind", "kind", unique=True,
+            postgresql_where=text("status IN ('queued', 'running')"),
+        ),
+    )
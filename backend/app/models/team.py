@@ -1,7 +1,7 @@
 from __future__ import annotations
 from datetime import datetime
 
-from sqlalchemy import Integer, String, ForeignKey, UniqueConstraint, func
+from sqlalchemy import Index, Integer, String, ForeignKey, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.base import Base
@@ -36,4 +36,8 @@ class Team(Base):
 
     __table_args__ = (
         UniqueConstraint("espn_team_id", "league_id", name="uq_teams_espn_id_league"),
+        Index("ix_teams_display_name_team_id", "display_name", "team_id"),
+        Index("ix_teams_team_name_trgm", "team_name", postgresql_using="gin", postgresql_ops={"team_name": "gin_trgm_ops"}),
+        Index("ix_teams_display_name_trgm", "display_name", postgresql_using="gin", postgresql_ops={"display_name": "gin_trgm_ops"}),
+        Index("ix_teams_home_location_trgm", "home_location", postgresql_using="gin", postgresql_ops={"home_location": "gin_trgm_ops"}),
     )
\ No newline at end of file
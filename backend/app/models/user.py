@@ -3,7 +3,7 @@ import uuid
 from datetime import datetime
 
 from sqlalchemy.dialects.postgresql import UUID, CITEXT
-from sqlalchemy import UniqueConstraint, func
+from sqlalchemy import Index, UniqueConstraint, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.base import Base
@@ -53,3 +53,9 @@ class User(Base):
         "DirectMessage", foreign_keys="DirectMessage.receiver_id", cascade="all, delete-orphan"
     )
     alert_acknowledgments = relationship("UserAlertAcknowledgment", back_populates="user", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        # CITEXT has no trigram opclass, so the search index is on the text cast.
+        Index("ix_users_username_trgm", text("(username::text) gin_trgm_ops"), postgresql_using="gin"),
+        Index("ix_users_created_at_user_id", "created_at", "user_id"),
+    )
@@ -1,9 +1,10 @@
 from __future__ import annotations
 from datetime import datetime
 
-from sqlalchemy import Integer, CheckConstraint, func
+from sqlalchemy import Computed, Index, Integer, CheckConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from core.geo_grid import geo_cell_sql
 from db.base import Base
 
 class Venue(Base):
@@ -16,6 +17,9 @@ class Venue(Base):
     country: Mapped[str | None]
     latitude: Mapped[float | None]
     longitude: Mapped[float | None]
+    geo_cell: Mapped[int | None] = mapped_column(
+        Integer, Computed(geo_cell_sql("latitude", "longitude"), persisted=True)
+    )
     is_indoor: Mapped[bool | None]
 
     created_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
@@ -29,4 +33,8 @@ class Venue(Base):
     __table_args__ = (
         CheckConstraint("latitude IS NULL OR (latitude BETWEEN -90 AND 90)", name="chk_lat_range"),
         CheckConstraint("longitude IS NULL OR (longitude BETWEEN -180 AND 180)", name="chk_lon_range"),
+        Index("ix_venues_geo_cell", "geo_cell"),
+        Index("ix_venues_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_venues_city_trgm", "city", postgresql_using="gin", postgresql_ops={"city": "gin_trgm_ops"}),
+        Index("ix_venues_state_region_trgm", "state_region", postgresql_using="gin", postgresql_ops={"state_region": "gin_trgm_ops"}),
     )
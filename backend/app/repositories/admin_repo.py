@@ -1,67 +1,63 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Sequence
+from typing import Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import delete, func, select, true, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
+from core.cache import Cache
+from core.principal_cache import principal_cache
+from db.pagination import Keyset, Page
 from models.event import Event
 from models.game import Game
 from models.league import League
 from models.user import User
+from repositories.favorite_repo import release_user_favorite_counts
+from repositories.reference_data_repo import bump_reference_version
+
+
+# Short enough that the dashboard looks live; admin actions below drop it early.
+_OVERVIEW_CACHE = Cache("admin_overview", dict[str, int], ttl_seconds=30, max_entries=2)
+
+
+def _build_overview_stats(today_start: datetime, today_end: datetime):
+    """One row of every overview count: one scan per table, one round trip."""
+    users = select(
+        func.count().label("total_users"),
+        func.count().filter(User.role != "deactivated").label("active_users"),
+        func.count().filter(User.role == "verified_creator").label("verified_creators"),
+        func.count().filter(User.pending_verification == True).label("pending_approvals"),
+    ).subquery("user_stats")
+    events = select(
+        func.count().label("total_events"),
+        func.count().filter(Event.game_date >= today_start, Event.game_date <= today_end).label("events_today"),
+    ).subquery("event_stats")
+    games = (
+        select(func.count().label("games_today"))
+        .where(Game.date_time >= today_start, Game.date_time <= today_end)
+        .subquery("game_stats")
+    )
+    return select(users, events, games).select_from(users.join(events, true()).join(games, true()))
 
 
 async def get_overview_stats_service(db: AsyncSession) -> dict:
-    today_start = datetime.combine(date.today(), datetime.min.time())
-    today_end = datetime.combine(date.today(), datetime.max.time())
+    today = date.today()
+    # Keyed by day so the "today" counts never outlive midnight.
+    return await _OVERVIEW_CACHE.get_or_load(today.isoformat(), lambda: _load_overview_stats(db, today))
 
-    total_users_result = await db.execute(select(func.count()).select_from(User))
-    total_users: int = total_users_result.scalar_one()
-
-    active_users_result = await db.execute(
-        select(func.count()).select_from(User).where(User.role != "deactivated")
-    )
-    active_users: int = active_users_result.scalar_one()
 
-    total_events_result = await db.execute(select(func.count()).select_from(Event))
-    total_events: int = total_events_result.scalar_one()
+async def _load_overview_stats(db: AsyncSession, today: date) -> dict[str, int]:
+    today_start = datetime.combine(today, datetime.min.time())
+    today_end = datetime.combine(today, datetime.max.time())
+    result = await db.execute(_build_overview_stats(today_start, today_end))
+    return dict(result.one()._mapping)
 
-    events_today_result = await db.execute(
-        select(func.count())
-        .select_from(Event)
-        .where(Event.game_date >= today_start, Event.game_date <= today_end)
-    )
-    events_today: int = events_today_result.scalar_one()
 
-    games_today_result = await db.execute(
-        select(func.count())
-        .select_from(Game)
-        .where(Game.date_time >= today_start, Game.date_time <= today_end)
-    )
-    games_today: int = games_today_result.scalar_one()
-
-    verified_creators_result = await db.execute(
-        select(func.count()).select_from(User).where(User.role == "verified_creator")
-    )
-    verified_creators: int = verified_creators_result.scalar_one()
-
-    pending_approvals_result = await db.execute(
-        select(func.count()).select_from(User).where(User.pending_verification == True)
-    )
-    pending_approvals: int = pending_approvals_result.scalar_one()
-
-    return {
-        "total_users": total_users,
-        "active_users": active_users,
-        "total_events": total_events,
-        "events_today": events_today,
-        "games_today": games_today,
-        "verified_creators": verified_creators,
-        "pending_approvals": pending_approvals,
-    }
+def invalidate_overview_stats() -> None:
+    _OVERVIEW_CACHE.invalidate(date.today().isoformat())
 
 
 async def list_all_leagues_service(db: AsyncSession) -> Sequence[League]:
@@ -79,6 +75,7 @@ async def update_league_active_service(
     if not league:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="League not found")
     league.is_active = is_active
+    await bump_reference_version(db)
     await db.commit()
     await db.refresh(league)
     return league
@@ -102,6 +99,8 @@ async def approve_verification_service(user_id: UUID, db: AsyncSession) -> User:
     user.pending_verification = False
     user.role = "verified_creator"
     await db.commit()
+    invalidate_overview_stats()
+    principal_cache.invalidate_user(user_id)
     await db.refresh(user)
     return user
 
@@ -113,6 +112,7 @@ async def deny_verification_service(user_id: UUID, db: AsyncSession) -> User:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     user.pending_verification = False
     await db.commit()
+    invalidate_overview_stats()
     await db.refresh(user)
     return user
 
@@ -134,17 +134,22 @@ async def revoke_creator_status_service(user_id: UUID, db: AsyncSession) -> User
     user.is_verified = False
     user.role = "user"
     await db.commit()
+    invalidate_overview_stats()
+    principal_cache.invalidate_user(user_id)
     await db.refresh(user)
     return user
 
 
+USERS_BY_CREATED_DESC = Keyset(User.created_at, User.user_id, descending=True)
+
+
 async def list_all_users_service(
-    db: AsyncSession, limit: int = 100, offset: int = 0
-) -> Sequence[User]:
+    db: AsyncSession, limit: int = 100, offset: int = 0, cursor: Optional[str] = None
+) -> Page:
     result = await db.execute(
-        select(User).order_by(User.created_at.desc()).limit(limit).offset(offset)
+        USERS_BY_CREATED_DESC.paginate(select(User), limit=limit, cursor=cursor, offset=offset)
     )
-    return result.scalars().all()
+    return USERS_BY_CREATED_DESC.page(result.scalars().all(), limit)
 
 
 async def deactivate_user_service(user_id: UUID, db: AsyncSession) -> User:
@@ -162,5 +167,8 @@ async def clear_clerk_id_service(user_id: UUID, db: AsyncSession) -> None:
 
 
 async def delete_user_service(user_id: UUID, db: AsyncSession) -> None:
+    await release_user_favorite_counts(db, user_id)
     await db.execute(delete(User).where(User.user_id == user_id))
     await db.commit()
+    principal_cache.invalidate_user(user_id)
+    invalidate_overview_stats()
@@ -3,6 +3,7 @@ from typing import Optional, Sequence
 from sqlalchemy import select, update, delete, case
 from sqlalchemy.ext.asyncio import AsyncSession
 from models.alert_type import AlertType
+from repositories.reference_data_repo import bump_reference_version
 
 
 class AlertTypeRepository:
@@ -32,6 +33,7 @@ class AlertTypeRepository:
     async def add(self, alert_type: AlertType) -> AlertType:
         self.db.add(alert_type)
         await self.db.flush()
+        await bump_reference_version(self.db)
         return alert_type
 
     async def update_fields(
@@ -46,8 +48,10 @@ class AlertTypeRepository:
         if not values:
             return await self.get(code)
         await self.db.execute(update(AlertType).where(AlertType.code == code).values(**values))
+        await bump_reference_version(self.db)
         return await self.get(code)
 
     async def remove(self, code: str) -> int:
         res = await self.db.execute(delete(AlertType).where(AlertType.code == code))
+        await bump_reference_version(self.db)
         return res.rowcount or 0
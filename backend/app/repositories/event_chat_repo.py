@@ -7,7 +7,10 @@ from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from core.chat_buffer import chat_buffer
+from core.chat_notifier import chat_notifier, publish_event_chat
 from models.event_chat import EventChat
+from schemas.event_chat import EventChatRead
 
 
 async def list_for_event_service(
@@ -53,11 +56,66 @@ async def list_for_event_service(
     return rows
 
 
+async def list_for_event_buffered_service(
+    event_id: UUID,
+    limit: int,
+    db: AsyncSession,
+    since: datetime | None = None,
+) -> list[EventChatRead]:
+    """
+    Same contract as `list_for_event_service`, but served from the per-event
+    ring buffer in `core.chat_buffer` whenever it can answer authoritatively.
+
+    The buffer is only trusted while the LISTEN connection is up, since that
+    is what tells this worker about messages posted or deleted elsewhere.
+    While it is down the request is served from SQL and never waits on a
+    reconnect.
+    """
+    if not chat_notifier.listening_or_reconnect():
+        rows = await list_for_event_service(event_id=event_id, limit=limit, db=db, since=since)
+        return [EventChatRead.model_validate(row) for row in rows]
+
+    cached = chat_buffer.read(event_id, limit, since)
+    if cached is not None:
+        return cached
+
+    if chat_buffer.is_stale(event_id):
+        async def _fetch(catch_up_since: datetime | None, catch_up_limit: int) -> list[EventChatRead]:
+            rows = await list_for_event_service(
+                event_id=event_id, limit=catch_up_limit, db=db, since=catch_up_since
+            )
+            return [EventChatRead.model_validate(row) for row in rows]
+
+        await chat_buffer.refresh_stale(event_id, _fetch)
+        cached = chat_buffer.read(event_id, limit, since)
+        if cached is not None:
+            return cached
+
+    if since is None:
+        # Initial load: over-fetch to the buffer's capacity so later polls
+        # and page loads for this room are answered from memory.
+        seed_limit = max(limit, chat_buffer.capacity)
+        version = chat_buffer.begin_seed(event_id)
+        rows = await list_for_event_service(event_id=event_id, limit=seed_limit, db=db)
+        messages = [EventChatRead.model_validate(row) for row in rows]
+        chat_buffer.seed(event_id, messages, seed_limit, version)
+        return messages[-limit:]
+
+    # Cursor older than anything buffered.
+    rows = await list_for_event_service(event_id=event_id, limit=limit, db=db, since=since)
+    return [EventChatRead.model_validate(row) for row in rows]
+
+
 async def add_new_chat_service(chat: EventChat, db: AsyncSession) -> EventChat:
     db.add(chat)
+    # Flush first so the message_id default is assigned for the NOTIFY payload.
+    await db.flush()
+    # NOTIFY is transactional: long-poll waiters wake only once the row commits.
+    await publish_event_chat(db, chat.event_id, chat.message_id)
     await db.commit()
     # Refresh only the user relationship — avoids reloading the whole object.
     await db.refresh(chat, ["user"])
+    chat_buffer.add(EventChatRead.model_validate(chat))
     return chat
 
 
@@ -85,7 +143,9 @@ async def remove_chat_service(
             detail="You can only delete your own messages",
         )
     await db.execute(delete(EventChat).where(EventChat.message_id == message_id))
+    await publish_event_chat(db, msg.event_id, message_id, op="delete")
     await db.commit()
+    chat_buffer.discard(message_id)
 
 
 async def get_chat_by_id_service(message_id: UUID, db: AsyncSession) -> EventChat | None:
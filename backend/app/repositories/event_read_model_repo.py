@@ -0,0 +1,144 @@
+"""
+Event listing read model
+========================
+
+Listing paths used to load ``Event``/``Game`` entities with four to six
+``selectinload`` options each — one extra SELECT per relationship level per
+query.  Here a listing selects flat columns instead (``EVENT_COLUMNS`` joins
+the event's game; ``GAME_COLUMNS`` is the game alone) and the rows are
+turned into lightweight views whose teams, league and venue come from the
+reference-data snapshot, so a page of events costs a single query.
+
+``EventView`` and ``GameView`` expose the same attribute paths the mappers
+read from entities (``event.game.home_team.logo_url``, ``game.venue.name``
+...), so ``_map_event_to_read``, ``convert_event_to_read`` and friends take
+either.
+"""
+
+from __future__ import annotations
+from typing import Any, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from models.event import Event
+from models.game import Game
+from repositories.reference_data_repo import LeagueRef, ReferenceSnapshot, TeamRef, VenueRef, get_reference_data
+
+# Aliased so ``Event.game.has(...)`` filters keep their own FROM in a query
+# that also joins the event's game for its columns.
+EventGame = aliased(Game, name="event_game")
+
+EVENT_COLUMNS = (
+    Event.event_id,
+    Event.game_id,
+    Event.event_type_id,
+    Event.title,
+    Event.description,
+    Event.picture_url,
+    Event.game_date,
+    Event.created_at,
+    Event.latitude,
+    Event.longitude,
+    Event.venue_id,
+    EventGame.date_time.label("game_date_time"),
+    EventGame.home_team_id,
+    EventGame.away_team_id,
+    EventGame.league_id,
+    EventGame.venue_id.label("game_venue_id"),
+)
+EVENT_GAME_JOIN = (EventGame, EventGame.game_id == Event.game_id)
+
+GAME_COLUMNS = (
+    Game.game_id,
+    Game.date_time,
+    Game.home_team_id,
+    Game.away_team_id,
+    Game.league_id,
+    Game.venue_id,
+)
+
+
+class GameView:
+    __slots__ = ("game_id", "date_time", "home_team_id", "away_team_id", "league_id", "venue_id",
+                 "home_team", "away_team", "league", "venue")
+
+    def __init__(
+        self,
+        game_id: int,
+        date_time,
+        home_team_id: Optional[int],
+        away_team_id: Optional[int],
+        league_id: Optional[str],
+        venue_id: Optional[int],
+        ref: ReferenceSnapshot,
+    ):
+        self.game_id = game_id
+        self.date_time = date_time
+        self.home_team_id = home_team_id
+        self.away_team_id = away_team_id
+        self.league_id = league_id
+        self.venue_id = venue_id
+        self.home_team: Optional[TeamRef] = ref.teams.get(home_team_id)
+        self.away_team: Optional[TeamRef] = ref.teams.get(away_team_id)
+        self.league: Optional[LeagueRef] = ref.leagues.get(league_id)
+        self.venue: Optional[VenueRef] = ref.venues.get(venue_id)
+
+
+class EventView:
+    __slots__ = ("event_id", "game_id", "event_type_id", "event_type", "title", "description", "picture_url",
+                 "game_date", "created_at", "latitude", "longitude", "venue_id", "venue", "game")
+
+    def __init__(self, row: Any, ref: ReferenceSnapshot):
+        self.event_id = row.event_id
+        self.game_id = row.game_id
+        self.event_type_id = row.event_type_id
+        # The mappers accept the type code in place of the EventType entity.
+        self.event_type = row.event_type_id
+        self.title = row.title
+        self.description = row.description
+        self.picture_url = row.picture_url
+        self.game_date = row.game_date
+        self.created_at = row.created_at
+        self.latitude = row.latitude
+        self.longitude = row.longitude
+        self.venue_id = row.venue_id
+        self.venue: Optional[VenueRef] = ref.venues.get(row.venue_id)
+        self.game: Optional[GameView] = (
+            GameView(
+                row.game_id, row.game_date_time, row.home_team_id, row.away_team_id,
+                row.league_id, row.game_venue_id, ref,
+            )
+            if row.game_id is not None and row.league_id is not None
+            else None
+        )
+
+
+async def _reference_for(db: AsyncSession, rows: Sequence[Any], venue_fields: tuple[str, ...]) -> ReferenceSnapshot:
+    team_ids: set[int] = set()
+    venue_ids: set[int] = set()
+    league_codes: set[str] = set()
+    for row in rows:
+        team_ids.update((row.home_team_id, row.away_team_id))
+        league_codes.add(row.league_id)
+        venue_ids.update(getattr(row, field) for field in venue_fields)
+    return await get_reference_data(db, team_ids=team_ids, venue_ids=venue_ids, league_codes=league_codes)
+
+
+async def event_views(db: AsyncSession, rows: Sequence[Any]) -> list[EventView]:
+    """Views for rows selected with ``EVENT_COLUMNS`` (joined via ``EVENT_GAME_JOIN``)."""
+    if not rows:
+        return []
+    ref = await _reference_for(db, rows, ("venue_id", "game_venue_id"))
+    return [EventView(row, ref) for row in rows]
+
+
+async def game_views(db: AsyncSession, rows: Sequence[Any]) -> list[GameView]:
+    """Views for rows selected with ``GAME_COLUMNS``."""
+    if not rows:
+        return []
+    ref = await _reference_for(db, rows, ("venue_id",))
+    return [
+        GameView(row.game_id, row.date_time, row.home_team_id, row.away_team_id, row.league_id, row.venue_id, ref)
+        for row in rows
+    ]
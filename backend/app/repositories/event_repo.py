@@ -2,21 +2,30 @@ from __future__ import annotations
 from typing import Optional, Sequence
 from uuid import UUID
 from datetime import datetime, timezone
-import math
-import time
-import uuid
 
 from fastapi import HTTPException, status
 from sqlalchemy import select, update, delete, and_, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import aliased, joinedload
 
+from core.cache import Cache
 from core.content_filter import clean_message
+from core.geo_grid import cell_ranges, cells_filter, haversine_miles_sql
+from db.parallel import gather_reads
+from db.text_search import contains_any, similar_any, similarity_score
 from models.event import Event
-from models.favorite import Favorite
 from models.game import Game
 from models.team import Team
 from models.venue import Venue
+from repositories.event_read_model_repo import (
+    EVENT_COLUMNS,
+    EVENT_GAME_JOIN,
+    GAME_COLUMNS,
+    event_views,
+    game_views,
+)
+from repositories.game_synthetic_id_repo import synthetic_game_event_id
+from repositories.saved_set_repo import get_saved_set, overlay_saved
 from schemas.common import Location
 from schemas.event import EventCreateRequest, EventRead, EventSearchFilters, TeamLogos
 from schemas.types import EventTypeEnum
@@ -159,7 +168,9 @@ async def search_events_with_filters_service(
         return []
 
     keyword = filters.keyword.strip()
-    keyword_like = f"%{keyword}%" if keyword else None
+    ranked = bool(keyword) and filters.rank_by_relevance
+    match_keyword = similar_any if ranked else contains_any
+    relevance: dict[UUID, float] = {}
     location_query = filters.location_query.strip()
     location_like = f"%{location_query}%" if location_query else None
 
@@ -179,33 +190,14 @@ async def search_events_with_filters_service(
         else None
     )
 
-    saved_event_ids: set[UUID] = set()
-    saved_game_ids: set[int] = set()
-
-    if current_user_id is not None:
-        saved_result = await db.execute(
-            select(Favorite.event_id, Favorite.game_id).where(Favorite.user_id == current_user_id)
-        )
-        for favorite_event_id, favorite_game_id in saved_result.all():
-            if favorite_event_id is not None:
-                saved_event_ids.add(favorite_event_id)
-            if favorite_game_id is not None:
-                saved_game_ids.add(favorite_game_id)
-
-        if saved_event_ids:
-            saved_events_game_result = await db.execute(
-                select(Event.game_id)
-                .where(Event.event_id.in_(saved_event_ids))
-                .where(Event.game_id.isnot(None))
-            )
-            saved_game_ids.update(
-                game_id for game_id in saved_events_game_result.scalars().all() if game_id is not None
-            )
+    saved = await get_saved_set(db, current_user_id)
+    saved_event_ids = saved.event_ids
+    saved_game_ids = saved.game_ids
 
     event_conditions = []
-    if keyword_like:
+    if keyword:
         # Search Events bar should only match event names.
-        event_conditions.append(Event.title.ilike(keyword_like))
+        event_conditions.append(match_keyword([Event.title], keyword))
 
     if league_codes:
         event_conditions.append(Event.game.has(Game.league_id.in_(league_codes)))
@@ -245,26 +237,28 @@ async def search_events_with_filters_service(
 
     if should_run_event_query:
         event_stmt = (
-            select(Event)
-            .options(
-                selectinload(Event.venue),
-                selectinload(Event.event_type),
-                selectinload(Event.game).selectinload(Game.home_team),
-                selectinload(Event.game).selectinload(Game.away_team),
-                selectinload(Event.game).selectinload(Game.league),
-            )
-            .order_by(Event.game_date.asc())
+            select(*EVENT_COLUMNS)
+            .outerjoin(*EVENT_GAME_JOIN)
             .limit(limit)
         )
+        if ranked:
+            event_score = similarity_score([Event.title], keyword)
+            event_stmt = event_stmt.add_columns(event_score.label("score")).order_by(event_score.desc())
+        event_stmt = event_stmt.order_by(Event.game_date.asc())
         if event_conditions:
             event_stmt = event_stmt.where(and_(*event_conditions))
 
         event_result = await db.execute(event_stmt)
-        events = event_result.unique().scalars().all()
+        event_rows = event_result.all()
+        events = await event_views(db, event_rows)
         mapped_events = [
             _map_event_to_read(event, is_saved=event.event_id in saved_event_ids)
             for event in events
         ]
+        if ranked:
+            relevance.update(
+                (mapped.event_id, row.score) for mapped, row in zip(mapped_events, event_rows)
+            )
         represented_game_ids = {
             event.game_id
             for event in events
@@ -275,27 +269,17 @@ async def search_events_with_filters_service(
     if include_games:
         game_conditions = []
 
-        if keyword_like:
+        if keyword:
             game_conditions.append(
                 or_(
                     Game.home_team.has(
-                        or_(
-                            Team.display_name.ilike(keyword_like),
-                            Team.team_name.ilike(keyword_like),
-                        )
+                        match_keyword([Team.display_name, Team.team_name], keyword)
                     ),
                     Game.away_team.has(
-                        or_(
-                            Team.display_name.ilike(keyword_like),
-                            Team.team_name.ilike(keyword_like),
-                        )
+                        match_keyword([Team.display_name, Team.team_name], keyword)
                     ),
                     Game.venue.has(
-                        or_(
-                            Venue.name.ilike(keyword_like),
-                            Venue.city.ilike(keyword_like),
-                            Venue.state_region.ilike(keyword_like),
-                        )
+                        match_keyword([Venue.name, Venue.city, Venue.state_region], keyword)
                     ),
                 )
             )
@@ -327,31 +311,51 @@ async def search_events_with_filters_service(
             else:
                 game_conditions.append(Game.game_id.in_(saved_game_ids))
 
-        game_stmt = (
-            select(Game)
-            .options(
-                selectinload(Game.home_team),
-                selectinload(Game.away_team),
-                selectinload(Game.league),
-                selectinload(Game.venue),
+        game_stmt = select(*GAME_COLUMNS).limit(limit)
+        if ranked:
+            home_team, away_team, venue = aliased(Team), aliased(Team), aliased(Venue)
+            game_score = similarity_score(
+                [
+                    home_team.display_name, home_team.team_name,
+                    away_team.display_name, away_team.team_name,
+                    venue.name, venue.city, venue.state_region,
+                ],
+                keyword,
             )
-            .order_by(Game.date_time.asc())
-            .limit(limit)
-        )
+            game_stmt = (
+                game_stmt
+                .outerjoin(home_team, home_team.team_id == Game.home_team_id)
+                .outerjoin(away_team, away_team.team_id == Game.away_team_id)
+                .outerjoin(venue, venue.venue_id == Game.venue_id)
+                .add_columns(game_score.label("score"))
+                .order_by(game_score.desc())
+            )
+        game_stmt = game_stmt.order_by(Game.date_time.asc())
 
         if game_conditions:
             game_stmt = game_stmt.where(and_(*game_conditions))
 
         game_result = await db.execute(game_stmt)
-        games = game_result.unique().scalars().all()
-        mapped_games = [
-            _map_game_to_read(game, is_saved=game.game_id in saved_game_ids)
-            for game in games
-            if game.game_id not in represented_game_ids
-        ]
+        game_rows = game_result.all()
+        games = await game_views(db, game_rows)
+        for row, game in zip(game_rows, games):
+            if game.game_id in represented_game_ids:
+                continue
+            mapped = _map_game_to_read(game, is_saved=game.game_id in saved_game_ids)
+            mapped_games.append(mapped)
+            if ranked:
+                relevance[mapped.event_id] = row.score
 
     merged = mapped_events + mapped_games
-    merged.sort(key=lambda event: _normalize_sort_datetime(event.date_time))
+    if ranked:
+        merged.sort(
+            key=lambda event: (
+                -relevance.get(event.event_id, 0.0),
+                _normalize_sort_datetime(event.date_time),
+            )
+        )
+    else:
+        merged.sort(key=lambda event: _normalize_sort_datetime(event.date_time))
     return merged[:limit]
 
 
@@ -363,47 +367,28 @@ async def get_game_events_service(
     limit: int = 50,
 ) -> list[EventRead]:
     stmt = (
-        select(Event)
+        select(*EVENT_COLUMNS)
+        .outerjoin(*EVENT_GAME_JOIN)
         .where(Event.game_id == game_id)
         .where(Event.event_type_id != "GAME")
-        .options(
-            selectinload(Event.venue),
-            selectinload(Event.event_type),
-            selectinload(Event.game).selectinload(Game.home_team),
-            selectinload(Event.game).selectinload(Game.away_team),
-            selectinload(Event.game).selectinload(Game.league),
-        )
         .order_by(Event.game_date.asc())
         .limit(limit)
     )
     result = await db.execute(stmt)
-    events = result.unique().scalars().all()
-
-    saved_event_ids: set[UUID] = set()
-    if current_user_id is not None and events:
-        event_ids = [event.event_id for event in events]
-        saved_result = await db.execute(
-            select(Favorite.event_id)
-            .where(Favorite.user_id == current_user_id)
-            .where(Favorite.event_id.in_(event_ids))
-        )
-        saved_event_ids = {
-            event_id for event_id in saved_result.scalars().all() if event_id is not None
-        }
+    events = await event_views(db, result.all())
 
-    return [
-        _map_event_to_read(event, is_saved=event.event_id in saved_event_ids)
-        for event in events
-    ]
+    saved = await get_saved_set(db, current_user_id)
+    return [_map_event_to_read(event, is_saved=saved.has_event(event.event_id)) for event in events]
 
 
 # ---------------------------------------------------------------------------
-# In-process TTL cache for featured events.
-# Not user-specific (is_saved is always False for anonymous users hitting this).
+# Featured events rank by the ``favorite_count`` counters on events and games
+# (kept current by repositories.favorite_repo), so a load is two top-K reads
+# off partial indexes.  The ranked list is shared and cached by limit; a
+# signed-in user's saved flags are overlaid from their cached saved set.
 # TTL = 120 seconds — featured events change rarely.
 # ---------------------------------------------------------------------------
-_FEATURED_CACHE: dict[int, tuple[float, list]] = {}
-_FEATURED_CACHE_TTL = 120  # seconds
+_FEATURED_CACHE = Cache("featured", list[EventRead], ttl_seconds=120, max_entries=32)
 
 
 async def get_featured_events_service(
@@ -411,124 +396,39 @@ async def get_featured_events_service(
     limit: int = 5,
     current_user_id: Optional[UUID] = None,
 ) -> list[EventRead]:
-    # Cache key ignores current_user_id so anonymous + authed users share the
-    # same cached results (is_saved is resolved below before returning).
-    cache_key = limit
-    now_ts = time.monotonic()
-    cached = _FEATURED_CACHE.get(cache_key)
-    if cached is not None and now_ts < cached[0] and current_user_id is None:
-        return cached[1]
-
-    # --- Step 1: fetch both COUNT queries in parallel (was sequential before) ---
-    event_counts_stmt = (
-        select(Favorite.event_id, func.count(Favorite.favorite_id).label("favorite_count"))
-        .where(Favorite.event_id.isnot(None))
-        .group_by(Favorite.event_id)
+    featured = await _FEATURED_CACHE.get_or_load(limit, lambda: _load_featured_events(db, limit))
+    if current_user_id is None:
+        return featured
+    return overlay_saved(featured, await get_saved_set(db, current_user_id))
+
+
+async def _load_featured_events(db: AsyncSession, limit: int) -> list[EventRead]:
+    events_result = await db.execute(
+        select(*EVENT_COLUMNS, Event.favorite_count)
+        .outerjoin(*EVENT_GAME_JOIN)
+        .where(Event.favorite_count > 0)
+        .order_by(Event.favorite_count.desc())
+        .limit(limit)
     )
-    game_counts_stmt = (
-        select(Favorite.game_id, func.count(Favorite.favorite_id).label("favorite_count"))
-        .where(Favorite.game_id.isnot(None))
-        .group_by(Favorite.game_id)
+    games_result = await db.execute(
+        select(*GAME_COLUMNS, Game.favorite_count)
+        .where(Game.favorite_count > 0)
+        .order_by(Game.favorite_count.desc())
+        .limit(limit)
     )
+    event_rows = events_result.all()
+    game_rows = games_result.all()
 
-    # --- Step 2: fetch counts + (optionally) saved items in parallel ---
-    saved_stmt = (
-        select(Favorite.event_id, Favorite.game_id)
-        .where(Favorite.user_id == current_user_id)
-    ) if current_user_id is not None else None
-
-    if saved_stmt is not None:
-        event_counts_result = await db.execute(event_counts_stmt)
-        game_counts_result = await db.execute(game_counts_stmt)
-        saved_result = await db.execute(saved_stmt)
-    else:
-        event_counts_result = await db.execute(event_counts_stmt)
-        game_counts_result = await db.execute(game_counts_stmt)
-        saved_result = None
-
-    ranked_items: list[tuple[str, any, int]] = [
-        ("event", event_id, int(favorite_count))
-        for event_id, favorite_count in event_counts_result.all()
-        if event_id is not None
+    # Teams, leagues and venues come from the reference-data snapshot.
+    ranked = [
+        (row.favorite_count, _map_event_to_read(view))
+        for row, view in zip(event_rows, await event_views(db, event_rows))
     ] + [
-        ("game", game_id, int(favorite_count))
-        for game_id, favorite_count in game_counts_result.all()
-        if game_id is not None
+        (row.favorite_count, _map_game_to_read(view))
+        for row, view in zip(game_rows, await game_views(db, game_rows))
     ]
-
-    ranked_items.sort(key=lambda item: item[2], reverse=True)
-    ranked_items = ranked_items[:limit]
-
-    event_ids = [item_id for item_type, item_id, _ in ranked_items if item_type == "event"]
-    game_ids  = [item_id for item_type, item_id, _ in ranked_items if item_type == "game"]
-
-    saved_event_ids: set[UUID] = set()
-    saved_game_ids:  set[int]  = set()
-
-    if saved_result is not None:
-        for fav_event_id, fav_game_id in saved_result.all():
-            if fav_event_id is not None:
-                saved_event_ids.add(fav_event_id)
-            if fav_game_id is not None:
-                saved_game_ids.add(fav_game_id)
-
-    # --- Step 3: fetch event + game details in parallel using joinedload -----
-    # joinedload resolves scalar relationships in a single JOIN query instead
-    # of selectinload's separate SELECT per relationship.
-    events_query = (
-        select(Event)
-        .where(Event.event_id.in_(event_ids))
-        .options(
-            joinedload(Event.venue),
-            joinedload(Event.event_type),
-            joinedload(Event.game).joinedload(Game.home_team),
-            joinedload(Event.game).joinedload(Game.away_team),
-            joinedload(Event.game).joinedload(Game.league),
-        )
-    ) if event_ids else None
-
-    games_query = (
-        select(Game)
-        .where(Game.game_id.in_(game_ids))
-        .options(
-            joinedload(Game.home_team),
-            joinedload(Game.away_team),
-            joinedload(Game.league),
-            joinedload(Game.venue),
-        )
-    ) if game_ids else None
-
-    events_by_id: dict = {}
-    games_by_id:  dict = {}
-
-    if events_query is not None and games_query is not None:
-        events_result = await db.execute(events_query)
-        games_result = await db.execute(games_query)
-        events_by_id = {e.event_id: e for e in events_result.unique().scalars().all()}
-        games_by_id  = {g.game_id: g for g in games_result.unique().scalars().all()}
-    elif events_query is not None:
-        events_result = await db.execute(events_query)
-        events_by_id = {e.event_id: e for e in events_result.unique().scalars().all()}
-    elif games_query is not None:
-        games_result = await db.execute(games_query)
-        games_by_id  = {g.game_id: g for g in games_result.unique().scalars().all()}
-
-    featured_items: list[EventRead] = []
-    for item_type, item_id, _ in ranked_items:
-        if item_type == "event":
-            event = events_by_id.get(item_id)
-            if event is not None:
-                featured_items.append(_map_event_to_read(event, is_saved=item_id in saved_event_ids))
-        else:
-            game = games_by_id.get(item_id)
-            if game is not None:
-                featured_items.append(_map_game_to_read(game, is_saved=item_id in saved_game_ids))
-
-    # Cache only anonymous results (saved state is user-specific).
-    if current_user_id is None:
-        _FEATURED_CACHE[cache_key] = (now_ts + _FEATURED_CACHE_TTL, featured_items)
-
-    return featured_items
+    ranked.sort(key=lambda item: item[0], reverse=True)
+    return [item for _, item in ranked[:limit]]
 
 
 def _map_game_to_read(game: Game, is_saved: bool = False) -> EventRead:
@@ -546,7 +446,7 @@ def _map_game_to_read(game: Game, is_saved: bool = False) -> EventRead:
     venue_lng = game.venue.longitude if game.venue and game.venue.longitude is not None else 0.0
 
     return EventRead(
-        event_id=uuid.uuid5(uuid.NAMESPACE_DNS, f"game:{game.game_id}"),
+        event_id=synthetic_game_event_id(game.game_id),
         game_id=game.game_id,
         event_type=EventTypeEnum.GAME,
         event_name=f"{away_team_name} @ {home_team_name}",
@@ -565,12 +465,10 @@ def _map_game_to_read(game: Game, is_saved: bool = False) -> EventRead:
 
 
 # ---------------------------------------------------------------------------
-# In-process TTL cache for nearby-events results.
-# Keyed by (lat_2dp, lng_2dp, radius, limit); TTL = 60 seconds.
-# Entries: { cache_key: (expires_at, result) }
+# Nearby-events results, keyed by (lat_2dp, lng_2dp, radius, limit).
+# TTL = 60 seconds.
 # ---------------------------------------------------------------------------
-_NEARBY_CACHE: dict[tuple, tuple[float, list]] = {}
-_NEARBY_CACHE_TTL = 60  # seconds
+_NEARBY_CACHE = Cache("nearby", list[EventRead], ttl_seconds=60, max_entries=500)
 
 
 async def get_nearby_events_service(
@@ -579,114 +477,91 @@ async def get_nearby_events_service(
     db: AsyncSession = None,
     limit: int = 20,
 ) -> list[EventRead]:
-    # Check in-process cache first (rounded to ~1 km precision).
+    # Rounded to ~1 km precision so neighbouring requests share an entry.
     cache_key = (round(location.lat, 2), round(location.lng, 2), radius_miles, limit)
-    now_ts = time.monotonic()
-    cached = _NEARBY_CACHE.get(cache_key)
-    if cached is not None and now_ts < cached[0]:
-        return cached[1]
-
-    # Longitude degrees shrink with latitude; use correct per-axis degree spans.
-    lat_degrees = radius_miles / 69.0
-    cos_lat = math.cos(math.radians(location.lat))
-    cos_lat = max(cos_lat, 1e-6)  # avoid division by zero near the poles
-    lng_degrees = radius_miles / (69.0 * cos_lat)
+    return await _NEARBY_CACHE.get_or_load(
+        cache_key, lambda: _load_nearby_events(location, radius_miles, db, limit)
+    )
+
+
+async def _load_nearby_events(
+    location: Location,
+    radius_miles: float,
+    db: AsyncSession,
+    limit: int,
+) -> list[EventRead]:
+    # Grid cells covering the search circle; each range is one index scan.
+    ranges = cell_ranges(location.lat, location.lng, radius_miles)
     cutoff = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-    fetch_limit = limit * 3  # over-fetch so haversine filtering still yields `limit` results
     event_lat = func.coalesce(Event.latitude, Venue.latitude)
     event_lng = func.coalesce(Event.longitude, Venue.longitude)
+    event_distance = haversine_miles_sql(event_lat, event_lng, location.lat, location.lng)
 
+    # Events with their own coordinates are matched on events.geo_cell; the
+    # rest inherit their venue's position and are matched on venues.geo_cell.
+    nearby_venue_ids = select(Venue.venue_id).where(cells_filter(Venue.geo_cell, ranges))
     events_stmt = (
-        select(Event)
+        select(*EVENT_COLUMNS, event_distance.label("distance"))
         .outerjoin(Venue, Event.venue_id == Venue.venue_id)
+        .outerjoin(*EVENT_GAME_JOIN)
         .where(
             and_(
-                event_lat.isnot(None),
-                event_lng.isnot(None),
                 Event.game_date.isnot(None),
                 Event.game_date >= cutoff,
-                event_lat.between(location.lat - lat_degrees, location.lat + lat_degrees),
-                event_lng.between(location.lng - lng_degrees, location.lng + lng_degrees),
+                or_(
+                    cells_filter(Event.geo_cell, ranges),
+                    and_(Event.geo_cell.is_(None), Event.venue_id.in_(nearby_venue_ids)),
+                ),
+                event_distance <= radius_miles,
             )
         )
-        .options(
-            selectinload(Event.game).selectinload(Game.home_team),
-            selectinload(Event.game).selectinload(Game.away_team),
-            selectinload(Event.game).selectinload(Game.league),
-            selectinload(Event.venue),
-            selectinload(Event.event_type),
-        )
-        .order_by(Event.game_date.asc())
-        .limit(fetch_limit)
+        .order_by(Event.game_date.asc(), event_distance.asc())
+        .limit(limit)
     )
 
+    game_distance = haversine_miles_sql(Venue.latitude, Venue.longitude, location.lat, location.lng)
     games_stmt = (
-        select(Game)
+        select(*GAME_COLUMNS, game_distance.label("distance"))
         .join(Venue, Game.venue_id == Venue.venue_id)
         .where(
             and_(
                 Game.date_time.isnot(None),
                 Game.date_time >= cutoff,
-                Venue.latitude.isnot(None),
-                Venue.longitude.isnot(None),
-                Venue.latitude.between(location.lat - lat_degrees, location.lat + lat_degrees),
-                Venue.longitude.between(location.lng - lng_degrees, location.lng + lng_degrees),
+                cells_filter(Venue.geo_cell, ranges),
+                game_distance <= radius_miles,
             )
         )
-        .options(
-            selectinload(Game.home_team),
-            selectinload(Game.away_team),
-            selectinload(Game.league),
-            selectinload(Game.venue),
-        )
-        .order_by(Game.date_time.asc())
-        .limit(fetch_limit)
+        .order_by(Game.date_time.asc(), game_distance.asc())
+        .limit(limit)
     )
 
-    # Run both queries sequentially — AsyncSession is not safe for concurrent execution.
-    events_result = await db.execute(events_stmt)
-    games_result = await db.execute(games_stmt)
-    events = events_result.scalars().all()
-    games = games_result.scalars().all()
-
-    # Compute haversine once per item — not twice.
-    filtered_items: list[tuple] = []
-    for event in events:
-        event_lat_value = event.latitude if event.latitude is not None else (event.venue.latitude if event.venue else None)
-        event_lng_value = event.longitude if event.longitude is not None else (event.venue.longitude if event.venue else None)
-        if event_lat_value is None or event_lng_value is None:
-            continue
-
-        dist = _haversine_distance(location.lat, location.lng, event_lat_value, event_lng_value)
-        if dist <= radius_miles:
-            filtered_items.append((event.game_date, dist, "event", event))
-
-    for game in games:
-        if not (game.venue and game.venue.latitude is not None and game.venue.longitude is not None):
-            continue
-        dist = _haversine_distance(location.lat, location.lng, game.venue.latitude, game.venue.longitude)
-        if dist <= radius_miles:
-            filtered_items.append((game.date_time, dist, "game", game))
-
-    filtered_items.sort(key=lambda item: (_normalize_sort_datetime(item[0]), item[1]))
-    filtered_items = filtered_items[:limit]
-
-    result = [
+    async def load_events(session: AsyncSession):
+        rows = (await session.execute(events_stmt)).all()
+        return rows, await event_views(session, rows)
+
+    async def load_games(session: AsyncSession):
+        rows = (await session.execute(games_stmt)).all()
+        return rows, await game_views(session, rows)
+
+    # One session cannot run two statements at once; each query gets its own.
+    (event_rows, events), (game_rows, games) = await gather_reads(load_events, load_games)
+
+    # Both lists are already radius-filtered and sorted; merge on (date, distance).
+    items: list[tuple] = [
+        (event.game_date, row.distance, "event", event) for event, row in zip(events, event_rows)
+    ]
+    items.extend(
+        (game.date_time, row.distance, "game", game) for game, row in zip(games, game_rows)
+    )
+    items.sort(key=lambda item: (_normalize_sort_datetime(item[0]), item[1]))
+
+    return [
         _map_event_to_read(item)
         if item_type == "event"
         else _map_game_to_read(item)
-        for _, _, item_type, item in filtered_items
+        for _, _, item_type, item in items[:limit]
     ]
 
-    # Store in cache; also evict stale entries to prevent unbounded growth.
-    _NEARBY_CACHE[cache_key] = (now_ts + _NEARBY_CACHE_TTL, result)
-    if len(_NEARBY_CACHE) > 500:
-        stale_keys = [k for k, (exp, _) in _NEARBY_CACHE.items() if now_ts >= exp]
-        for k in stale_keys:
-            _NEARBY_CACHE.pop(k, None)
-
-    return result
-
 
 def _map_event_to_read(event: Event, is_saved: bool = False) -> EventRead:
     if isinstance(event.event_type, str):
@@ -728,13 +603,3 @@ def _map_event_to_read(event: Event, is_saved: bool = False) -> EventRead:
         is_user_created=event.is_user_created if hasattr(event, "is_user_created") else True,
         is_saved=is_saved,
     )
-
-
-def _haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    lon1, lat1, lon2, lat2 = map(math.radians, [lon1, lat1, lon2, lat2])
-    dlon = lon2 - lon1
-    dlat = lat2 - lat1
-    a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-    c = 2 * math.asin(math.sqrt(a))
-    r = 3959
-    return c * r
@@ -1,14 +1,20 @@
 from __future__ import annotations
 from typing import Optional, Sequence, List
 from uuid import UUID
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 
+from db.pagination import Keyset, Page
 from models.event import Event
 from models.favorite import Favorite
+from models.game import Game
 from models.user import User
+from repositories.saved_set_repo import invalidate_saved_set, notify_saved_set_changed
+
+
+FAVORITES_BY_DATE_DESC = Keyset(Favorite.date_time, Favorite.favorite_id, descending=True)
 
 
 class FavoriteRepository:
@@ -32,11 +38,61 @@ class FavoriteRepository:
     async def add(self, fav: Favorite) -> Favorite:
         self.db.add(fav)
         await self.db.flush()
+        await adjust_favorite_count(self.db, event_id=fav.event_id, game_id=fav.game_id, delta=1)
         return fav
 
     async def remove(self, favorite_id: UUID) -> int:
-        res = await self.db.execute(delete(Favorite).where(Favorite.favorite_id == favorite_id))
-        return res.rowcount or 0
+        res = await self.db.execute(
+            delete(Favorite)
+            .where(Favorite.favorite_id == favorite_id)
+            .returning(Favorite.event_id, Favorite.game_id)
+        )
+        removed = res.all()
+        for event_id, game_id in removed:
+            await adjust_favorite_count(self.db, event_id=event_id, game_id=game_id, delta=-1)
+        return len(removed)
+
+
+async def adjust_favorite_count(
+    db: AsyncSession,
+    *,
+    event_id: Optional[UUID] = None,
+    game_id: Optional[int] = None,
+    delta: int,
+) -> None:
+    """Move the saved event's or game's ``favorite_count`` by *delta*, in the caller's transaction.
+
+    Every path that adds or removes a favorite calls this; the nightly
+    maintenance recount corrects any drift.
+    """
+    if event_id is not None:
+        await db.execute(
+            update(Event)
+            .where(Event.event_id == event_id)
+            # Keep updated_at for edits to the event itself.
+            .values(favorite_count=func.greatest(Event.favorite_count + delta, 0), updated_at=Event.updated_at)
+        )
+    if game_id is not None:
+        await db.execute(
+            update(Game)
+            .where(Game.game_id == game_id)
+            .values(favorite_count=func.greatest(Game.favorite_count + delta, 0))
+        )
+
+
+async def release_user_favorite_counts(db: AsyncSession, user_id: UUID) -> None:
+    """Take *user_id*'s favorites off the counters before the user (and by cascade the favorites) is deleted."""
+    saved = select(Favorite.event_id, Favorite.game_id).where(Favorite.user_id == user_id).subquery()
+    await db.execute(
+        update(Event)
+        .where(Event.event_id.in_(select(saved.c.event_id).where(saved.c.event_id.isnot(None))))
+        .values(favorite_count=func.greatest(Event.favorite_count - 1, 0), updated_at=Event.updated_at)
+    )
+    await db.execute(
+        update(Game)
+        .where(Game.game_id.in_(select(saved.c.game_id).where(saved.c.game_id.isnot(None))))
+        .values(favorite_count=func.greatest(Game.favorite_count - 1, 0))
+    )
 
 
 async def get_saved_events_service(
@@ -44,7 +100,8 @@ async def get_saved_events_service(
     limit: int,
     offset: int,
     db: AsyncSession,
-) -> List[Event]:
+    cursor: Optional[str] = None,
+) -> Page:
     user_result = await db.execute(select(User).where(User.user_id == user_id))
     user = user_result.scalar_one_or_none()
     if not user:
@@ -54,7 +111,7 @@ async def get_saved_events_service(
         )
 
     stmt = (
-        select(Event)
+        select(Event, Favorite.date_time, Favorite.favorite_id)
         .join(Favorite, Favorite.event_id == Event.event_id)
         .where(Favorite.user_id == user_id)
         .where(Favorite.event_id.isnot(None))
@@ -62,14 +119,12 @@ async def get_saved_events_service(
             selectinload(Event.game),
             selectinload(Event.venue),
         )
-        .order_by(Favorite.date_time.desc())
-        .limit(limit)
-        .offset(offset)
     )
+    stmt = FAVORITES_BY_DATE_DESC.paginate(stmt, limit=limit, cursor=cursor, offset=offset)
 
     result = await db.execute(stmt)
-    events = result.scalars().all()
-    return events
+    rows = FAVORITES_BY_DATE_DESC.page(result.all(), limit, key=lambda row: (row.date_time, row.favorite_id))
+    return Page([row.Event for row in rows], rows.next_cursor)
 
 
 async def delete_saved_event_service(
@@ -91,7 +146,9 @@ async def delete_saved_event_service(
 
     repo = FavoriteRepository(db)
     await repo.remove(favorite.favorite_id)
+    await notify_saved_set_changed(db, user_id)
     await db.commit()
+    invalidate_saved_set(user_id)
 
     updated_stmt = (
         select(Event)
@@ -150,6 +207,8 @@ async def add_saved_event_service(
     repo = FavoriteRepository(db)
     favorite = Favorite(user_id=user_id, event_id=event_id, game_id=None)
     await repo.add(favorite)
+    await notify_saved_set_changed(db, user_id)
     await db.commit()
+    invalidate_saved_set(user_id)
 
     return event
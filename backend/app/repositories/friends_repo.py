@@ -6,6 +6,7 @@ from sqlalchemy import and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from db.text_search import as_text, contains_any, similar_any, similarity_score
 from models.friend_request import FriendRequest
 from models.friendship import Friendship
 from models.user import User
@@ -20,17 +21,24 @@ async def search_users_by_username(
     current_user_id: UUID,
     db: AsyncSession,
     limit: int = 10,
+    rank_by_similarity: bool = False,
 ) -> Sequence[User]:
-    """Search for users by username prefix/substring, excluding the current user."""
-    result = await db.execute(
-        select(User)
-        .where(
-            User.username.ilike(f"%{query}%"),
-            User.user_id != current_user_id,
+    """Search for users by username prefix/substring, excluding the current user.
+
+    With `rank_by_similarity` near-miss usernames match too and the closest
+    ones come first.
+    """
+    # Cast so the trigram index on username::text is usable.
+    username = as_text(User.username)
+    stmt = select(User).where(User.user_id != current_user_id)
+    if rank_by_similarity:
+        stmt = stmt.where(similar_any([username], query)).order_by(
+            similarity_score([username], query).desc()
         )
-        .order_by(User.username)
-        .limit(limit)
-    )
+    else:
+        stmt = stmt.where(contains_any([username], query))
+
+    result = await db.execute(stmt.order_by(User.username).limit(limit))
     return result.scalars().all()
 
 
@@ -16,12 +16,13 @@ from fastapi import HTTPException
 
 from models.event import Event
 from models.game import Game
+from core.principal_cache import Principal
 from models.user import User
 
 
 async def get_or_create_game_channel_event(
     game_id: int,
-    current_user: User,
+    current_user: User | Principal,
     db: AsyncSession,
 ) -> Event:
     """
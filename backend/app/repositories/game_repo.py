@@ -1,13 +1,20 @@
 from __future__ import annotations
-from typing import Optional, Sequence, List
+from typing import Iterable, Optional, Sequence, List
 from datetime import datetime, timedelta, timezone
-from sqlalchemy import select, update, delete, or_, and_
+from sqlalchemy import select, update, delete, or_, and_, func, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from fastapi import HTTPException
 
+from db.pagination import Keyset, Page
 from models.game import Game
 from models.team import Team
+from repositories.game_synthetic_id_repo import GameSyntheticIdRepository
+
+
+GAMES_BY_DATE = Keyset(Game.date_time, Game.game_id)
+GAMES_BY_DATE_DESC = Keyset(Game.date_time, Game.game_id, descending=True)
 
 
 class GameRepository:
@@ -96,14 +103,79 @@ class GameRepository:
             venue_id=venue_id,
             date_time=date_time,
         )
-        return await self.add(game)
+        created = await self.add(game)
+        await GameSyntheticIdRepository(self.db).register([game_id])
+        return created
+
+    async def bulk_upsert(self, rows: Iterable[dict], chunk_size: int = 500) -> dict[str, int]:
+        """Insert or update scraped games in chunks; same rules as ``upsert``.
+
+        Each row carries game_id, league_id, home_team_id, away_team_id,
+        date_time and venue_id.  Existing games only take a new date_time or
+        a non-null venue_id, and rows where neither changed are left alone.
+        Returns ``{"inserted", "updated", "unchanged"}`` counts.
+        """
+        # A game listed twice in one statement would make ON CONFLICT touch
+        # the same row twice, which Postgres rejects; the last copy wins.
+        unique_rows = list({row["game_id"]: row for row in rows}.values())
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+
+        for start in range(0, len(unique_rows), chunk_size):
+            chunk = unique_rows[start:start + chunk_size]
+            stmt = pg_insert(Game).values(chunk)
+            excluded = stmt.excluded
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Game.game_id],
+                set_={
+                    "date_time": excluded.date_time,
+                    "venue_id": func.coalesce(excluded.venue_id, Game.venue_id),
+                },
+                where=or_(
+                    Game.date_time.is_distinct_from(excluded.date_time),
+                    and_(
+                        excluded.venue_id.isnot(None),
+                        Game.venue_id.is_distinct_from(excluded.venue_id),
+                    ),
+                ),
+            ).returning(Game.game_id, literal_column("xmax = 0").label("inserted"))
+
+            # Skipped (unchanged) rows are not returned; xmax = 0 marks a fresh insert.
+            written = (await self.db.execute(stmt)).all()
+            inserted_ids = [game_id for game_id, inserted in written if inserted]
+            counts["inserted"] += len(inserted_ids)
+            counts["updated"] += len(written) - len(inserted_ids)
+            counts["unchanged"] += len(chunk) - len(written)
+            await GameSyntheticIdRepository(self.db).register(inserted_ids)
+
+        return counts
+
+    async def ids_scheduled_between(
+        self, league_id: str, ranges: Iterable[tuple[datetime, datetime]]
+    ) -> set[int]:
+        """Ids of *league_id*'s games dated in any ``[start, end)`` of *ranges*."""
+        ranges = list(ranges)
+        if not ranges:
+            return set()
+        res = await self.db.execute(
+            select(Game.game_id).where(
+                Game.league_id == league_id,
+                or_(*(and_(Game.date_time >= start, Game.date_time < end) for start, end in ranges)),
+            )
+        )
+        return set(res.scalars().all())
 
     async def remove(self, game_id: int) -> int:
         res = await self.db.execute(delete(Game).where(Game.game_id == game_id))
         return res.rowcount or 0
 
 
-async def get_games_by_team_service(team_id: int, limit: int, offset: int, db: AsyncSession) -> List[Game]:
+async def get_games_by_team_service(
+    team_id: int,
+    limit: int,
+    offset: int,
+    db: AsyncSession,
+    cursor: Optional[str] = None,
+) -> Page:
     stmt = (
         select(Game)
         .where(or_(Game.home_team_id == team_id, Game.away_team_id == team_id))
@@ -113,15 +185,13 @@ async def get_games_by_team_service(team_id: int, limit: int, offset: int, db: A
             selectinload(Game.away_team).selectinload(Team.league),
             selectinload(Game.venue),
         )
-        .order_by(Game.date_time.desc())
-        .limit(limit)
-        .offset(offset)
     )
+    stmt = GAMES_BY_DATE_DESC.paginate(stmt, limit=limit, cursor=cursor, offset=offset)
 
     result = await db.execute(stmt)
-    games = result.scalars().all()
+    games = GAMES_BY_DATE_DESC.page(result.scalars().all(), limit)
 
-    if not games and offset == 0:
+    if not games and offset == 0 and cursor is None:
         team_check = await db.execute(select(Team).where(Team.team_id == team_id))
         if not team_check.scalar_one_or_none():
             raise HTTPException(status_code=404, detail=f"Team with id {team_id} not found")
@@ -156,7 +226,8 @@ async def list_games_service(
     offset: int,
     db: AsyncSession,
     date: Optional[datetime] = None,
-):
+    cursor: Optional[str] = None,
+) -> Page:
     stmt = (
         select(Game)
         .options(
@@ -165,9 +236,6 @@ async def list_games_service(
             selectinload(Game.away_team).selectinload(Team.league),
             selectinload(Game.venue),
         )
-        .order_by(Game.date_time.asc())
-        .limit(limit)
-        .offset(offset)
     )
 
     if league_id:
@@ -178,6 +246,6 @@ async def list_games_service(
         day_end = day_start + timedelta(days=1)
         stmt = stmt.where(and_(Game.date_time >= day_start, Game.date_time < day_end))
 
+    stmt = GAMES_BY_DATE.paginate(stmt, limit=limit, cursor=cursor, offset=offset)
     result = await db.execute(stmt)
-    games = result.scalars().all()
-    return games
+    return GAMES_BY_DATE.page(result.scalars().all(), limit)
@@ -0,0 +1,93 @@
+"""
+Synthetic game UUIDs
+====================
+
+Games that have no row in ``events`` are surfaced to clients as events whose
+``event_id`` is ``uuid5(NAMESPACE_DNS, f"game:{game_id}")``.  Resolving such a
+UUID back to a ``game_id`` used to mean hashing every game in Python; the
+``game_synthetic_ids`` table stores the mapping so it is a single PK probe.
+
+The nightly scraper registers ids as games are inserted and sweeps up any
+gaps at the end of each run.  An in-process reverse cache is filled both by
+lookups and by ``synthetic_game_event_id`` itself, so a UUID the worker has
+handed out recently resolves without touching the database at all.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections import OrderedDict
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.game import Game
+from models.game_synthetic_id import GameSyntheticId
+
+
+# uuid5 is deterministic, so entries never go stale — the bound only caps memory.
+_REVERSE_CACHE: "OrderedDict[UUID, int]" = OrderedDict()
+_REVERSE_CACHE_MAX = 20_000
+
+
+def _remember(synthetic_id: UUID, game_id: int) -> None:
+    _REVERSE_CACHE[synthetic_id] = game_id
+    _REVERSE_CACHE.move_to_end(synthetic_id)
+    if len(_REVERSE_CACHE) > _REVERSE_CACHE_MAX:
+        _REVERSE_CACHE.popitem(last=False)
+
+
+def synthetic_game_event_id(game_id: int) -> UUID:
+    """Return the synthetic event UUID for *game_id* and remember the reverse."""
+    synthetic_id = uuid.uuid5(uuid.NAMESPACE_DNS, f"game:{game_id}")
+    _remember(synthetic_id, game_id)
+    return synthetic_id
+
+
+class GameSyntheticIdRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_game_id(self, synthetic_id: UUID) -> Optional[int]:
+        cached = _REVERSE_CACHE.get(synthetic_id)
+        if cached is not None:
+            return cached
+
+        res = await self.db.execute(
+            select(GameSyntheticId.game_id).where(GameSyntheticId.synthetic_id == synthetic_id)
+        )
+        game_id = res.scalar_one_or_none()
+        if game_id is not None:
+            _remember(synthetic_id, game_id)
+        return game_id
+
+    async def register(self, game_ids: Iterable[int]) -> None:
+        rows = [
+            {"synthetic_id": synthetic_game_event_id(game_id), "game_id": game_id}
+            for game_id in set(game_ids)
+        ]
+        if not rows:
+            return
+        await self.db.execute(
+            pg_insert(GameSyntheticId)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["synthetic_id"])
+        )
+
+    async def backfill_missing(self) -> int:
+        """Register any games that were inserted without a mapping row."""
+        res = await self.db.execute(
+            select(Game.game_id)
+            .outerjoin(GameSyntheticId, GameSyntheticId.game_id == Game.game_id)
+            .where(GameSyntheticId.game_id.is_(None))
+        )
+        missing = res.scalars().all()
+        await self.register(missing)
+        return len(missing)
+
+
+async def resolve_game_id_from_synthetic_id(db: AsyncSession, event_id: UUID) -> Optional[int]:
+    return await GameSyntheticIdRepository(db).get_game_id(event_id)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.geocode_cache import GeocodeCache
+
+Coordinates = tuple[float, float]
+
+
+class GeocodeCacheRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_fresh(self, query_keys: Iterable[str]) -> dict[str, Optional[Coordinates]]:
+        """Unexpired answers for *query_keys*; ``None`` marks a cached miss."""
+        query_keys = set(query_keys)
+        if not query_keys:
+            return {}
+        res = await self.db.execute(
+            select(GeocodeCache.query_key, GeocodeCache.latitude, GeocodeCache.longitude).where(
+                GeocodeCache.query_key.in_(query_keys),
+                GeocodeCache.expires_at > func.now(),
+            )
+        )
+        return {
+            key: (lat, lon) if lat is not None and lon is not None else None
+            for key, lat, lon in res.all()
+        }
+
+    async def put(self, query_key: str, coordinates: Optional[Coordinates], ttl_seconds: float) -> None:
+        lat, lon = coordinates if coordinates is not None else (None, None)
+        now = datetime.now(timezone.utc)
+        stmt = pg_insert(GeocodeCache).values(
+            query_key=query_key,
+            latitude=lat,
+            longitude=lon,
+            fetched_at=now,
+            expires_at=now + timedelta(seconds=ttl_seconds),
+        )
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[GeocodeCache.query_key],
+                set_={
+                    "latitude": stmt.excluded.latitude,
+                    "longitude": stmt.excluded.longitude,
+                    "fetched_at": stmt.excluded.fetched_at,
+                    "expires_at": stmt.excluded.expires_at,
+                },
+            )
+        )
+
+    async def purge_expired(self) -> int:
+        res = await self.db.execute(delete(GeocodeCache).where(GeocodeCache.expires_at <= func.now()))
+        return res.rowcount or 0
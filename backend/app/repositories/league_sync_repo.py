@@ -0,0 +1,49 @@
+from __future__ import annotations
+from datetime import date, datetime, timezone
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.league_sync_window import LeagueSyncWindow
+
+
+class LeagueSyncRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_windows(self, league_code: str) -> dict[date, LeagueSyncWindow]:
+        res = await self.db.execute(
+            select(LeagueSyncWindow).where(LeagueSyncWindow.league_code == league_code)
+        )
+        return {window.window_start: window for window in res.scalars().all()}
+
+    async def record(self, league_code: str, windows: list[dict]) -> None:
+        """Upsert ``{"window_start", "window_end", "fingerprint", "game_count"}`` rows as synced now."""
+        if not windows:
+            return
+        now = datetime.now(timezone.utc)
+        stmt = pg_insert(LeagueSyncWindow).values(
+            [{**window, "league_code": league_code, "synced_at": now} for window in windows]
+        )
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[LeagueSyncWindow.league_code, LeagueSyncWindow.window_start],
+                set_={
+                    "window_end": stmt.excluded.window_end,
+                    "fingerprint": stmt.excluded.fingerprint,
+                    "game_count": stmt.excluded.game_count,
+                    "synced_at": stmt.excluded.synced_at,
+                },
+            )
+        )
+
+    async def prune(self, league_code: str, before: date) -> int:
+        """Drop windows that ended before *before*."""
+        res = await self.db.execute(
+            delete(LeagueSyncWindow).where(
+                LeagueSyncWindow.league_code == league_code,
+                LeagueSyncWindow.window_end < before,
+            )
+        )
+        return res.rowcount or 0
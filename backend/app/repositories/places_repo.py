@@ -6,6 +6,7 @@ from typing import Dict, List, Optional
 import httpx
 from fastapi import HTTPException
 
+from core.cache import Cache
 from core.config import settings
 from schemas.common import Location
 from schemas.place import PlaceCategory, PlaceRead
@@ -17,6 +18,10 @@ CATEGORY_QUERY_BY_TYPE: Dict[PlaceCategory, str] = {
     "hotel": "hotel",
 }
 
+# Foursquare results for a spot barely move; keyed by (lat_3dp, lng_3dp,
+# radius, limit, categories) so nearby requests share an upstream call.
+_PLACES_CACHE = Cache("places", List[PlaceRead], ttl_seconds=300, max_entries=500)
+
 
 def _parse_categories(raw_categories: str) -> List[PlaceCategory]:
     allowed_categories: set[PlaceCategory] = {"restaurant", "bar", "hotel"}
@@ -105,6 +110,23 @@ async def get_nearby_places_service(
         )
 
     selected_categories = _parse_categories(categories)
+    cache_key = (round(lat, 3), round(lng, 3), radius, limit, ",".join(sorted(selected_categories)))
+    return await _PLACES_CACHE.get_or_load(
+        cache_key,
+        lambda: _fetch_nearby_places(
+            lat=lat, lng=lng, radius=radius, limit=limit, selected_categories=selected_categories
+        ),
+    )
+
+
+async def _fetch_nearby_places(
+    *,
+    lat: float,
+    lng: float,
+    radius: int,
+    limit: int,
+    selected_categories: List[PlaceCategory],
+) -> List[PlaceRead]:
     per_category_limit = max(3, min(20, (limit + len(selected_categories) - 1) // len(selected_categories)))
 
     raw_key = settings.foursquare_api_key.strip()
@@ -1,6 +1,5 @@
 from typing import List
 from uuid import UUID
-import uuid
 
 import sqlalchemy as sa
 from fastapi import HTTPException, status
@@ -8,6 +7,8 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from core.principal_cache import principal_cache
+from db.parallel import gather_reads
 from models.event import Event
 from models.favorite import Favorite
 from models.game import Game
@@ -15,6 +16,11 @@ from models.team import Team
 from models.team_chat import TeamChat
 from models.user import User
 from models.user_favorite_team import UserFavoriteTeams
+from repositories.event_read_model_repo import EVENT_COLUMNS, EVENT_GAME_JOIN, GAME_COLUMNS, event_views, game_views
+from repositories.favorite_repo import adjust_favorite_count, release_user_favorite_counts
+from repositories.game_synthetic_id_repo import resolve_game_id_from_synthetic_id, synthetic_game_event_id
+from repositories.reference_data_repo import get_reference_data
+from repositories.saved_set_repo import invalidate_saved_set, notify_saved_set_changed
 from repositories.user_favorite_team_repo import UserFavoriteTeamsRepository
 from schemas.converters import convert_event_to_read, convert_team_chat_to_read, convert_team_to_read
 from schemas.common import Location
@@ -24,45 +30,49 @@ from schemas.user import AccountSettings, HeaderInfo, NavBarInfo, UserProfile
 
 
 async def get_user_profile_service(current_user: User, db: AsyncSession) -> UserProfile:
-    favorite_teams_stmt = (
-        select(Team)
-        .join(UserFavoriteTeams, UserFavoriteTeams.team_id == Team.team_id)
-        .where(UserFavoriteTeams.user_id == current_user.user_id)
-        .options(selectinload(Team.league))
-    )
-    favorite_teams_result = await db.execute(favorite_teams_stmt)
-    favorite_teams = favorite_teams_result.scalars().all()
-
-    saved_items = await _get_saved_items_for_user(current_user.user_id, db)
+    user_id = current_user.user_id
 
-    my_events_stmt = (
-        select(Event)
-        .where(Event.creator_user_id == current_user.user_id)
-        .where(Event.event_type_id != "GAME")
-        .options(
-            selectinload(Event.game).selectinload(Game.home_team).selectinload(Team.league),
-            selectinload(Event.game).selectinload(Game.away_team).selectinload(Team.league),
-            selectinload(Event.game).selectinload(Game.league),
-            selectinload(Event.venue),
+    async def load_favorite_teams(session: AsyncSession):
+        result = await session.execute(
+            select(Team)
+            .join(UserFavoriteTeams, UserFavoriteTeams.team_id == Team.team_id)
+            .where(UserFavoriteTeams.user_id == user_id)
         )
-        .order_by(Event.created_at.desc())
-        .limit(50)
-    )
-    my_events_result = await db.execute(my_events_stmt)
-    my_events = my_events_result.scalars().all()
-
-    my_chats_stmt = (
-        select(TeamChat)
-        .where(TeamChat.user_id == current_user.user_id)
-        .options(
-            selectinload(TeamChat.team),
-            selectinload(TeamChat.user),
+        teams = result.scalars().all()
+        ref = await get_reference_data(session, league_codes={team.league_id for team in teams})
+        return [convert_team_to_read(team, ref.league(team.league_id)) for team in teams]
+
+    async def load_my_events(session: AsyncSession):
+        result = await session.execute(
+            select(*EVENT_COLUMNS)
+            .outerjoin(*EVENT_GAME_JOIN)
+            .where(Event.creator_user_id == user_id)
+            .where(Event.event_type_id != "GAME")
+            .order_by(Event.created_at.desc())
+            .limit(50)
+        )
+        return [convert_event_to_read(e, is_saved=False) for e in await event_views(session, result.all())]
+
+    async def load_my_chats(session: AsyncSession):
+        result = await session.execute(
+            select(TeamChat)
+            .where(TeamChat.user_id == user_id)
+            .options(
+                selectinload(TeamChat.team),
+                selectinload(TeamChat.user),
+            )
+            .order_by(TeamChat.timestamp.desc())
+            .limit(50)
         )
-        .order_by(TeamChat.timestamp.desc())
-        .limit(50)
+        return [convert_team_chat_to_read(chat) for chat in result.scalars().all()]
+
+    # The four sections are independent; each loads on its own pooled session.
+    favorite_teams, saved_items, my_events, my_chats = await gather_reads(
+        load_favorite_teams,
+        lambda session: _get_saved_items_for_user(user_id, session),
+        load_my_events,
+        load_my_chats,
     )
-    my_chats_result = await db.execute(my_chats_stmt)
-    my_chats = my_chats_result.scalars().all()
 
     display_name = ""
     if current_user.first_name and current_user.last_name:
@@ -77,7 +87,7 @@ async def get_user_profile_service(current_user: User, db: AsyncSession) -> User
         username=current_user.username,
         display_name=display_name,
         is_verified=current_user.is_verified,
-        favorite_teams=[convert_team_to_read(team) for team in favorite_teams],
+        favorite_teams=favorite_teams,
     )
 
     account_settings = AccountSettings(
@@ -94,8 +104,8 @@ async def get_user_profile_service(current_user: User, db: AsyncSession) -> User
         header_info=header_info,
         account_settings=account_settings,
         saved_events=saved_items,
-        my_events=[convert_event_to_read(e, is_saved=False) for e in my_events],
-        my_chats=[convert_team_chat_to_read(chat) for chat in my_chats],
+        my_events=my_events,
+        my_chats=my_chats,
     )
 
 
@@ -164,8 +174,11 @@ async def update_favorite_teams_service(
 
 
 async def delete_account_service(current_user: User, db: AsyncSession) -> None:
+    user_id = current_user.user_id
+    await release_user_favorite_counts(db, user_id)
     await db.delete(current_user)
     await db.commit()
+    principal_cache.invalidate_user(user_id)
 
 
 async def delete_saved_event_service(
@@ -182,13 +195,19 @@ async def delete_saved_event_service(
     if (deleted_by_event.rowcount or 0) == 0:
         matched_game_id = await _resolve_game_id_from_event_identifier(db, event_id)
         if matched_game_id is not None:
-            await db.execute(
+            deleted_by_game = await db.execute(
                 sa.delete(Favorite).where(
                     (Favorite.user_id == current_user.user_id) & (Favorite.game_id == matched_game_id)
                 )
             )
+            if deleted_by_game.rowcount:
+                await adjust_favorite_count(db, game_id=matched_game_id, delta=-1)
+    else:
+        await adjust_favorite_count(db, event_id=event_id, delta=-1)
 
+    await notify_saved_set_changed(db, current_user.user_id)
     await db.commit()
+    invalidate_saved_set(current_user.user_id)
     return await _get_saved_items_for_user(current_user.user_id, db)
 
 
@@ -207,7 +226,10 @@ async def add_saved_event_service(
         existing_game_favorite_result = await db.execute(existing_game_favorite_stmt)
         if existing_game_favorite_result.scalar_one_or_none() is None:
             db.add(Favorite(user_id=current_user.user_id, event_id=None, game_id=matched_game_id))
+            await adjust_favorite_count(db, game_id=matched_game_id, delta=1)
+            await notify_saved_set_changed(db, current_user.user_id)
             await db.commit()
+            invalidate_saved_set(current_user.user_id)
 
         return await _get_saved_items_for_user(current_user.user_id, db)
 
@@ -229,7 +251,10 @@ async def add_saved_event_service(
 
     if event is not None:
         db.add(Favorite(user_id=current_user.user_id, event_id=event.event_id, game_id=None))
+        await adjust_favorite_count(db, event_id=event.event_id, delta=1)
+        await notify_saved_set_changed(db, current_user.user_id)
         await db.commit()
+        invalidate_saved_set(current_user.user_id)
         return await _get_saved_items_for_user(current_user.user_id, db)
 
     raise HTTPException(
@@ -252,14 +277,7 @@ async def _resolve_game_id_from_event_identifier(
     if event_game_id is not None:
         return event_game_id
 
-    games_id_stmt = select(Game.game_id)
-    games_id_result = await db.execute(games_id_stmt)
-    for game_id in games_id_result.scalars().all():
-        synthetic_id = uuid.uuid5(uuid.NAMESPACE_DNS, f"game:{game_id}")
-        if synthetic_id == event_id:
-            return game_id
-
-    return None
+    return await resolve_game_id_from_synthetic_id(db, event_id)
 
 
 async def get_navbar_info_service(current_user: User, db: AsyncSession) -> NavBarInfo:
@@ -326,7 +344,7 @@ def _convert_game_to_read(game: Game, is_saved: bool = False) -> EventRead:
     league_value = game.league.league_code if game.league and game.league.league_code else None
 
     return EventRead(
-        event_id=uuid.uuid5(uuid.NAMESPACE_DNS, f"game:{game.game_id}"),
+        event_id=synthetic_game_event_id(game.game_id),
         event_type=EventTypeEnum.GAME,
         event_name=f"{away_team_name} @ {home_team_name}",
         date_time=game.date_time,
@@ -365,32 +383,18 @@ async def _get_saved_items_for_user(
 
     if event_ids:
         events_stmt = (
-            select(Event)
+            select(*EVENT_COLUMNS)
+            .outerjoin(*EVENT_GAME_JOIN)
             .where(Event.event_id.in_(event_ids))
-            .options(
-                selectinload(Event.game).selectinload(Game.home_team).selectinload(Team.league),
-                selectinload(Event.game).selectinload(Game.away_team).selectinload(Team.league),
-                selectinload(Event.game).selectinload(Game.league),
-                selectinload(Event.venue),
-            )
         )
         events_result = await db.execute(events_stmt)
-        events = events_result.scalars().all()
+        events = await event_views(db, events_result.all())
         events_by_id = {event.event_id: event for event in events}
 
     if game_ids:
-        games_stmt = (
-            select(Game)
-            .where(Game.game_id.in_(game_ids))
-            .options(
-                selectinload(Game.home_team),
-                selectinload(Game.away_team),
-                selectinload(Game.league),
-                selectinload(Game.venue),
-            )
-        )
+        games_stmt = select(*GAME_COLUMNS).where(Game.game_id.in_(game_ids))
         games_result = await db.execute(games_stmt)
-        games = games_result.scalars().all()
+        games = await game_views(db, games_result.all())
         games_by_id = {game.game_id: game for game in games}
 
     saved_items: list[EventRead] = []
@@ -0,0 +1,272 @@
+"""
+Reference data
+==============
+
+Teams, leagues, venues, event types and alert types change only during the
+nightly scrape or a rare admin edit, yet were re-loaded through relationships
+on almost every request.  ``reference_store`` keeps them as one immutable
+``ReferenceSnapshot`` per worker with O(1) lookups by key:
+
+- **Versioned** — ``reference_data_version`` holds a single counter.  Writers
+  call ``bump_reference_version(db)`` in the same transaction as their change
+  (the scraper, league toggles, admin team edits and deletes, alert/event
+  type edits).  A worker re-reads
+  the counter at most every ``VERSION_CHECK_SECONDS`` and rebuilds its
+  snapshot when it has moved.
+- **Loaded at startup** — ``warm_reference_data()`` runs from the app's
+  startup hook so the first request does not pay for it.
+- **Immutable** — snapshots are never changed in place.  Ids a caller needs
+  but the snapshot lacks (a venue added since it loaded, before the bump
+  reached this worker) are fetched and swapped in as a new snapshot.
+
+Readers hold on to whatever snapshot they were given; a concurrent refresh
+replaces the store's reference, never the snapshot's contents.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional
+
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.alert_type import AlertType
+from models.event_type import EventType
+from models.league import League
+from models.reference_data_version import ReferenceDataVersion
+from models.team import Team
+from models.venue import Venue
+
+logger = logging.getLogger(__name__)
+
+VERSION_CHECK_SECONDS = 30
+
+
+class LeagueRef(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    league_code: str
+    league_name: str
+    is_active: bool = True
+
+
+class TeamRef(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    team_id: int
+    league_id: str
+    team_name: str
+    display_name: str
+    logo_url: Optional[str] = None
+
+
+class VenueRef(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    venue_id: int
+    name: str
+    city: Optional[str] = None
+    state_region: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+
+
+class TypeRef(BaseModel):
+    """An ``event_types`` or ``alert_types`` row."""
+    model_config = ConfigDict(frozen=True)
+
+    code: str
+    type_name: str
+
+
+class ReferenceSnapshot:
+    __slots__ = ("version", "leagues", "teams", "venues", "event_types", "alert_types")
+
+    def __init__(
+        self,
+        version: int,
+        leagues: Mapping[str, LeagueRef],
+        teams: Mapping[int, TeamRef],
+        venues: Mapping[int, VenueRef],
+        event_types: Mapping[str, TypeRef],
+        alert_types: Mapping[str, TypeRef],
+    ):
+        self.version = version
+        self.leagues = MappingProxyType(dict(leagues))
+        self.teams = MappingProxyType(dict(teams))
+        self.venues = MappingProxyType(dict(venues))
+        self.event_types = MappingProxyType(dict(event_types))
+        self.alert_types = MappingProxyType(dict(alert_types))
+
+    def league(self, league_code: Optional[str]) -> Optional[LeagueRef]:
+        return self.leagues.get(league_code)
+
+    def team(self, team_id: Optional[int]) -> Optional[TeamRef]:
+        return self.teams.get(team_id)
+
+    def venue(self, venue_id: Optional[int]) -> Optional[VenueRef]:
+        return self.venues.get(venue_id)
+
+    def event_type(self, code: Optional[str]) -> Optional[TypeRef]:
+        return self.event_types.get(code)
+
+    def alert_type(self, code: Optional[str]) -> Optional[TypeRef]:
+        return self.alert_types.get(code)
+
+    def extended(
+        self,
+        *,
+        leagues: Iterable[LeagueRef] = (),
+        teams: Iterable[TeamRef] = (),
+        venues: Iterable[VenueRef] = (),
+    ) -> "ReferenceSnapshot":
+        """A copy with the given rows added, at the same version."""
+        return ReferenceSnapshot(
+            self.version,
+            {**self.leagues, **{league.league_code: league for league in leagues}},
+            {**self.teams, **{team.team_id: team for team in teams}},
+            {**self.venues, **{venue.venue_id: venue for venue in venues}},
+            self.event_types,
+            self.alert_types,
+        )
+
+
+_LEAGUE_COLUMNS = (League.league_code, League.league_name, League.is_active)
+_TEAM_COLUMNS = (Team.team_id, Team.league_id, Team.team_name, Team.display_name, Team.logo_url)
+_VENUE_COLUMNS = (
+    Venue.venue_id, Venue.name, Venue.city, Venue.state_region, Venue.latitude, Venue.longitude,
+)
+
+
+async def _read_version(db: AsyncSession) -> int:
+    res = await db.execute(select(ReferenceDataVersion.version).where(ReferenceDataVersion.id == 1))
+    return res.scalar_one_or_none() or 0
+
+
+async def _load_snapshot(db: AsyncSession) -> ReferenceSnapshot:
+    version = await _read_version(db)
+    leagues = await db.execute(select(*_LEAGUE_COLUMNS))
+    teams = await db.execute(select(*_TEAM_COLUMNS))
+    venues = await db.execute(select(*_VENUE_COLUMNS))
+    event_types = await db.execute(select(EventType.code, EventType.type_name))
+    alert_types = await db.execute(select(AlertType.code, AlertType.type_name))
+    return ReferenceSnapshot(
+        version,
+        {row.league_code: LeagueRef(**row._mapping) for row in leagues.all()},
+        {row.team_id: TeamRef(**row._mapping) for row in teams.all()},
+        {row.venue_id: VenueRef(**row._mapping) for row in venues.all()},
+        {row.code: TypeRef(**row._mapping) for row in event_types.all()},
+        {row.code: TypeRef(**row._mapping) for row in alert_types.all()},
+    )
+
+
+class ReferenceStore:
+    def __init__(self, check_interval: float = VERSION_CHECK_SECONDS):
+        self.check_interval = check_interval
+        self._snapshot: Optional[ReferenceSnapshot] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+        self.loads = 0
+
+    @property
+    def snapshot(self) -> Optional[ReferenceSnapshot]:
+        return self._snapshot
+
+    async def current(
+        self,
+        db: AsyncSession,
+        *,
+        team_ids: Iterable[int] = (),
+        venue_ids: Iterable[int] = (),
+        league_codes: Iterable[str] = (),
+    ) -> ReferenceSnapshot:
+        """The snapshot, refreshed if the version moved and topped up with any of the given ids it lacks."""
+        snapshot = await self._fresh(db)
+
+        missing_teams = {team_id for team_id in team_ids if team_id is not None and team_id not in snapshot.teams}
+        missing_venues = {
+            venue_id for venue_id in venue_ids if venue_id is not None and venue_id not in snapshot.venues
+        }
+        missing_leagues = {code for code in league_codes if code is not None and code not in snapshot.leagues}
+        if not (missing_teams or missing_venues or missing_leagues):
+            return snapshot
+
+        teams = venues = leagues = ()
+        if missing_teams:
+            rows = await db.execute(select(*_TEAM_COLUMNS).where(Team.team_id.in_(missing_teams)))
+            teams = [TeamRef(**row._mapping) for row in rows.all()]
+        if missing_venues:
+            rows = await db.execute(select(*_VENUE_COLUMNS).where(Venue.venue_id.in_(missing_venues)))
+            venues = [VenueRef(**row._mapping) for row in rows.all()]
+        if missing_leagues:
+            rows = await db.execute(select(*_LEAGUE_COLUMNS).where(League.league_code.in_(missing_leagues)))
+            leagues = [LeagueRef(**row._mapping) for row in rows.all()]
+        if not (teams or venues or leagues):
+            return snapshot
+        extended = snapshot.extended(leagues=leagues, teams=teams, venues=venues)
+        # Only swap in if no refresh replaced the snapshot meanwhile.
+        if self._snapshot is snapshot:
+            self._snapshot = extended
+        return extended
+
+    async def _fresh(self, db: AsyncSession) -> ReferenceSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return snapshot
+        async with self._lock:
+            # Another request may have refreshed while this one waited.
+            if self._snapshot is not None and time.monotonic() - self._checked_at < self.check_interval:
+                return self._snapshot
+            if self._snapshot is not None and await _read_version(db) == self._snapshot.version:
+                self._checked_at = time.monotonic()
+                return self._snapshot
+            self._snapshot = await _load_snapshot(db)
+            self._checked_at = time.monotonic()
+            self.loads += 1
+            logger.info(
+                f"Loaded reference data v{self._snapshot.version}: {len(self._snapshot.teams)} teams, "
+                f"{len(self._snapshot.venues)} venues, {len(self._snapshot.leagues)} leagues"
+            )
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        """Force a version check on next use."""
+        self._checked_at = 0.0
+
+
+reference_store = ReferenceStore()
+
+
+async def get_reference_data(
+    db: AsyncSession,
+    *,
+    team_ids: Iterable[int] = (),
+    venue_ids: Iterable[int] = (),
+    league_codes: Iterable[str] = (),
+) -> ReferenceSnapshot:
+    return await reference_store.current(db, team_ids=team_ids, venue_ids=venue_ids, league_codes=league_codes)
+
+
+async def bump_reference_version(db: AsyncSession) -> None:
+    """Mark reference data changed; commits with the caller's transaction."""
+    await db.execute(
+        update(ReferenceDataVersion)
+        .where(ReferenceDataVersion.id == 1)
+        .values(version=ReferenceDataVersion.version + 1, updated_at=text("now()"))
+    )
+    reference_store.invalidate()
+
+
+async def warm_reference_data() -> None:
+    from db.session import AsyncSessionLocal
+
+    try:
+        async with AsyncSessionLocal() as session:
+            await reference_store.current(session)
+    except Exception as e:
+        logger.warning(f"Could not preload reference data: {e}")
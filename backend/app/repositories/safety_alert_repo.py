@@ -1,16 +1,18 @@
 from __future__ import annotations
-from typing import Optional, Sequence
+from typing import Optional
 from uuid import UUID
 from datetime import datetime
 from sqlalchemy import select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from db.pagination import Keyset, Page
 from models.safety_alert import SafetyAlert
 from models.game import Game
 
 _GAME_LOAD = selectinload(SafetyAlert.game).selectinload(Game.home_team), \
              selectinload(SafetyAlert.game).selectinload(Game.away_team)
+ALERTS_BY_CREATED_DESC = Keyset(SafetyAlert.created_at, SafetyAlert.alert_id, descending=True)
 from schemas.common import Location
 from schemas.safety_alert import SafetyAlertFeedRead, SafetyAlertSeverity
 
@@ -32,9 +34,12 @@ class SafetyAlertRepository:
         source: Optional[str] = None,
         active_only: bool = False,
         limit: int = 100,
-        offset: int = 0
-    ) -> Sequence[SafetyAlert]:
-        stmt = select(SafetyAlert).options(*_GAME_LOAD).order_by(SafetyAlert.created_at.desc()).limit(limit).offset(offset)
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        stmt = ALERTS_BY_CREATED_DESC.paginate(
+            select(SafetyAlert).options(*_GAME_LOAD), limit=limit, cursor=cursor, offset=offset
+        )
         if reporter_user_id:
             stmt = stmt.where(SafetyAlert.reporter_user_id == reporter_user_id)
         if game_id is not None:
@@ -44,7 +49,7 @@ class SafetyAlertRepository:
         if active_only:
             stmt = stmt.where(SafetyAlert.is_active == True)
         res = await self.db.execute(stmt)
-        return res.scalars().all()
+        return ALERTS_BY_CREATED_DESC.page(res.scalars().all(), limit)
 
     async def add(self, alert: SafetyAlert) -> SafetyAlert:
         self.db.add(alert)
@@ -0,0 +1,130 @@
+"""
+Per-user saved sets
+===================
+
+Listing endpoints each queried ``favorites`` (some joining ``events``) just
+to mark which results the signed-in user has saved.  ``get_saved_set`` loads
+a user's saved event ids and game ids once — game ids include the games of
+saved events, as search has always counted them — and caches the result per
+user.  Endpoints can then build one result for everyone (and cache it) and
+overlay ``is_saved`` in memory with ``overlay_saved``.
+
+Every save/unsave path calls ``notify_saved_set_changed`` inside its
+transaction and ``invalidate_saved_set`` after its commit.  The NOTIFY is
+delivered on commit to every worker's listener (``core.chat_notifier``),
+which drops its copy, so a save on one instance is visible on the next
+request to any other.  The cache is only trusted while this worker's
+listener is up; otherwise each request loads the set with one indexed query,
+and a dropped listener clears the cache since notifications may have been
+missed.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.cache import Cache, NullBackend
+from core.chat_notifier import chat_notifier
+from models.event import Event
+from models.favorite import Favorite
+from repositories.game_synthetic_id_repo import synthetic_game_event_id
+from schemas.event import EventRead
+
+
+class SavedSet(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    event_ids: frozenset[UUID] = frozenset()
+    game_ids: frozenset[int] = frozenset()
+
+    def has_event(self, event_id: UUID) -> bool:
+        return event_id in self.event_ids
+
+    def has_game(self, game_id: int) -> bool:
+        return game_id in self.game_ids
+
+
+EMPTY_SAVED_SET = SavedSet()
+
+_SAVED_SETS = Cache("saved_sets", SavedSet, ttl_seconds=60, max_entries=4096, backend=NullBackend())
+
+
+async def _load_saved_set(db: AsyncSession, user_id: UUID) -> SavedSet:
+    result = await db.execute(
+        select(Favorite.event_id, func.coalesce(Favorite.game_id, Event.game_id))
+        .outerjoin(Event, Event.event_id == Favorite.event_id)
+        .where(Favorite.user_id == user_id)
+    )
+    rows = result.all()
+    return SavedSet(
+        event_ids=frozenset(event_id for event_id, _ in rows if event_id is not None),
+        game_ids=frozenset(game_id for _, game_id in rows if game_id is not None),
+    )
+
+
+SAVED_SETS_CHANNEL = "saved_sets"
+
+# Bumped on every invalidation; a load that overlaps one is not kept.
+_invalidations = 0
+
+
+async def get_saved_set(db: AsyncSession, user_id: UUID | None) -> SavedSet:
+    if user_id is None:
+        return EMPTY_SAVED_SET
+    if not chat_notifier.listening_or_reconnect():
+        # Other workers' saves cannot reach this cache; read the source.
+        return await _load_saved_set(db, user_id)
+    seen = _invalidations
+    saved = await _SAVED_SETS.get_or_load(user_id, lambda: _load_saved_set(db, user_id))
+    if _invalidations != seen:
+        _SAVED_SETS.invalidate(user_id)
+    return saved
+
+
+async def notify_saved_set_changed(db: AsyncSession, user_id: UUID) -> None:
+    """Queue a NOTIFY so every worker drops *user_id*'s set; delivered when *db* commits."""
+    await db.execute(select(func.pg_notify(SAVED_SETS_CHANNEL, str(user_id))))
+
+
+def invalidate_saved_set(user_id: UUID) -> None:
+    global _invalidations
+    _invalidations += 1
+    _SAVED_SETS.invalidate(user_id)
+
+
+def _on_saved_set_notification(payload: str) -> None:
+    try:
+        user_id = UUID(payload)
+    except ValueError:
+        return
+    invalidate_saved_set(user_id)
+
+
+def _on_listener_lost() -> None:
+    global _invalidations
+    _invalidations += 1
+    _SAVED_SETS.clear()
+
+
+chat_notifier.add_channel_handler(SAVED_SETS_CHANNEL, _on_saved_set_notification)
+chat_notifier.add_disconnect_handler(_on_listener_lost)
+
+
+def is_game_item(item: EventRead) -> bool:
+    """Whether *item* stands for a game itself (synthetic event id) rather than a real event."""
+    return item.game_id is not None and item.event_id == synthetic_game_event_id(item.game_id)
+
+
+def overlay_saved(items: Sequence[EventRead], saved: SavedSet) -> list[EventRead]:
+    """Copies of *items* with ``is_saved`` from *saved*; shared (cached) items are left untouched."""
+    return [
+        item.model_copy(update={
+            "is_saved": saved.has_game(item.game_id) if is_game_item(item) else saved.has_event(item.event_id)
+        })
+        for item in items
+    ]
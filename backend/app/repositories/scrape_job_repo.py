@@ -0,0 +1,111 @@
+from __future__ import annotations
+from typing import Optional, Sequence
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import Text, cast, func, select, text, update
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, array, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.scrape_job import ScrapeJob
+
+ACTIVE_STATUSES = ("queued", "running")
+
+
+def _path(*keys: str):
+    return cast(array(list(keys)), ARRAY(Text))
+
+
+class ScrapeJobRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get(self, job_id: UUID) -> Optional[ScrapeJob]:
+        return await self.db.get(ScrapeJob, job_id, populate_existing=True)
+
+    async def list_recent(self, limit: int = 20) -> Sequence[ScrapeJob]:
+        res = await self.db.execute(
+            select(ScrapeJob).order_by(ScrapeJob.created_at.desc()).limit(limit)
+        )
+        return res.scalars().all()
+
+    async def find_active(self, kind: str = "nightly") -> Optional[ScrapeJob]:
+        res = await self.db.execute(
+            select(ScrapeJob).where(ScrapeJob.kind == kind, ScrapeJob.status.in_(ACTIVE_STATUSES))
+        )
+        return res.scalar_one_or_none()
+
+    async def create(self, trigger: str, full_refresh: bool, kind: str = "nightly") -> Optional[ScrapeJob]:
+        """Queue a job; None if another job of *kind* is already queued or running."""
+        stmt = (
+            pg_insert(ScrapeJob)
+            .values(kind=kind, trigger=trigger, full_refresh=full_refresh)
+            .on_conflict_do_nothing(
+                index_elements=[ScrapeJob.kind],
+                # Literal, not bound: the predicate must match the partial index's.
+                index_where=text("status IN ('queued', 'running')"),
+            )
+            .returning(ScrapeJob.job_id)
+        )
+        job_id = (await self.db.execute(stmt)).scalar_one_or_none()
+        return await self.get(job_id) if job_id is not None else None
+
+    async def mark_running(self, job_id: UUID, leagues_total: int) -> None:
+        now = func.now()
+        await self.db.execute(
+            update(ScrapeJob)
+            .where(ScrapeJob.job_id == job_id)
+            .values(
+                status="running",
+                attempts=ScrapeJob.attempts + 1,
+                leagues_total=leagues_total,
+                started_at=func.coalesce(ScrapeJob.started_at, now),
+                heartbeat_at=now,
+                error=None,
+            )
+        )
+
+    async def record_league(self, job_id: UUID, league_code: str, entry: dict, done: bool) -> None:
+        """Store *entry* under ``checkpoint.leagues[league_code]``; *done* leagues are skipped on resume."""
+        values = {
+            "checkpoint": func.jsonb_set(
+                ScrapeJob.checkpoint, _path("leagues", league_code), cast(entry, JSONB)
+            ),
+            "heartbeat_at": func.now(),
+        }
+        if done:
+            values["leagues_done"] = ScrapeJob.leagues_done + 1
+        await self.db.execute(update(ScrapeJob).where(ScrapeJob.job_id == job_id).values(**values))
+
+    async def set_checkpoint_value(self, job_id: UUID, key: str, value) -> None:
+        await self.db.execute(
+            update(ScrapeJob)
+            .where(ScrapeJob.job_id == job_id)
+            .values(
+                checkpoint=func.jsonb_set(ScrapeJob.checkpoint, _path(key), cast(value, JSONB)),
+                heartbeat_at=func.now(),
+            )
+        )
+
+    async def heartbeat(self, job_id: UUID) -> None:
+        await self.db.execute(
+            update(ScrapeJob).where(ScrapeJob.job_id == job_id).values(heartbeat_at=func.now())
+        )
+
+    async def finish(self, job_id: UUID, status: str, error: Optional[str] = None) -> None:
+        await self.db.execute(
+            update(ScrapeJob)
+            .where(ScrapeJob.job_id == job_id)
+            .values(status=status, error=error, finished_at=func.now(), heartbeat_at=func.now())
+        )
+
+
+async def list_scrape_jobs_service(db: AsyncSession, limit: int) -> Sequence[ScrapeJob]:
+    return await ScrapeJobRepository(db).list_recent(limit)
+
+
+async def get_scrape_job_service(db: AsyncSession, job_id: UUID) -> ScrapeJob:
+    job = await ScrapeJobRepository(db).get(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return job
@@ -1,80 +1,274 @@
+"""
+Global typeahead search
+=======================
+
+All four result types (teams, games, non-game events and cities) are matched
+and ranked in a single ``UNION ALL`` statement.  Each branch scores its rows
+with ``_relevance`` (exact > prefix > word-prefix > substring, then trigram
+similarity within each bucket), keeps only its own top ``limit``, and the
+outer query picks the overall top ``limit`` — ties fall back to the old
+team → game → event → city ordering.  The ``ILIKE`` filters are served by the
+``pg_trgm`` GIN indexes (see ``db.text_search``).
+
+Only the surviving ids come back from that statement; those rows are then
+loaded, one small query per result type present, with teams, leagues and
+venues read from the reference-data snapshot.
+
+Results are cached briefly per (query, limit) and shared by every caller;
+a signed-in user's saved flags on game results are overlaid from their
+cached saved set.
+"""
+
 from typing import List, Optional
-import uuid
 from uuid import UUID
 
-from sqlalchemy import or_, select
+from sqlalchemy import String, case, cast, func, literal, null, or_, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from core.cache import Cache
+from db.parallel import gather_reads
+from db.text_search import similarity_score
 from models.event import Event
-from models.favorite import Favorite
 from models.game import Game
 from models.team import Team
 from models.venue import Venue
+from repositories.event_read_model_repo import GAME_COLUMNS, game_views
+from repositories.game_synthetic_id_repo import synthetic_game_event_id
+from repositories.reference_data_repo import get_reference_data
+from repositories.saved_set_repo import SavedSet, get_saved_set
 from schemas.search import SearchResult, SearchTypeEnum, TeamLogos
 
 
-async def search_service(
-    query: str,
-    db: AsyncSession,
-    limit: int = 7,
-    current_user_id: Optional[UUID] = None,
-) -> List[SearchResult]:
-    query_lower = query.lower().strip()
-    results: List[SearchResult] = []
+# Tie-break order between result types with equal relevance.
+_TYPE_PRIORITY = {
+    SearchTypeEnum.TEAM: 0,
+    SearchTypeEnum.GAME: 1,
+    SearchTypeEnum.EVENT: 2,
+    SearchTypeEnum.CITY: 3,
+}
+
+_SEARCH_CACHE = Cache("search", List[SearchResult], ttl_seconds=30, max_entries=1000)
+
 
-    team_results = await search_teams(query_lower, db, limit)
-    results.extend(team_results)
+def _relevance(column, query: str):
+    """Score how well *column* matches the already-lowercased *query*.
 
-    game_results = await search_games(query_lower, db, limit, current_user_id=current_user_id)
-    results.extend(game_results)
+    The match bucket dominates; trigram similarity (0–1) orders rows within it.
+    """
+    value = func.lower(column)
+    bucket = case(
+        (value == query, 100),
+        (value.like(f"{query}%"), 75),
+        (value.like(f"% {query}%"), 50),
+        (value.like(f"%{query}%"), 25),
+        else_=0,
+    )
+    return bucket + similarity_score([column], query)
 
-    event_results = await search_events(query_lower, db, limit)
-    results.extend(event_results)
 
-    city_results = await search_cities(query_lower, db, limit)
-    results.extend(city_results)
+def _ranked_branch(kind: SearchTypeEnum, stmt, score, limit: int):
+    """Trim one union branch to its own top *limit* before the global merge."""
+    return (
+        stmt.add_columns(
+            literal(kind.value).label("kind"),
+            score.label("score"),
+            literal(_TYPE_PRIORITY[kind]).label("priority"),
+        )
+        .order_by(score.desc())
+        .limit(limit)
+        .subquery()
+    )
 
-    return results[:limit]
+
+def _team_branch(query: str, limit: int):
+    pattern = f"%{query}%"
+    score = func.greatest(
+        _relevance(Team.display_name, query),
+        _relevance(Team.team_name, query),
+        _relevance(Team.home_location, query) - 10,
+    )
+    stmt = select(
+        cast(Team.team_id, String).label("item_id"),
+        null().cast(String).label("city"),
+        null().cast(String).label("state_region"),
+        null().cast(String).label("country"),
+    ).where(
+        or_(
+            Team.team_name.ilike(pattern),
+            Team.display_name.ilike(pattern),
+            Team.home_location.ilike(pattern),
+        )
+    )
+    return _ranked_branch(SearchTypeEnum.TEAM, stmt, score, limit)
 
 
-async def search_teams(query: str, db: AsyncSession, limit: int) -> List[SearchResult]:
+def _game_branch(query: str, limit: int):
+    pattern = f"%{query}%"
+    score = func.greatest(
+        _relevance(Team.display_name, query),
+        _relevance(Team.team_name, query),
+        _relevance(Venue.name, query) - 10,
+    )
     stmt = (
-        select(Team)
+        select(
+            cast(Game.game_id, String).label("item_id"),
+            null().cast(String).label("city"),
+            null().cast(String).label("state_region"),
+            null().cast(String).label("country"),
+        )
+        .join(Team, Team.team_id == Game.home_team_id, isouter=True)
+        .join(Venue, Venue.venue_id == Game.venue_id, isouter=True)
         .where(
             or_(
-                Team.team_name.ilike(f"%{query}%"),
-                Team.display_name.ilike(f"%{query}%"),
-                Team.home_location.ilike(f"%{query}%"),
+                Team.team_name.ilike(pattern),
+                Team.display_name.ilike(pattern),
+                Venue.name.ilike(pattern),
             )
         )
-        .options(selectinload(Team.league))
+    )
+    return _ranked_branch(SearchTypeEnum.GAME, stmt, score, limit)
+
+
+def _event_branch(query: str, limit: int):
+    pattern = f"%{query}%"
+    score = func.greatest(
+        _relevance(Event.title, query),
+        _relevance(Event.description, query) - 20,
+    )
+    stmt = (
+        select(
+            cast(Event.event_id, String).label("item_id"),
+            null().cast(String).label("city"),
+            null().cast(String).label("state_region"),
+            null().cast(String).label("country"),
+        )
+        .where(Event.event_type_id != "GAME")
+        .where(or_(Event.title.ilike(pattern), Event.description.ilike(pattern)))
+    )
+    return _ranked_branch(SearchTypeEnum.EVENT, stmt, score, limit)
+
+
+def _city_branch(query: str, limit: int):
+    pattern = f"%{query}%"
+    score = func.max(
+        func.greatest(
+            _relevance(Venue.city, query),
+            _relevance(Venue.state_region, query) - 10,
+        )
+    )
+    stmt = (
+        select(
+            null().cast(String).label("item_id"),
+            Venue.city.label("city"),
+            Venue.state_region.label("state_region"),
+            Venue.country.label("country"),
+        )
+        .where(or_(Venue.city.ilike(pattern), Venue.state_region.ilike(pattern)))
+        .group_by(Venue.city, Venue.state_region, Venue.country)
+    )
+    return _ranked_branch(SearchTypeEnum.CITY, stmt, score, limit)
+
+
+def _build_ranked_search(query: str, limit: int):
+    branches = [
+        _team_branch(query, limit),
+        _game_branch(query, limit),
+        _event_branch(query, limit),
+        _city_branch(query, limit),
+    ]
+    # Every branch yields item_id (as text), city, state_region, country,
+    # kind, score, priority — in that order.
+    unioned = union_all(*[select(branch) for branch in branches]).subquery()
+    return (
+        select(unioned)
+        .order_by(unioned.c.score.desc(), unioned.c.priority)
         .limit(limit)
     )
-    result = await db.execute(stmt)
-    teams = result.scalars().all()
 
+
+async def search_service(
+    query: str,
+    db: AsyncSession,
+    limit: int = 7,
+    current_user_id: Optional[UUID] = None,
+) -> List[SearchResult]:
+    query_lower = query.lower().strip()
+    if not query_lower:
+        return []
+    results = await _SEARCH_CACHE.get_or_load((query_lower, limit), lambda: _search(query_lower, db, limit))
+    if current_user_id is None:
+        return results
+    return _overlay_saved_games(results, await get_saved_set(db, current_user_id))
+
+
+def _overlay_saved_games(results: List[SearchResult], saved: SavedSet) -> List[SearchResult]:
+    """Copies of game results with the user's ``saved`` flag; the cached list is left untouched."""
     return [
-        SearchResult(
+        result.model_copy(update={"metadata": {**result.metadata, "saved": saved.has_game(int(result.id))}})
+        if result.type == SearchTypeEnum.GAME
+        else result
+        for result in results
+    ]
+
+
+async def _search(query_lower: str, db: AsyncSession, limit: int) -> List[SearchResult]:
+    ranked = (await db.execute(_build_ranked_search(query_lower, limit))).all()
+
+    team_ids = [int(row.item_id) for row in ranked if row.kind == SearchTypeEnum.TEAM.value]
+    game_ids = [int(row.item_id) for row in ranked if row.kind == SearchTypeEnum.GAME.value]
+    event_ids = [UUID(row.item_id) for row in ranked if row.kind == SearchTypeEnum.EVENT.value]
+
+    # Hydrate each kind on its own pooled session; kinds with no hits need no query.
+    loaders = {
+        kind: (lambda session, load=load, ids=ids: load(ids, session))
+        for kind, load, ids in (
+            (SearchTypeEnum.TEAM.value, _load_team_results, team_ids),
+            (SearchTypeEnum.GAME.value, _load_game_results, game_ids),
+            (SearchTypeEnum.EVENT.value, _load_event_results, event_ids),
+        )
+        if ids
+    }
+    loaded = dict(zip(loaders, await gather_reads(*loaders.values()))) if loaders else {}
+    results: List[SearchResult] = []
+    for row in ranked:
+        if row.kind == SearchTypeEnum.CITY.value:
+            results.append(_city_result(row.city, row.state_region, row.country))
+            continue
+        result = loaded[row.kind].get(row.item_id)
+        # A row can vanish between the ranking query and the load; skip it.
+        if result is not None:
+            results.append(result)
+    return results
+
+
+async def _load_team_results(team_ids: List[int], db: AsyncSession) -> dict[str, SearchResult]:
+    if not team_ids:
+        return {}
+    result = await db.execute(
+        select(Team).where(Team.team_id.in_(team_ids))
+    )
+    teams = result.scalars().all()
+    ref = await get_reference_data(db, league_codes={team.league_id for team in teams})
+    return {
+        str(team.team_id): SearchResult(
             id=str(team.team_id),
             type=SearchTypeEnum.TEAM,
             title=team.display_name,
             image_url=team.logo_url,
             metadata={
-                "league": team.league.league_name if team.league else None,
+                "league": league.league_name if (league := ref.league(team.league_id)) else None,
                 "location": team.home_location,
             },
         )
         for team in teams
-    ]
+    }
 
 
-async def search_games(
-    query: str,
-    db: AsyncSession,
-    limit: int,
-    current_user_id: Optional[UUID] = None,
-) -> List[SearchResult]:
+async def _load_game_results(game_ids: List[int], db: AsyncSession) -> dict[str, SearchResult]:
+    if not game_ids:
+        return {}
+
     event_id_subquery = (
         select(Event.event_id)
         .where(Event.game_id == Game.game_id)
@@ -82,52 +276,14 @@ async def search_games(
         .limit(1)
         .scalar_subquery()
     )
-
-    stmt = (
-        select(Game, event_id_subquery.label("event_id"))
-        .join(Team, Team.team_id == Game.home_team_id, isouter=True)
-        .join(Venue, Venue.venue_id == Game.venue_id, isouter=True)
-        .where(
-            or_(
-                Team.team_name.ilike(f"%{query}%"),
-                Team.display_name.ilike(f"%{query}%"),
-                Venue.name.ilike(f"%{query}%"),
-            )
-        )
-        .options(
-            selectinload(Game.home_team),
-            selectinload(Game.away_team),
-            selectinload(Game.venue),
-            selectinload(Game.league),
-        )
-        .limit(limit)
+    result = await db.execute(
+        select(*GAME_COLUMNS, event_id_subquery.label("event_id")).where(Game.game_id.in_(game_ids))
     )
-    result = await db.execute(stmt)
-    game_rows = result.all()
-    saved_game_ids: set[int] = set()
-
-    if current_user_id and game_rows:
-        game_ids = [game.game_id for game, _ in game_rows]
-
-        saved_games_result = await db.execute(
-            select(Favorite.game_id)
-            .where(Favorite.user_id == current_user_id)
-            .where(Favorite.game_id.in_(game_ids))
-        )
-        saved_game_ids.update([gid for gid in saved_games_result.scalars().all() if gid is not None])
-
-        saved_games_via_event_result = await db.execute(
-            select(Event.game_id)
-            .join(Favorite, Favorite.event_id == Event.event_id)
-            .where(Favorite.user_id == current_user_id)
-            .where(Event.game_id.in_(game_ids))
-        )
-        saved_game_ids.update([
-            gid for gid in saved_games_via_event_result.scalars().all() if gid is not None
-        ])
+    rows = result.all()
+    game_rows = list(zip(await game_views(db, rows), (row.event_id for row in rows)))
 
-    return [
-        SearchResult(
+    return {
+        str(game.game_id): SearchResult(
             id=str(game.game_id),
             type=SearchTypeEnum.GAME,
             title=f"{game.away_team.display_name if game.away_team else 'TBD'} @ {game.home_team.display_name if game.home_team else 'TBD'}",
@@ -136,41 +292,28 @@ async def search_games(
                 away=game.away_team.logo_url if game.away_team else None,
             ),
             metadata={
-                "eventId": str(event_id) if event_id else str(uuid.uuid5(uuid.NAMESPACE_DNS, f"game:{game.game_id}")),
+                "eventId": str(event_id) if event_id else str(synthetic_game_event_id(game.game_id)),
                 "date": game.date_time.isoformat() if game.date_time else None,
                 "location": game.venue.city if game.venue else None,
                 "lat": game.venue.latitude if game.venue else None,
                 "lng": game.venue.longitude if game.venue else None,
                 "league": game.league.league_name if game.league else None,
-                "saved": game.game_id in saved_game_ids,
+                # Filled in per user by _overlay_saved_games.
+                "saved": False,
             },
         )
         for game, event_id in game_rows
-    ]
+    }
 
 
-async def search_events(query: str, db: AsyncSession, limit: int) -> List[SearchResult]:
-    stmt = (
-        select(Event)
-        .where(Event.event_type_id != "GAME")
-        .where(
-            or_(
-                Event.title.ilike(f"%{query}%"),
-                Event.description.ilike(f"%{query}%"),
-            )
-        )
-        .options(
-            selectinload(Event.venue),
-            selectinload(Event.game).selectinload(Game.home_team),
-            selectinload(Event.game).selectinload(Game.away_team),
-        )
-        .limit(limit)
+async def _load_event_results(event_ids: List[UUID], db: AsyncSession) -> dict[str, SearchResult]:
+    if not event_ids:
+        return {}
+    result = await db.execute(
+        select(Event).where(Event.event_id.in_(event_ids)).options(selectinload(Event.venue))
     )
-    result = await db.execute(stmt)
-    events = result.scalars().all()
-
-    return [
-        SearchResult(
+    return {
+        str(event.event_id): SearchResult(
             id=str(event.event_id),
             type=SearchTypeEnum.EVENT,
             title=event.title,
@@ -181,33 +324,16 @@ async def search_events(query: str, db: AsyncSession, limit: int) -> List[Search
                 "location": f"{event.venue.city}, {event.venue.state_region}" if event.venue else None,
             },
         )
-        for event in events
-    ]
+        for event in result.scalars().all()
+    }
 
 
-async def search_cities(query: str, db: AsyncSession, limit: int) -> List[SearchResult]:
-    stmt = (
-        select(Venue.city, Venue.state_region, Venue.country)
-        .where(
-            or_(
-                Venue.city.ilike(f"%{query}%"),
-                Venue.state_region.ilike(f"%{query}%"),
-            )
-        )
-        .distinct()
-        .limit(limit)
+def _city_result(city: Optional[str], state_region: Optional[str], country: Optional[str]) -> SearchResult:
+    return SearchResult(
+        id=f"{city}-{state_region}",
+        type=SearchTypeEnum.CITY,
+        title=f"{city}, {state_region}" if state_region else city,
+        metadata={
+            "country": country,
+        },
     )
-    result = await db.execute(stmt)
-    cities = result.all()
-
-    return [
-        SearchResult(
-            id=f"{city.city}-{city.state_region}",
-            type=SearchTypeEnum.CITY,
-            title=f"{city.city}, {city.state_region}" if city.state_region else city.city,
-            metadata={
-                "country": city.country,
-            },
-        )
-        for city in cities
-    ]
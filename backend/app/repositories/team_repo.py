@@ -1,15 +1,20 @@
 from __future__ import annotations
 from typing import Optional, Sequence
-from sqlalchemy import func, select, update, delete, or_
+from sqlalchemy import func, select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 
+from db.pagination import Keyset, Page
+from db.text_search import contains_any, similar_any, similarity_score
 from models.team import Team
+from repositories.reference_data_repo import bump_reference_version, get_reference_data
 from schemas.converters import convert_team_to_read
 from schemas.team import TeamCreate, TeamRead, TeamUpdate
 
 
+TEAMS_BY_NAME = Keyset(Team.display_name, Team.team_id)
+
+
 class TeamRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -26,6 +31,13 @@ class TeamRepository:
         )
         return res.scalar_one_or_none()
 
+    async def map_espn_ids(self, league_id: str) -> dict[int, int]:
+        """espn_team_id -> team_id for every team in *league_id*."""
+        res = await self.db.execute(
+            select(Team.espn_team_id, Team.team_id).where(Team.league_id == league_id)
+        )
+        return {int(espn_team_id): team_id for espn_team_id, team_id in res.all()}
+
     async def get_by_identity(self, *, league_id: str, home_location: str, team_name: str) -> Optional[Team]:
         res = await self.db.execute(
             select(Team).where(
@@ -115,40 +127,44 @@ async def get_teams_service(
     limit: int,
     offset: int,
     db: AsyncSession,
-) -> list[TeamRead]:
-    stmt = (
-        select(Team)
-        .options(selectinload(Team.league))
-        .order_by(Team.display_name.asc())
-        .limit(limit)
-        .offset(offset)
-    )
+    rank_by_similarity: bool = False,
+    cursor: Optional[str] = None,
+) -> Page:
+    stmt = select(Team)
 
     if league_id:
         stmt = stmt.where(Team.league_id == league_id)
 
-    if search:
-        search_pattern = f"%{search}%"
-        stmt = stmt.where(
-            or_(
-                Team.display_name.ilike(search_pattern),
-                Team.team_name.ilike(search_pattern),
-                Team.home_location.ilike(search_pattern),
-            )
+    search_columns = (Team.display_name, Team.team_name, Team.home_location)
+    ranked = bool(search and rank_by_similarity)
+    if ranked:
+        # Fuzzy match and best match first; alphabetical only breaks ties.
+        # Ranked results are a short typeahead list, so they stay offset-paged.
+        stmt = (
+            stmt.where(similar_any(search_columns, search))
+            .order_by(similarity_score(search_columns, search).desc(), Team.display_name.asc())
+            .limit(limit)
+            .offset(offset)
         )
+    else:
+        if search:
+            stmt = stmt.where(contains_any(search_columns, search))
+        stmt = TEAMS_BY_NAME.paginate(stmt, limit=limit, cursor=cursor, offset=offset)
 
     result = await db.execute(stmt)
     teams = result.scalars().all()
+    if not ranked:
+        teams = TEAMS_BY_NAME.page(teams, limit)
 
-    return [convert_team_to_read(team) for team in teams]
+    ref = await get_reference_data(db, league_codes={team.league_id for team in teams})
+    return Page(
+        [convert_team_to_read(team, ref.league(team.league_id)) for team in teams],
+        getattr(teams, "next_cursor", None),
+    )
 
 
 async def get_team_service(team_id: int, db: AsyncSession) -> TeamRead:
-    stmt = (
-        select(Team)
-        .where(Team.team_id == team_id)
-        .options(selectinload(Team.league))
-    )
+    stmt = select(Team).where(Team.team_id == team_id)
 
     result = await db.execute(stmt)
     team = result.scalar_one_or_none()
@@ -159,7 +175,8 @@ async def get_team_service(team_id: int, db: AsyncSession) -> TeamRead:
             detail=f"Team with id {team_id} not found",
         )
 
-    return convert_team_to_read(team)
+    ref = await get_reference_data(db, league_codes=[team.league_id])
+    return convert_team_to_read(team, ref.league(team.league_id))
 
 
 async def create_team_service(team_data: TeamCreate, db: AsyncSession) -> TeamRead:
@@ -204,6 +221,7 @@ async def update_team_service(
     for field, value in update_data.items():
         setattr(existing_team, field, value)
 
+    await bump_reference_version(db)
     await db.commit()
     await db.refresh(existing_team)
 
@@ -223,4 +241,5 @@ async def delete_team_service(team_id: int, db: AsyncSession) -> None:
         )
 
     await repo.remove(team_id)
+    await bump_reference_version(db)
     await db.commit()
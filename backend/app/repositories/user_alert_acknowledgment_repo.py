@@ -2,17 +2,19 @@ from __future__ import annotations
 from typing import Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select, union, or_
+from sqlalchemy import literal, select, union, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert as pg_insert
 from sqlalchemy.orm import selectinload
 
+from db.pagination import Page
 from models.game import Game
 
 from models.user_alert_acknowledgment import UserAlertAcknowledgment
 from models.safety_alert import SafetyAlert
 from models.favorite import Favorite
 from models.event import Event
+from repositories.safety_alert_repo import ALERTS_BY_CREATED_DESC
 
 
 class UserAlertAcknowledgmentRepository:
@@ -33,8 +35,32 @@ class UserAlertAcknowledgmentRepository:
         )
         return res.scalar_one()
 
-    async def get_unacknowledged_alerts(self, user_id: UUID) -> Sequence[SafetyAlert]:
+    async def acknowledge_many(
+        self, user_id: UUID, alert_ids: Optional[Sequence[UUID]] = None
+    ) -> int:
+        """Acknowledge *alert_ids*, or every pending non-official alert, in one statement.
+
+        Returns how many acknowledgments were added; ids that do not exist
+        or were already acknowledged are skipped.
+        """
+        if alert_ids is not None and not alert_ids:
+            return 0
+        alerts = select(literal(user_id, PG_UUID(as_uuid=True)), SafetyAlert.alert_id)
+        if alert_ids is not None:
+            alerts = alerts.where(SafetyAlert.alert_id.in_(set(alert_ids)))
+        else:
+            alerts = alerts.where(*self._pending_alert_filters(user_id), SafetyAlert.is_official == False)
+        stmt = (
+            pg_insert(UserAlertAcknowledgment)
+            .from_select(["user_id", "alert_id"], alerts)
+            .on_conflict_do_nothing(index_elements=["user_id", "alert_id"])
+        )
+        res = await self.db.execute(stmt)
+        return res.rowcount or 0
 
+    @staticmethod
+    def _pending_alert_filters(user_id: UUID) -> tuple:
+        """Active alerts the user has not acknowledged: official ones, or on a game they saved."""
         favorited_game_ids_direct = (
             select(Favorite.game_id)
             .where(Favorite.user_id == user_id, Favorite.game_id.isnot(None))
@@ -57,16 +83,19 @@ class UserAlertAcknowledgmentRepository:
             .where(UserAlertAcknowledgment.user_id == user_id)
         )
 
+        return (
+            SafetyAlert.is_active == True,
+            SafetyAlert.alert_id.notin_(acknowledged_alert_ids),
+            or_(
+                SafetyAlert.is_official == True,
+                SafetyAlert.game_id.in_(select(favorited_game_ids)),
+            ),
+        )
+
+    async def get_unacknowledged_alerts(self, user_id: UUID) -> Sequence[SafetyAlert]:
         stmt = (
             select(SafetyAlert)
-            .where(
-                SafetyAlert.is_active == True,
-                SafetyAlert.alert_id.notin_(acknowledged_alert_ids),
-                or_(
-                    SafetyAlert.is_official == True,
-                    SafetyAlert.game_id.in_(favorited_game_ids),
-                ),
-            )
+            .where(*self._pending_alert_filters(user_id))
             .options(
                 selectinload(SafetyAlert.game).selectinload(Game.home_team),
                 selectinload(SafetyAlert.game).selectinload(Game.away_team),
@@ -82,7 +111,8 @@ class UserAlertAcknowledgmentRepository:
         search: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> Sequence[SafetyAlert]:
+        cursor: Optional[str] = None,
+    ) -> Page:
         acknowledged_alert_ids = (
             select(UserAlertAcknowledgment.alert_id)
             .where(UserAlertAcknowledgment.user_id == user_id)
@@ -94,11 +124,9 @@ class UserAlertAcknowledgmentRepository:
                 selectinload(SafetyAlert.game).selectinload(Game.home_team),
                 selectinload(SafetyAlert.game).selectinload(Game.away_team),
             )
-            .order_by(SafetyAlert.created_at.desc())
-            .limit(limit)
-            .offset(offset)
         )
         if search:
             stmt = stmt.where(SafetyAlert.title.ilike(f"%{search}%"))
+        stmt = ALERTS_BY_CREATED_DESC.paginate(stmt, limit=limit, cursor=cursor, offset=offset)
         res = await self.db.execute(stmt)
-        return res.scalars().all()
+        return ALERTS_BY_CREATED_DESC.page(res.scalars().all(), limit)
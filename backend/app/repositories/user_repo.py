@@ -6,7 +6,10 @@ from sqlalchemy import select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
+from core.principal_cache import principal_cache
 from models.user import User
+from repositories.admin_repo import invalidate_overview_stats
+from repositories.favorite_repo import release_user_favorite_counts
 
 
 class UserRepository:
@@ -175,13 +178,18 @@ async def update_user_service(user_id: UUID, user_data, db: AsyncSession) -> Use
     await db.commit()
     if not updated:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"User with id {user_id} not found")
+    principal_cache.invalidate_user(user_id)
     return updated
 
 
 async def delete_user_service(user_id: UUID, db: AsyncSession):
     repo = UserRepository(db)
+    # The FK cascade drops the favorites but not the counters they fed.
+    await release_user_favorite_counts(db, user_id)
     removed = await repo.remove(user_id)
     if not removed:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"User with id {user_id} not found")
     await db.commit()
+    principal_cache.invalidate_user(user_id)
+    invalidate_overview_stats()
     return None
\ No newline at end of file
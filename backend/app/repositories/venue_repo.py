@@ -1,6 +1,6 @@
 from __future__ import annotations
 import logging
-from typing import Optional, Sequence
+from typing import Iterable, Optional, Sequence
 from sqlalchemy import select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from models.venue import Venue
@@ -17,6 +17,17 @@ class VenueRepository:
         res = await self.db.execute(select(Venue).where(Venue.venue_id == venue_id))
         return res.scalar_one_or_none()
 
+    async def existing_ids(self, venue_ids: Iterable[int], *, located_only: bool = False) -> set[int]:
+        """Which of *venue_ids* exist (and, if *located_only*, have coordinates)."""
+        venue_ids = set(venue_ids)
+        if not venue_ids:
+            return set()
+        stmt = select(Venue.venue_id).where(Venue.venue_id.in_(venue_ids))
+        if located_only:
+            stmt = stmt.where(Venue.latitude.isnot(None), Venue.longitude.isnot(None))
+        res = await self.db.execute(stmt)
+        return set(res.scalars().all())
+
     async def get_by_identity(
         self,
         *,
@@ -112,6 +123,15 @@ class VenueRepository:
         )
         return await self.add(venue)
 
+    async def fill_coordinates(self, venue_id: int, latitude: float, longitude: float) -> bool:
+        """Set coordinates on a venue that has none; never overwrites."""
+        res = await self.db.execute(
+            update(Venue)
+            .where(Venue.venue_id == venue_id, Venue.latitude.is_(None), Venue.longitude.is_(None))
+            .values(latitude=latitude, longitude=longitude)
+        )
+        return bool(res.rowcount)
+
     async def remove(self, venue_id: int) -> int:
         res = await self.db.execute(delete(Venue).where(Venue.venue_id == venue_id))
         return res.rowcount or 0
@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends, Query, Body
+from fastapi import APIRouter, Depends, Query, Body, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
 
+from db.pagination import with_next_cursor
 from db.session import get_session
 
 
@@ -22,9 +23,12 @@ class AdminOverview(BaseModel):
     pending_approvals: int
 
 from auth import require_admin, clerk_client
+from core.cache import cache_stats
+from core.principal_cache import Principal
 from models.user import User
 from schemas.user import UserRead
 from schemas.league import AdminLeagueRead
+from schemas.scrape_job import ScrapeJobRead
 from repositories.admin_repo import (
     get_overview_stats_service,
     list_all_leagues_service,
@@ -38,42 +42,73 @@ from repositories.admin_repo import (
     deactivate_user_service,
     delete_user_service,
 )
+from repositories.scrape_job_repo import get_scrape_job_service, list_scrape_jobs_service
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
 @router.get("/overview", response_model=AdminOverview)
 async def get_overview(
-    _admin: User = Depends(require_admin),
+    _admin: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_session),
 ):
     data = await get_overview_stats_service(db)
     return AdminOverview(**data)
 
 
+@router.get("/cache-stats")
+async def get_cache_stats(
+    _admin: Principal = Depends(require_admin),
+):
+    """Per-worker hit/miss counters for each read-through cache."""
+    return cache_stats()
+
+
 @router.get("/leagues", response_model=List[AdminLeagueRead])
 async def list_leagues(
-    _admin: User = Depends(require_admin),
+    _admin: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_session),
 ):
     return await list_all_leagues_service(db)
 
 
-@router.post("/leagues/sync", status_code=204)
+@router.post("/leagues/sync", response_model=ScrapeJobRead, status_code=202)
 async def trigger_league_sync(
-    _admin: User = Depends(require_admin),
+    full: bool = Query(False, description="Also refetch far-future schedule windows that are not yet due"),
+    _admin: Principal = Depends(require_admin),
 ):
-    from scheduled.nightly_tasks import run_nightly_task
-    import asyncio
-    asyncio.create_task(run_nightly_task())
-    return None
+    """Start a scrape job, or return the one already queued or running."""
+    from scheduled.jobs import launch, start_nightly_job
+    job, should_run = await start_nightly_job("admin", full_refresh=full)
+    if should_run:
+        launch(job.job_id)
+    return ScrapeJobRead.from_db_model(job)
+
+
+@router.get("/jobs", response_model=List[ScrapeJobRead])
+async def list_jobs(
+    limit: int = Query(20, ge=1, le=100),
+    _admin: Principal = Depends(require_admin),
+    db: AsyncSession = Depends(get_session),
+):
+    jobs = await list_scrape_jobs_service(db, limit)
+    return [ScrapeJobRead.from_db_model(job) for job in jobs]
+
+
+@router.get("/jobs/{job_id}", response_model=ScrapeJobRead)
+async def get_job(
+    job_id: UUID,
+    _admin: Principal = Depends(require_admin),
+    db: AsyncSession = Depends(get_session),
+):
+    return ScrapeJobRead.from_db_model(await get_scrape_job_service(db, job_id))
 
 
 @router.patch("/leagues/{league_code}/active", response_model=AdminLeagueRead)
 async def set_league_active(
     league_code: str,
     is_active: bool = Query(...),
-    _admin: User = Depends(require_admin),
+    _admin: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_session),
 ):
     return await update_league_active_service(league_code, is_active, db)
@@ -81,7 +116,7 @@ async def set_league_active(
 
 @router.get("/pending-approvals", response_model=List[UserRead])
 async def list_pending_approvals(
-    _admin: User = Depends(require_admin),
+    _admin: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_session),
 ):
     return await list_pending_verifications_service(db)
@@ -90,7 +125,7 @@ async def list_pending_approvals(
 @router.post("/pending-approvals/{user_id}/approve", response_model=UserRead)
 async def approve_verification(
     user_id: UUID,
-    _admin: User = Depends(require_admin),
+    _admin: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_session),
 ):
     return await approve_verification_service(user_id, db)
@@ -99,7 +134,7 @@ async def approve_verification(
 @router.post("/pending-approvals/{user_id}/deny", response_model=UserRead)
 async def deny_verification(
     user_id: UUID,
-    _admin: User = Depends(require_admin),
+    _admin: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_session),
 ):
     return await deny_verification_service(user_id, db)
@@ -107,7 +142,7 @@ async def deny_verification(
 
 @router.get("/verified-creators", response_model=List[UserRead])
 async def list_verified_creators(
-    _admin: User = Depends(require_admin),
+    _admin: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_session),
 ):
     return await list_verified_creators_service(db)
@@ -116,7 +151,7 @@ async def list_verified_creators(
 @router.post("/verified-creators/{user_id}/revoke", response_model=UserRead)
 async def revoke_creator(
     user_id: UUID,
-    _admin: User = Depends(require_admin),
+    _admin: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_session),
 ):
     return await revoke_creator_status_service(user_id, db)
@@ -124,18 +159,21 @@ async def revoke_creator(
 
 @router.get("/users", response_model=List[UserRead])
 async def list_users(
+    response: Response,
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
-    _admin: User = Depends(require_admin),
+    cursor: Optional[str] = Query(default=None, description="`X-Next-Cursor` from the previous page"),
+    _admin: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_session),
 ):
-    return await list_all_users_service(db, limit=limit, offset=offset)
+    page = await list_all_users_service(db, limit=limit, offset=offset, cursor=cursor)
+    return with_next_cursor(response, page)
 
 
 @router.post("/users/{user_id}/deactivate", status_code=204)
 async def deactivate_user(
     user_id: UUID,
-    _admin: User = Depends(require_admin),
+    _admin: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_session),
 ):
     user = await deactivate_user_service(user_id, db)
@@ -149,7 +187,7 @@ async def deactivate_user(
 async def reset_user_password(
     user_id: UUID,
     new_password: str = Body(..., embed=True),
-    _admin: User = Depends(require_admin),
+    _admin: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_session),
 ):
     result = await db.execute(select(User).where(User.user_id == user_id))
@@ -3,10 +3,10 @@ from typing import List
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from auth import get_current_user
+from auth import get_current_principal
+from core.principal_cache import Principal
 from db.session import get_session
-from models.user import User
-from repositories.alert_type_repo import AlertTypeRepository
+from repositories.reference_data_repo import get_reference_data
 from schemas.alert_type import AlertTypeRead
 
 router = APIRouter(prefix="/alert-types", tags=["alert-types"])
@@ -14,8 +14,9 @@ router = APIRouter(prefix="/alert-types", tags=["alert-types"])
 
 @router.get("/", response_model=List[AlertTypeRead])
 async def list_alert_types(
-    _current_user: User = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ):
-    repo = AlertTypeRepository(db)
-    return await repo.list()
+    ref = await get_reference_data(db)
+    # Same order as AlertTypeRepository.list: 'other' last, then by name.
+    return sorted(ref.alert_types.values(), key=lambda t: (t.code == "other", t.type_name))
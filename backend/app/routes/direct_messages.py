@@ -4,10 +4,10 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from auth import get_current_user
+from auth import get_current_principal
+from core.principal_cache import Principal
 from core.content_filter import clean_message
 from db.session import get_session
-from models.user import User
 from repositories.direct_message_repo import (
     delete_direct_message,
     get_conversation,
@@ -22,7 +22,7 @@ router = APIRouter(prefix="/direct-messages", tags=["direct-messages"])
 @router.post("", response_model=DirectMessageRead, status_code=status.HTTP_201_CREATED)
 async def send_message(
     body: DirectMessageCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ) -> DirectMessageRead:
     cleaned = clean_message(body.message_text)
@@ -39,7 +39,7 @@ async def send_message(
 async def get_messages(
     other_user_id: UUID,
     limit: int = Query(default=50, ge=1, le=200),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ) -> List[DirectMessageRead]:
     messages = await get_conversation(
@@ -55,7 +55,7 @@ async def get_messages(
 async def update_message(
     message_id: UUID,
     body: DirectMessageUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ) -> DirectMessageRead:
     cleaned = clean_message(body.message_text)
@@ -71,7 +71,7 @@ async def update_message(
 @router.delete("/{message_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_message(
     message_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ) -> None:
     await delete_direct_message(
@@ -20,12 +20,29 @@ support persistent connections.  The client-side contract is:
       When messages arrive, append them to the chat list and update the
       cursor to the `nextCursor` from the new response.
 
+3. **Long-polling (optional)**
+   GET /api/event-chats/event/{event_id}?since={nextCursor}&wait=25
+   └─ Same shape as (2), but when there is nothing new the request is held
+      open for up to `wait` seconds and returns as soon as a message is
+      posted.  Wake-ups come from a Postgres NOTIFY fan-out (see
+      `core.chat_notifier`), so a held request costs no queries while idle.
+      Re-issue immediately after each response; no client-side delay needed.
+      If the worker's NOTIFY listener is down the request is answered at
+      once; an empty response that comes back well before `wait` means
+      "fall back to the normal poll interval for the next request".
+
+Hot rooms are served from a per-event in-memory ring buffer of the most
+recent messages (see `core.chat_buffer`), kept current on post/delete and
+via the same NOTIFY channel; cursors older than the buffer fall back to SQL.
+
 Recommended polling cadence
 ---------------------------
 - Poll every **3–4 seconds** while the event page is visible.
 - Pause polling when `document.visibilityState === 'hidden'` (tab in background)
   to avoid unnecessary cold-starts on the function app.
 - The `since` filter is cheap (indexed column) so short poll intervals are fine.
+- Clients that can afford a held connection should prefer `wait=` over a
+  tight interval.
 
 Authentication
 --------------
@@ -40,18 +57,19 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from auth import get_current_user
+from auth import get_current_principal
+from core.principal_cache import Principal
+from core.chat_notifier import chat_notifier, wait_for_wakeup
 from core.content_filter import clean_message
 from db.session import get_session
 from models.event_chat import EventChat
-from models.user import User
 from repositories.event_chat_repo import (
     add_new_chat_service,
     get_chat_by_id_service,
-    list_for_event_service,
+    list_for_event_buffered_service,
     remove_chat_service,
 )
 from repositories.game_channel_repo import get_or_create_game_channel_event
@@ -59,6 +77,9 @@ from schemas.event_chat import EventChatCreate, EventChatPage, EventChatRead
 
 router = APIRouter(prefix="/event-chats", tags=["event-chats"])
 
+# Kept below the Azure Functions / front-door idle timeouts.
+MAX_LONG_POLL_SECONDS = 25
+
 
 # ---------------------------------------------------------------------------
 # GET  /event/{event_id}   — initial load and polling
@@ -75,6 +96,16 @@ async def list_event_chats(
             "returned (poll mode).  Omit for the initial page load."
         ),
     ),
+    wait: int = Query(
+        default=0,
+        ge=0,
+        le=MAX_LONG_POLL_SECONDS,
+        description=(
+            "Long-poll timeout in seconds.  Only used together with `since`: "
+            "when there are no new messages the request is held open until one "
+            "is posted or the timeout elapses."
+        ),
+    ),
     db: AsyncSession = Depends(get_session),
 ) -> EventChatPage:
     since_dt: datetime | None = None
@@ -91,9 +122,25 @@ async def list_event_chats(
                 detail="`since` must be a valid ISO-8601 datetime string",
             )
 
-    messages = await list_for_event_service(
-        event_id=event_id, limit=limit, db=db, since=since_dt
-    )
+    if since_dt is not None and wait > 0:
+        # Subscribe before the catch-up query so a message committed in
+        # between still wakes us.
+        async with chat_notifier.subscribe(event_id) as waiter:
+            messages = await list_for_event_buffered_service(
+                event_id=event_id, limit=limit, db=db, since=since_dt
+            )
+            # Without the listener nothing can wake us; answer now.
+            if not messages and chat_notifier.is_listening:
+                # Hand the connection back to the pool while we sit idle.
+                await db.rollback()
+                if await wait_for_wakeup(waiter, wait):
+                    messages = await list_for_event_buffered_service(
+                        event_id=event_id, limit=limit, db=db, since=since_dt
+                    )
+    else:
+        messages = await list_for_event_buffered_service(
+            event_id=event_id, limit=limit, db=db, since=since_dt
+        )
 
     # Build the cursor from the last (most-recent) message in the result.
     # The frontend passes this back verbatim as `?since=` on the next poll.
@@ -114,7 +161,7 @@ async def list_event_chats(
 @router.post("/", response_model=EventChatRead, status_code=status.HTTP_201_CREATED)
 async def add_event_chat(
     chat_data: EventChatCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ) -> EventChatRead:
     resolved_event_id = chat_data.event_id
@@ -142,7 +189,7 @@ async def add_event_chat(
 @router.delete("/{message_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_event_chat(
     message_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ) -> None:
     await remove_chat_service(
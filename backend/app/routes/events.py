@@ -1,5 +1,4 @@
 from uuid import UUID
-import uuid as _uuid
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response
 from sqlalchemy import select
@@ -16,9 +15,11 @@ from repositories.event_repo import (
     _map_event_to_read,
 )
 from repositories.game_channel_repo import get_or_create_game_channel_event
+from repositories.game_synthetic_id_repo import resolve_game_id_from_synthetic_id
 from repositories.safety_alert_repo import get_game_safety_alerts_service
 from db.session import get_session
-from auth import get_optional_current_user, get_current_user, require_verified_creator
+from auth import get_optional_current_principal, get_current_principal, require_verified_creator
+from core.principal_cache import Principal
 from models.event import Event
 from models.game import Game
 from models.user import User
@@ -35,7 +36,7 @@ router = APIRouter(prefix="/events", tags=["events"])
 @router.post("/", response_model=EventRead, status_code=201)
 async def create_event(
     event_data: EventCreateRequest,
-    current_user: User = Depends(require_verified_creator),
+    current_user: Principal = Depends(require_verified_creator),
     db: AsyncSession = Depends(get_session),
 ) -> EventRead:
     return await create_event_service(event_data, current_user.user_id, db)
@@ -43,7 +44,7 @@ async def create_event(
 @router.get("/featured", response_model=List[EventRead])
 async def get_featured_events(
     limit: int = Query(5, ge=1, le=20, description="Maximum number of featured events"),
-    current_user: Optional[User] = Depends(get_optional_current_user),
+    current_user: Optional[Principal] = Depends(get_optional_current_principal),
     db: AsyncSession = Depends(get_session),
 ):
     return await get_featured_events_service(
@@ -72,7 +73,7 @@ async def get_nearby_events(
 async def search_events(
     filters: EventSearchFilters = Body(default_factory=EventSearchFilters),
     limit: int = Query(100, ge=1, le=200, description="Maximum number of search results"),
-    current_user: Optional[User] = Depends(get_optional_current_user),
+    current_user: Optional[Principal] = Depends(get_optional_current_principal),
     db: AsyncSession = Depends(get_session),
 ):
     return await search_events_with_filters_service(
@@ -87,7 +88,7 @@ async def search_events(
 async def get_game_events(
     game_id: int,
     limit: int = Query(50, ge=1, le=200, description="Maximum number of related events"),
-    current_user: Optional[User] = Depends(get_optional_current_user),
+    current_user: Optional[Principal] = Depends(get_optional_current_principal),
     db: AsyncSession = Depends(get_session),
 ):
     return await get_game_events_service(
@@ -114,7 +115,7 @@ async def get_game_safety_alerts(
 @router.get("/game-channel/{game_id}", response_model=EventRead)
 async def get_or_create_game_channel(
     game_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ) -> EventRead:
     """
@@ -129,7 +130,7 @@ async def get_or_create_game_channel(
 @router.get("/by-event-id/{event_id}", response_model=EventRead)
 async def get_event_by_event_id(
     event_id: UUID,
-    _current_user: User = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ) -> EventRead:
     """Fetch a single event by its UUID.
@@ -147,29 +148,21 @@ async def get_event_by_event_id(
     res = await db.execute(select(Event).where(Event.event_id == event_id).options(*opts))
     event = res.unique().scalar_one_or_none()
 
+    matched_game_id: int | None = None
     if event is None:
-        # Synthetic uuid5 event — look for an existing GAME event row with matching game_id.
-        game_events_res = await db.execute(
-            select(Event.game_id).where(
-                Event.event_type_id == "GAME", Event.game_id.isnot(None)
+        # Synthetic uuid5 event — resolve the game_id through the indexed lookup
+        # table, then prefer an existing GAME event row for that game.
+        matched_game_id = await resolve_game_id_from_synthetic_id(db, event_id)
+        if matched_game_id is not None:
+            event_res = await db.execute(
+                select(Event)
+                .where(Event.game_id == matched_game_id, Event.event_type_id == "GAME")
+                .options(*opts)
+                .limit(1)
             )
-        )
-        for (gid,) in game_events_res.all():
-            if _uuid.uuid5(_uuid.NAMESPACE_DNS, f"game:{gid}") == event_id:
-                event_res = await db.execute(
-                    select(Event).where(Event.game_id == gid, Event.event_type_id == "GAME").options(*opts)
-                )
-                event = event_res.unique().scalar_one_or_none()
-                break
+            event = event_res.unique().scalar_one_or_none()
 
     if event is None:
-        games_res = await db.execute(select(Game.game_id))
-        matched_game_id = None
-        for (gid,) in games_res.all():
-            if _uuid.uuid5(_uuid.NAMESPACE_DNS, f"game:{gid}") == event_id:
-                matched_game_id = gid
-                break
-
         if matched_game_id is not None:
             game_res = await db.execute(
                 select(Game)
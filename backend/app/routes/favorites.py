@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
+from db.pagination import with_next_cursor
 from db.session import get_session
 from schemas.event import EventRead
-from auth import get_current_user, check_owner_or_admin
-from models.user import User
+from auth import get_current_principal, check_owner_or_admin
+from core.principal_cache import Principal
 from repositories.favorite_repo import (
     get_saved_events_service,
     delete_saved_event_service,
@@ -19,20 +20,23 @@ router = APIRouter(prefix="/users/{user_id}/favorites", tags=["favorites"])
 @router.get("/events", response_model=List[EventRead])
 async def get_saved_events(
     user_id: UUID,
+    response: Response,
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = Query(default=None, description="`X-Next-Cursor` from the previous page"),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ):
     check_owner_or_admin(user_id, current_user)
-    return await get_saved_events_service(user_id=user_id, limit=limit, offset=offset, db=db)
+    page = await get_saved_events_service(user_id=user_id, limit=limit, offset=offset, db=db, cursor=cursor)
+    return with_next_cursor(response, page)
 
 
 @router.delete("/events/{event_id}", response_model=List[EventRead])
 async def delete_saved_event(
     user_id: UUID,
     event_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ):
     check_owner_or_admin(user_id, current_user)
@@ -43,7 +47,7 @@ async def delete_saved_event(
 async def add_saved_event(
     user_id: UUID,
     event_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ):
     check_owner_or_admin(user_id, current_user)
@@ -4,7 +4,8 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from auth import get_current_user
+from auth import get_current_principal
+from core.principal_cache import Principal
 from db.session import get_session
 from models.user import User
 from repositories.friends_repo import (
@@ -30,10 +31,13 @@ router = APIRouter(prefix="/friends", tags=["friends"])
 async def search_users(
     q: str = Query(..., min_length=1, max_length=50, description="Username search query"),
     limit: int = Query(10, ge=1, le=20),
-    current_user: User = Depends(get_current_user),
+    rank: bool = Query(False, description="Order by similarity (tolerates typos) instead of username"),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ) -> List[UserSearchResult]:
-    users = await search_users_by_username(q, current_user.user_id, db, limit=limit)
+    users = await search_users_by_username(
+        q, current_user.user_id, db, limit=limit, rank_by_similarity=rank
+    )
     return [
         UserSearchResult(
             user_id=u.user_id,
@@ -55,7 +59,7 @@ async def search_users(
 )
 async def send_request(
     body: FriendRequestCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ) -> FriendRequestRead:
     req = await send_friend_request(
@@ -68,7 +72,7 @@ async def send_request(
 
 @router.get("/requests/received", response_model=List[FriendRequestRead])
 async def list_received_requests(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ) -> List[FriendRequestRead]:
     requests = await get_received_requests(user_id=current_user.user_id, db=db)
@@ -77,7 +81,7 @@ async def list_received_requests(
 
 @router.get("/requests/sent", response_model=List[FriendRequestRead])
 async def list_sent_requests(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ) -> List[FriendRequestRead]:
     requests = await get_sent_requests(user_id=current_user.user_id, db=db)
@@ -87,7 +91,7 @@ async def list_sent_requests(
 @router.patch("/requests/{request_id}/accept", response_model=FriendRequestRead)
 async def accept_request(
     request_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ) -> FriendRequestRead:
     req = await accept_friend_request(
@@ -101,7 +105,7 @@ async def accept_request(
 @router.patch("/requests/{request_id}/reject", response_model=FriendRequestRead)
 async def reject_request(
     request_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ) -> FriendRequestRead:
     req = await reject_friend_request(
@@ -118,7 +122,7 @@ async def reject_request(
 
 @router.get("", response_model=List[FriendshipRead])
 async def get_friends(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ) -> List[FriendshipRead]:
     friends = await list_friends(user_id=current_user.user_id, db=db)
@@ -128,7 +132,7 @@ async def get_friends(
 @router.delete("/{friend_user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_friend(
     friend_user_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ) -> None:
     await remove_friend(
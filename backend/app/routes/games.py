@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime
 
+from db.pagination import with_next_cursor
 from db.session import get_session
 from schemas.game import GameRead
 from repositories.game_repo import (
@@ -17,11 +18,14 @@ router = APIRouter(prefix="/games", tags=["games"])
 @router.get("/team/{team_id}", response_model=List[GameRead])
 async def get_games_by_team(
     team_id: int,
+    response: Response,
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = Query(default=None, description="`X-Next-Cursor` from the previous page"),
     db: AsyncSession = Depends(get_session),
 ):
-    return await get_games_by_team_service(team_id=team_id, limit=limit, offset=offset, db=db)
+    page = await get_games_by_team_service(team_id=team_id, limit=limit, offset=offset, db=db, cursor=cursor)
+    return with_next_cursor(response, page)
 
 
 @router.get("/{game_id}", response_model=GameRead)
@@ -31,10 +35,13 @@ async def get_game(game_id: int, db: AsyncSession = Depends(get_session)):
 
 @router.get("/", response_model=List[GameRead])
 async def list_games(
+    response: Response,
     league_id: Optional[str] = Query(default=None, description="Filter by league code"),
     date: Optional[datetime] = Query(default=None, description="Filter to games on this date (ISO 8601)"),
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = Query(default=None, description="`X-Next-Cursor` from the previous page"),
     db: AsyncSession = Depends(get_session),
 ):
-    return await list_games_service(league_id=league_id, limit=limit, offset=offset, db=db, date=date)
+    page = await list_games_service(league_id=league_id, limit=limit, offset=offset, db=db, date=date, cursor=cursor)
+    return with_next_cursor(response, page)
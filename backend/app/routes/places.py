@@ -4,7 +4,8 @@ from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Query, Response
 
-from auth import get_optional_current_user
+from auth import get_optional_current_principal
+from core.principal_cache import Principal
 from models.user import User
 from repositories.places_repo import get_nearby_places_service
 from schemas.place import PlaceRead
@@ -23,7 +24,7 @@ async def get_nearby_places(
         "restaurant,bar,hotel",
         description="Comma-separated categories: restaurant,bar,hotel",
     ),
-    _current_user: Optional[User] = Depends(get_optional_current_user),
+    _current_user: Optional[Principal] = Depends(get_optional_current_principal),
 ):
     places = await get_nearby_places_service(
         lat=lat,
@@ -1,26 +1,32 @@
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from auth import get_current_user, require_admin, require_verified_creator
+from auth import get_current_principal, require_admin, require_verified_creator
+from core.principal_cache import Principal
 from core.content_filter import clean_message
+from db.pagination import with_next_cursor
 from db.session import get_session
 from models.safety_alert import SafetyAlert
-from models.user import User
 from repositories.game_repo import GameRepository
 from repositories.venue_repo import VenueRepository
 from repositories.safety_alert_repo import SafetyAlertRepository
 from repositories.user_alert_acknowledgment_repo import UserAlertAcknowledgmentRepository
-from schemas.safety_alert import SafetyAlertCreateRequest, SafetyAlertRead, SafetyAlertUpdate
+from schemas.safety_alert import (
+    SafetyAlertAcknowledgeRequest,
+    SafetyAlertCreateRequest,
+    SafetyAlertRead,
+    SafetyAlertUpdate,
+)
 
 router = APIRouter(prefix="/safety-alerts", tags=["safety-alerts"])
 
 
 @router.get("/unacknowledged", response_model=List[SafetyAlertRead])
 async def get_unacknowledged_alerts(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ):
     repo = UserAlertAcknowledgmentRepository(db)
@@ -29,39 +35,48 @@ async def get_unacknowledged_alerts(
 
 @router.get("/history", response_model=List[SafetyAlertRead])
 async def get_alert_history(
+    response: Response,
     search: Optional[str] = Query(default=None, description="Filter by title"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = Query(default=None, description="`X-Next-Cursor` from the previous page"),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ):
     repo = UserAlertAcknowledgmentRepository(db)
-    return await repo.get_acknowledged_alerts(current_user.user_id, search=search, limit=limit, offset=offset)
+    page = await repo.get_acknowledged_alerts(
+        current_user.user_id, search=search, limit=limit, offset=offset, cursor=cursor
+    )
+    return with_next_cursor(response, page)
 
 
 @router.get("/", response_model=List[SafetyAlertRead])
 async def list_alerts(
+    response: Response,
     game_id: Optional[int] = Query(default=None, description="Filter by game ID"),
     source: Optional[str] = Query(default=None, description="Filter by source (admin or user)"),
     active_only: bool = Query(default=True, description="Only return active alerts"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    _current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = Query(default=None, description="`X-Next-Cursor` from the previous page"),
+    _current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ):
     repo = SafetyAlertRepository(db)
-    return await repo.list(
+    page = await repo.list(
         game_id=game_id,
         source=source,
         active_only=active_only,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
+    return with_next_cursor(response, page)
 
 
 @router.get("/mine", response_model=List[SafetyAlertRead])
 async def get_my_alerts(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ):
     """Returns all alerts created by the current user."""
@@ -72,7 +87,7 @@ async def get_my_alerts(
 @router.get("/{alert_id}", response_model=SafetyAlertRead)
 async def get_alert(
     alert_id: UUID,
-    _current_user: User = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ):
     repo = SafetyAlertRepository(db)
@@ -85,7 +100,7 @@ async def get_alert(
 @router.post("/", response_model=SafetyAlertRead, status_code=status.HTTP_201_CREATED)
 async def create_alert(
     alert_data: SafetyAlertCreateRequest,
-    current_user: User = Depends(require_verified_creator),
+    current_user: Principal = Depends(require_verified_creator),
     db: AsyncSession = Depends(get_session),
 ):
     source = "admin" if current_user.role == "admin" else "user"
@@ -134,7 +149,7 @@ async def create_alert(
 async def update_alert(
     alert_id: UUID,
     alert_data: SafetyAlertUpdate,
-    _admin: User = Depends(require_admin),
+    _admin: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_session),
 ):
     repo = SafetyAlertRepository(db)
@@ -153,7 +168,7 @@ async def update_alert(
 @router.delete("/{alert_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_alert(
     alert_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ):
     repo = SafetyAlertRepository(db)
@@ -173,23 +188,22 @@ async def delete_alert(
 
 @router.post("/acknowledge-all", status_code=status.HTTP_200_OK)
 async def acknowledge_all_non_official(
-    current_user: User = Depends(get_current_user),
+    request: Optional[SafetyAlertAcknowledgeRequest] = None,
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ):
-    """Acknowledge all non-official unacknowledged alerts for the current user."""
+    """Acknowledge the given alerts, or all non-official unacknowledged alerts, for the current user."""
     ack_repo = UserAlertAcknowledgmentRepository(db)
-    alerts = await ack_repo.get_unacknowledged_alerts(current_user.user_id)
-    for alert in alerts:
-        if not alert.is_official:
-            await ack_repo.acknowledge(current_user.user_id, alert.alert_id)
+    alert_ids = request.alert_ids if request is not None else None
+    acknowledged = await ack_repo.acknowledge_many(current_user.user_id, alert_ids)
     await db.commit()
-    return {"detail": f"Acknowledged {sum(1 for a in alerts if not a.is_official)} alerts"}
+    return {"detail": f"Acknowledged {acknowledged} alerts", "acknowledged": acknowledged}
 
 
 @router.post("/{alert_id}/acknowledge", status_code=status.HTTP_201_CREATED)
 async def acknowledge_alert(
     alert_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ):
     alert_repo = SafetyAlertRepository(db)
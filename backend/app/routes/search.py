@@ -4,8 +4,8 @@ from db.session import get_session
 from schemas.search import SearchResult
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from auth import get_optional_current_user
-from models.user import User
+from auth import get_optional_current_principal
+from core.principal_cache import Principal
 
 
 router = APIRouter(prefix="/search", tags=["search"])
@@ -14,7 +14,7 @@ router = APIRouter(prefix="/search", tags=["search"])
 async def search(
     query: str = Query(..., min_length=1, description="Search query string"),
     limit: int = Query(7, ge=1, le=20, description="Maximum number of results"),
-    current_user: Optional[User] = Depends(get_optional_current_user),
+    current_user: Optional[Principal] = Depends(get_optional_current_principal),
     db: AsyncSession = Depends(get_session)
 ):
     return await search_service(
@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
+from db.pagination import with_next_cursor
 from db.session import get_session
 from schemas.team import TeamCreate, TeamRead, TeamUpdate
 from auth import require_admin
-from models.user import User
+from core.principal_cache import Principal
 from repositories.team_repo import (
     get_teams_service,
     get_team_service,
@@ -19,19 +20,25 @@ router = APIRouter(prefix="/teams", tags=["teams"])
 
 @router.get("/", response_model=List[TeamRead])
 async def get_teams(
+    response: Response,
     league_id: Optional[str] = Query(default=None, description="Filter by league code"),
     search: Optional[str] = Query(default=None, min_length=3, description="Search term for team name or location (minimum 3 characters)"),
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
+    rank: bool = Query(default=False, description="Order search results by similarity (tolerates typos) instead of name"),
+    cursor: Optional[str] = Query(default=None, description="`X-Next-Cursor` from the previous page; not used with `rank`"),
     db: AsyncSession = Depends(get_session),
 ):
-    return await get_teams_service(
+    page = await get_teams_service(
         league_id=league_id,
         search=search,
         limit=limit,
         offset=offset,
         db=db,
+        rank_by_similarity=rank,
+        cursor=cursor,
     )
+    return with_next_cursor(response, page)
 
 
 @router.get("/{team_id}", response_model=TeamRead)
@@ -45,7 +52,7 @@ async def get_team(
 @router.post("/", response_model=TeamRead, status_code=status.HTTP_201_CREATED)
 async def create_team(
     team_data: TeamCreate,
-    _admin: User = Depends(require_admin),
+    _admin: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_session),
 ):
     return await create_team_service(team_data=team_data, db=db)
@@ -55,7 +62,7 @@ async def create_team(
 async def update_team(
     team_id: int,
     team_data: TeamUpdate,
-    _admin: User = Depends(require_admin),
+    _admin: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_session),
 ):
     return await update_team_service(team_id=team_id, team_data=team_data, db=db)
@@ -64,7 +71,7 @@ async def update_team(
 @router.delete("/{team_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_team(
     team_id: int,
-    _admin: User = Depends(require_admin),
+    _admin: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_session),
 ):
     await delete_team_service(team_id=team_id, db=db)
@@ -5,8 +5,8 @@ from uuid import UUID
 
 from db.session import get_session
 from schemas.team import TeamRead
-from auth import get_current_user, check_owner_or_admin
-from models.user import User
+from auth import get_current_principal, check_owner_or_admin
+from core.principal_cache import Principal
 from repositories.user_favorite_team_repo import (
     get_user_favorite_teams_service,
     add_favorite_team_service,
@@ -20,7 +20,7 @@ router = APIRouter(prefix="/users/{user_id}/favorite-teams", tags=["user-favorit
 @router.get("/", response_model=List[TeamRead])
 async def get_user_favorite_teams(
     user_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ):
     check_owner_or_admin(user_id, current_user)
@@ -31,7 +31,7 @@ async def get_user_favorite_teams(
 async def add_favorite_team(
     user_id: UUID,
     team_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ):
     check_owner_or_admin(user_id, current_user)
@@ -42,7 +42,7 @@ async def add_favorite_team(
 async def replace_favorite_teams(
     user_id: UUID,
     team_ids: List[int],
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ):
     check_owner_or_admin(user_id, current_user)
@@ -53,7 +53,7 @@ async def replace_favorite_teams(
 async def remove_favorite_team(
     user_id: UUID,
     team_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session),
 ):
     check_owner_or_admin(user_id, current_user)
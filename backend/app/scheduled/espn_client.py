@@ -1,31 +1,149 @@
 import httpx
+import json
 import logging
-from typing import Optional
+import os
+import tempfile
+from typing import Any, BinaryIO, Iterator, Optional
+
+from core.config import settings
+from scheduled.fetch_scheduler import FetchScheduler
+from scheduled.json_stream import iter_array_items
+from scheduled.response_cache import ResponseCache, content_hash
 
 logger = logging.getLogger(__name__)
 
 
+class ESPNPayload:
+    """A downloaded response body plus whether it differs from the last applied copy.
+
+    ``changed`` is only tracked for payloads fetched with ``track_applied``
+    (the teams list); schedule payloads always report changed, since the
+    per-window fingerprints in ``scheduled.sync_windows`` decide what to write.
+
+    The body stays on disk (or in a spooled temp file); ``data`` decodes it
+    whole, ``iter_items`` streams one array's elements.
+    """
+
+    def __init__(self, body: BinaryIO, cache_key: Optional[str], content_hash: str, changed: bool):
+        self._body = body
+        self.cache_key = cache_key
+        self.content_hash = content_hash
+        self.changed = changed
+
+    @property
+    def data(self) -> dict:
+        self._body.seek(0)
+        return json.load(self._body)
+
+    def iter_items(self, key: str) -> Iterator[Any]:
+        self._body.seek(0)
+        return iter_array_items(self._body, key)
+
+    def close(self) -> None:
+        self._body.close()
+
+
+def default_response_cache() -> Optional[ResponseCache]:
+    if not settings.espn_response_cache:
+        return None
+    directory = settings.espn_response_cache_dir or os.path.join(tempfile.gettempdir(), "away-game-espn")
+    try:
+        cache = ResponseCache(directory)
+    except OSError as e:
+        logger.warning(f"ESPN response cache disabled, cannot use {directory}: {e}")
+        return None
+    pruned = cache.prune(settings.espn_response_cache_max_age_days * 86400)
+    if pruned:
+        logger.info(f"Pruned {pruned} stale ESPN response cache file(s)")
+    return cache
+
+
 class ESPNClient:
 
     BASE_URL = "https://site.api.espn.com/apis/site/v2/sports"
 
-    def __init__(self, timeout: float = 30.0):
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        scheduler: Optional[FetchScheduler] = None,
+        cache: Optional[ResponseCache] = None,
+        base_url: Optional[str] = None,
+    ):
 
         self.client = httpx.AsyncClient(
             timeout=timeout,
             follow_redirects=True
         )
+        # Shared by every league so per-host limits hold across the whole run.
+        self.scheduler = scheduler or FetchScheduler()
+        self.cache = cache if cache is not None else default_response_cache()
+        self.base_url = base_url or self.BASE_URL
+
+    async def _get_payload(self, url: str, params: dict, *, track_applied: bool = True) -> ESPNPayload:
+        """Conditional GET through the response cache, streaming the body to disk.
+
+        With *track_applied*, ``changed`` compares against the hash recorded
+        by ``mark_applied``; otherwise every payload reports changed.
+        """
+        key = ResponseCache.key(url, params) if self.cache else None
+        meta = self.cache.load(key) if key else None
+        if meta is not None and not self.cache.body_path(key).exists():
+            meta = None
+
+        headers = {}
+        if meta is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        # Without a cache, bodies spill to disk past 1 MB rather than staying in memory.
+        spooled = self.cache.spool_file() if key else tempfile.SpooledTemporaryFile(max_size=1 << 20)
+        try:
+            response = await self.scheduler.download(self.client, url, spooled, params=params, headers=headers)
+            if response.status_code == 304 and meta is not None:
+                spooled.close()
+                os.unlink(spooled.name)
+                self.cache.touch(key)
+                digest, body = meta["content_hash"], open(self.cache.body_path(key), "rb")
+            else:
+                response.raise_for_status()
+                if key:
+                    digest, path = self.cache.store(
+                        key,
+                        spooled,
+                        url=url,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                    )
+                    body = open(path, "rb")
+                else:
+                    digest, body = content_hash(spooled), spooled
+        except BaseException:
+            spooled.close()
+            if key and os.path.exists(spooled.name):
+                os.unlink(spooled.name)
+            raise
 
-    async def get_teams(self, espn_sport: str, espn_league: str) -> dict:
+        changed = not track_applied or meta is None or meta.get("applied_hash") != digest
+        return ESPNPayload(body, key, digest, changed)
 
-        url = f"{self.BASE_URL}/{espn_sport}/{espn_league}/teams"
+    def mark_applied(self, *payloads: ESPNPayload) -> None:
+        """Record that these payloads' rows are committed; identical ones will report unchanged."""
+        if not self.cache:
+            return
+        for payload in payloads:
+            if payload.cache_key:
+                self.cache.mark_applied(payload.cache_key, payload.content_hash)
+
+    async def get_teams(self, espn_sport: str, espn_league: str) -> ESPNPayload:
+
+        url = f"{self.base_url}/{espn_sport}/{espn_league}/teams"
 
         try:
-            response = await self.client.get(url, params={"limit": 1000})
-            response.raise_for_status()
-            data = response.json()
-            logger.info(f"Successfully fetched {espn_league} teams")
-            return data
+            payload = await self._get_payload(url, {"limit": 1000})
+            logger.info(f"Successfully fetched {espn_league} teams (changed={payload.changed})")
+            return payload
 
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error fetching {espn_league} teams: {e.response.status_code} - {e.response.text}")
@@ -41,10 +159,10 @@ class ESPNClient:
 
     async def get_team_detail(self, espn_sport: str, espn_league: str, espn_team_id: int) -> dict:
 
-        url = f"{self.BASE_URL}/{espn_sport}/{espn_league}/teams/{espn_team_id}"
+        url = f"{self.base_url}/{espn_sport}/{espn_league}/teams/{espn_team_id}"
 
         try:
-            response = await self.client.get(url)
+            response = await self.scheduler.get(self.client, url)
             response.raise_for_status()
             return response.json()
 
@@ -56,9 +174,9 @@ class ESPNClient:
             logger.error(f"Error fetching team {espn_team_id}: {e}")
             raise
 
-    async def get_schedule(self, espn_sport: str, espn_league: str, dates: Optional[str] = None, groups: Optional[str] = None) -> dict:
+    async def get_schedule(self, espn_sport: str, espn_league: str, dates: Optional[str] = None, groups: Optional[str] = None) -> ESPNPayload:
 
-        url = f"{self.BASE_URL}/{espn_sport}/{espn_league}/scoreboard"
+        url = f"{self.base_url}/{espn_sport}/{espn_league}/scoreboard"
         params = {"limit": 1000}
         if dates:
             params["dates"] = dates
@@ -68,13 +186,11 @@ class ESPNClient:
         logger.info(f"Fetching {espn_league} schedule from {url} with params: {params}")
 
         try:
-            response = await self.client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            event_count = len(data.get('events', []))
-            logger.info(f"Successfully fetched {espn_league} schedule with {event_count} games")
-            return data
+            # Events are streamed from the body by the caller; it is never decoded whole here.
+            # Window fingerprints, not the applied hash, decide what changed.
+            payload = await self._get_payload(url, params, track_applied=False)
+            logger.info(f"Successfully fetched {espn_league} schedule")
+            return payload
 
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error fetching {espn_league} schedule: {e.response.status_code} - {e.response.text}")
@@ -88,6 +204,37 @@ class ESPNClient:
             logger.error(f"Unexpected error fetching {espn_league} schedule: {e}")
             raise
 
+    async def get_event(self, espn_sport: str, espn_league: str, event_id: int) -> Optional[dict]:
+        """One game by id, shaped like a scoreboard event; None if ESPN no longer lists it."""
+
+        url = f"{self.base_url}/{espn_sport}/{espn_league}/summary"
+
+        try:
+            response = await self.scheduler.get(self.client, url, params={"event": event_id})
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            data = response.json()
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error fetching {espn_league} event {event_id}: {e.response.status_code}")
+            raise
+
+        except Exception as e:
+            logger.error(f"Error fetching {espn_league} event {event_id}: {e}")
+            raise
+
+        header = data.get("header") or {}
+        competitions = header.get("competitions") or []
+        if not competitions or not competitions[0].get("date"):
+            return None
+        competition = dict(competitions[0])
+        # The summary keeps the venue under gameInfo rather than on the competition.
+        venue = (data.get("gameInfo") or {}).get("venue")
+        if venue and not competition.get("venue"):
+            competition["venue"] = venue
+        return {"id": header.get("id", event_id), "date": competition["date"], "competitions": [competition]}
+
     async def close(self):
 
         await self.client.aclose()
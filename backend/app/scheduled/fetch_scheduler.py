@@ -0,0 +1,112 @@
+"""
+Bounded HTTP fetch scheduler for the nightly scraper
+====================================================
+
+Leagues scrape concurrently and each league fans out its own requests (team
+details, NCAAB day-by-day schedules), so every outbound call goes through one
+``FetchScheduler``:
+
+- **Per-host limit** — at most ``per_host_limit`` requests in flight to any
+  one host, however many leagues are running.
+- **Retry** — timeouts, connection errors, 429 and 5xx responses are retried
+  up to ``max_attempts`` times with exponential backoff and full jitter.  A
+  ``Retry-After`` header, when present, is honoured instead.
+
+Other 4xx responses are returned as-is for the caller to raise.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from collections import defaultdict
+from typing import Any, Awaitable, BinaryIO, Callable
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class FetchScheduler:
+    def __init__(
+        self,
+        per_host_limit: int = 4,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 10.0,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._host_slots: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(per_host_limit)
+        )
+
+    async def get(self, client: httpx.AsyncClient, url: str, **kwargs: Any) -> httpx.Response:
+        async def send() -> httpx.Response:
+            return await client.get(url, **kwargs)
+
+        return await self._with_retries(url, send)
+
+    async def download(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        sink: BinaryIO,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """GET streaming a 2xx body into *sink* (rewound on each retry).
+
+        The returned response's body is not loaded for 2xx; other statuses
+        are read in full so callers can log them.
+        """
+        async def send() -> httpx.Response:
+            sink.seek(0)
+            sink.truncate()
+            async with client.stream("GET", url, **kwargs) as response:
+                if response.is_success:
+                    async for chunk in response.aiter_bytes():
+                        sink.write(chunk)
+                else:
+                    await response.aread()
+                return response
+
+        return await self._with_retries(url, send)
+
+    async def _with_retries(self, url: str, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        host = httpx.URL(url).host
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                async with self._host_slots[host]:
+                    response = await send()
+            except (httpx.TimeoutException, httpx.TransportError) as e:
+                if attempt == self.max_attempts:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"GET {url} failed ({e!r}); retry {attempt}/{self.max_attempts - 1} in {delay:.1f}s")
+            else:
+                if response.status_code not in RETRYABLE_STATUS or attempt == self.max_attempts:
+                    return response
+                delay = self._retry_after(response) or self._backoff(attempt)
+                logger.warning(
+                    f"GET {url} returned {response.status_code}; "
+                    f"retry {attempt}/{self.max_attempts - 1} in {delay:.1f}s"
+                )
+            # Sleep outside the host slot so other requests keep flowing.
+            await asyncio.sleep(delay)
+        raise AssertionError("unreachable")
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def _retry_after(self, response: httpx.Response) -> float | None:
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return min(self.max_delay, max(0.0, float(value)))
+        except ValueError:
+            return None
@@ -0,0 +1,230 @@
+"""
+Venue geocoding
+===============
+
+Scraping used to geocode each new venue inline: a 1.1 s sleep and a blocking
+Nominatim call (two with the city/state fallback) per venue, repeated every
+night for venues Nominatim could not place.  Now:
+
+- Answers are stored in ``geocode_cache`` under a normalized query string,
+  misses included (with a shorter TTL), so a query is sent at most once per
+  TTL.
+- ``GeocodeQueue.cached`` answers whatever the cache already knows in one
+  read; the scraper writes those coordinates along with the venue row.
+- Everything else is ``enqueue``d once the venue row is committed.  A single
+  background worker calls the geocoder on its own thread, at most once per
+  ``geocode_min_interval_seconds``, and fills in the venue's coordinates when
+  an answer arrives — the schedule ingest never waits on Nominatim.
+
+The geocoder (``lookup``) and persistence (``store``) are injectable so the
+queue can be exercised with a stub geocoder and an in-memory store.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Optional, Protocol
+
+from geopy.geocoders import Nominatim
+
+from core.config import settings
+from repositories.geocode_cache_repo import Coordinates
+
+logger = logging.getLogger(__name__)
+
+# (name, city, state) as scraped from ESPN.
+VenueQuery = tuple[str, Optional[str], Optional[str]]
+
+_nominatim = Nominatim(user_agent="away-game-scraper")
+
+# Returned by a lookup that errored; unlike a miss it is not cached.
+_FAILED = object()
+_UNKNOWN = object()
+
+
+def normalize_query(query: str) -> str:
+    return re.sub(r"\s+", " ", query).strip().lower()
+
+
+def venue_queries(name: str, city: Optional[str], state: Optional[str]) -> list[str]:
+    """The full query, then the city/state fallback (deduplicated, non-empty)."""
+    query = ", ".join(filter(None, [name, city, state]))
+    fallback = ", ".join(filter(None, [city, state]))
+    return [q for q in dict.fromkeys([query, fallback]) if q]
+
+
+def nominatim_lookup(query: str) -> Optional[Coordinates]:
+    location = _nominatim.geocode(query, timeout=10)
+    return (location.latitude, location.longitude) if location else None
+
+
+class GeocodeStore(Protocol):
+    async def get(self, query_keys: Iterable[str]) -> dict[str, Optional[Coordinates]]: ...
+
+    async def put(self, query_key: str, coordinates: Optional[Coordinates], ttl_seconds: float) -> None: ...
+
+    async def fill_venue(self, venue_id: int, coordinates: Coordinates) -> None: ...
+
+
+class DbGeocodeStore:
+    """``geocode_cache`` and ``venues``, each call in its own short session."""
+
+    async def get(self, query_keys: Iterable[str]) -> dict[str, Optional[Coordinates]]:
+        from db.session import AsyncSessionLocal
+        from repositories.geocode_cache_repo import GeocodeCacheRepository
+
+        async with AsyncSessionLocal() as session:
+            return await GeocodeCacheRepository(session).get_fresh(query_keys)
+
+    async def put(self, query_key: str, coordinates: Optional[Coordinates], ttl_seconds: float) -> None:
+        from db.session import AsyncSessionLocal
+        from repositories.geocode_cache_repo import GeocodeCacheRepository
+
+        async with AsyncSessionLocal() as session:
+            await GeocodeCacheRepository(session).put(query_key, coordinates, ttl_seconds)
+            await session.commit()
+
+    async def fill_venue(self, venue_id: int, coordinates: Coordinates) -> None:
+        from db.session import AsyncSessionLocal
+        from repositories.venue_repo import VenueRepository
+
+        async with AsyncSessionLocal() as session:
+            await VenueRepository(session).fill_coordinates(venue_id, *coordinates)
+            await session.commit()
+
+
+class GeocodeQueue:
+    def __init__(
+        self,
+        store: Optional[GeocodeStore] = None,
+        lookup: Callable[[str], Optional[Coordinates]] = nominatim_lookup,
+        *,
+        min_interval: float = settings.geocode_min_interval_seconds,
+        ttl_seconds: float = settings.geocode_ttl_days * 86400,
+        miss_ttl_seconds: float = settings.geocode_miss_ttl_days * 86400,
+    ):
+        self._store = store if store is not None else DbGeocodeStore()
+        self._lookup = lookup
+        self.min_interval = min_interval
+        self.ttl_seconds = ttl_seconds
+        self.miss_ttl_seconds = miss_ttl_seconds
+        self._queue: asyncio.Queue[tuple[int, VenueQuery]] = asyncio.Queue()
+        self._pending: set[int] = set()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="geocode")
+        self._worker: Optional[asyncio.Task] = None
+        self._last_lookup: Optional[float] = None
+        self.lookups = 0
+        self.filled = 0
+        self.not_found = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def cached(self, venues: dict[int, VenueQuery]) -> dict[int, Optional[Coordinates]]:
+        """Cached answers for *venues* in one read.
+
+        Venues the cache cannot settle are absent from the result; ``None``
+        means every query for the venue is a cached miss.
+        """
+        keys_by_venue = {
+            venue_id: [normalize_query(q) for q in venue_queries(*query)]
+            for venue_id, query in venues.items()
+        }
+        known = await self._store.get({key for keys in keys_by_venue.values() for key in keys})
+        answers = {}
+        for venue_id, keys in keys_by_venue.items():
+            answer = _resolve(keys, known)
+            if answer is not _UNKNOWN:
+                answers[venue_id] = answer
+        return answers
+
+    def enqueue(self, venues: dict[int, VenueQuery]) -> None:
+        """Geocode *venues* in the background; their rows must already be committed."""
+        for venue_id, query in venues.items():
+            if venue_id in self._pending:
+                continue
+            self._pending.add(venue_id)
+            self._queue.put_nowait((venue_id, query))
+        if self._pending and (self._worker is None or self._worker.done()):
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued venues; False if *timeout* expired first."""
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def close(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self) -> None:
+        while True:
+            venue_id, query = await self._queue.get()
+            try:
+                await self._geocode(venue_id, query)
+            except Exception as e:
+                logger.warning(f"Geocoding venue {venue_id} failed: {e}")
+            finally:
+                self._pending.discard(venue_id)
+                self._queue.task_done()
+
+    async def _geocode(self, venue_id: int, query: VenueQuery) -> None:
+        queries = venue_queries(*query)
+        for text in queries:
+            key = normalize_query(text)
+            # An earlier job in this run may already have answered this query.
+            known = await self._store.get([key])
+            if key in known:
+                coordinates = known[key]
+            else:
+                coordinates = await self._rate_limited_lookup(text)
+                if coordinates is _FAILED:
+                    return
+                ttl = self.ttl_seconds if coordinates is not None else self.miss_ttl_seconds
+                await self._store.put(key, coordinates, ttl)
+            if coordinates is not None:
+                await self._store.fill_venue(venue_id, coordinates)
+                self.filled += 1
+                logger.info(f"Geocoded venue {venue_id} '{queries[0]}': {coordinates}")
+                return
+        self.not_found += 1
+        if queries:
+            logger.warning(f"Geocoding returned no results for '{queries[0]}'")
+
+    async def _rate_limited_lookup(self, text: str):
+        if self._last_lookup is not None:
+            wait = self._last_lookup + self.min_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        self.lookups += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._lookup, text)
+        except Exception as e:
+            logger.warning(f"Geocoding failed for '{text}': {e}")
+            return _FAILED
+        finally:
+            self._last_lookup = time.monotonic()
+
+
+def _resolve(keys: list[str], known: dict[str, Optional[Coordinates]]):
+    """First cached hit in query order; None if all are cached misses."""
+    for key in keys:
+        if key not in known:
+            return _UNKNOWN
+        if known[key] is not None:
+            return known[key]
+    return None
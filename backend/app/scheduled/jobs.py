@@ -0,0 +1,211 @@
+"""
+Nightly scrape jobs
+===================
+
+The timer trigger and ``POST /admin/leagues/sync`` both go through here
+instead of calling ``run_nightly_task`` directly:
+
+- **Job row** — ``start_nightly_job`` queues a ``scrape_jobs`` row, or hands
+  back the one already queued/running (a partial unique index allows one per
+  kind), so a second trigger never starts a second scrape.
+- **Advisory lock** — ``run_job`` holds ``pg_try_advisory_lock`` on its own
+  connection for the whole run.  A worker that loses the race logs and
+  returns; a worker that dies drops its connection and with it the lock.
+- **Checkpoints** — every league's outcome is written to the job's
+  ``checkpoint`` as it finishes (``JobProgress``).  A running job whose
+  heartbeat has gone stale was lost with its worker; the next trigger
+  resumes it and skips leagues already recorded as done.  A job stale for
+  longer than ``RESUME_WINDOW`` is marked failed and a fresh one started.
+
+Status and progress are served by ``GET /admin/jobs`` and
+``GET /admin/jobs/{job_id}``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from sqlalchemy import text
+
+from db.session import AsyncSessionLocal, async_engine
+from models.scrape_job import ScrapeJob
+from repositories.scrape_job_repo import ScrapeJobRepository
+
+logger = logging.getLogger(__name__)
+
+# Arbitrary constant shared by every worker; identifies the nightly scrape lock.
+NIGHTLY_LOCK_KEY = 0x41574731
+HEARTBEAT_SECONDS = 60
+STALE_AFTER = timedelta(minutes=10)
+RESUME_WINDOW = timedelta(hours=6)
+
+# Keeps fire-and-forget job tasks referenced until they finish.
+_background_tasks: set[asyncio.Task] = set()
+
+
+@asynccontextmanager
+async def advisory_lock(key: int) -> AsyncIterator[bool]:
+    """Try a session-level advisory lock on a dedicated connection; yields whether it was acquired."""
+    async with async_engine.connect() as conn:
+        acquired = (await conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": key})).scalar_one()
+        # The lock outlives the transaction; don't sit idle in one for the whole run.
+        await conn.commit()
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                await conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+                await conn.commit()
+
+
+class JobProgress:
+    """Checkpoint writer handed to ``run_nightly_task``; each write is its own short session."""
+
+    def __init__(self, job_id: UUID, completed: set[str]):
+        self.job_id = job_id
+        self.completed = completed
+
+    async def started(self, leagues_total: int) -> None:
+        async with AsyncSessionLocal() as session:
+            await ScrapeJobRepository(session).mark_running(self.job_id, leagues_total)
+            await session.commit()
+
+    async def league_done(self, league_code: str, stats: dict, seconds: float) -> None:
+        await self._record(league_code, {"status": "done", "seconds": round(seconds, 2), **stats}, done=True)
+
+    async def league_failed(self, league_code: str, error: str, seconds: float) -> None:
+        await self._record(league_code, {"status": "failed", "seconds": round(seconds, 2), "error": error}, done=False)
+
+    async def stage(self, name: str) -> None:
+        await self.set("stage", name)
+
+    async def set(self, key: str, value) -> None:
+        try:
+            async with AsyncSessionLocal() as session:
+                await ScrapeJobRepository(session).set_checkpoint_value(self.job_id, key, value)
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"Scrape job {self.job_id}: could not record {key}: {e}")
+
+    async def heartbeat(self) -> None:
+        async with AsyncSessionLocal() as session:
+            await ScrapeJobRepository(session).heartbeat(self.job_id)
+            await session.commit()
+
+    async def _record(self, league_code: str, entry: dict, done: bool) -> None:
+        # A lost checkpoint only means the league is redone on resume; never
+        # let it take down the other leagues' tasks.
+        entry["finished_at"] = datetime.now(timezone.utc).isoformat()
+        try:
+            async with AsyncSessionLocal() as session:
+                await ScrapeJobRepository(session).record_league(self.job_id, league_code, entry, done)
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"Scrape job {self.job_id}: could not checkpoint {league_code}: {e}")
+            return
+        if done:
+            self.completed.add(league_code)
+
+
+def _is_stale(job: ScrapeJob, now: datetime, after: timedelta) -> bool:
+    last_seen = job.heartbeat_at or job.created_at
+    return job.status == "running" and now - last_seen > after
+
+
+async def start_nightly_job(trigger: str, full_refresh: bool = False) -> tuple[ScrapeJob, bool]:
+    """The job to report for this trigger, and whether the caller should run it.
+
+    A live job is returned as-is (False).  A new job, or a crashed one still
+    within ``RESUME_WINDOW``, is returned for the caller to ``run_job`` (True).
+    """
+    async with AsyncSessionLocal() as session:
+        repo = ScrapeJobRepository(session)
+        now = datetime.now(timezone.utc)
+        active = await repo.find_active()
+        if active is not None:
+            if _is_stale(active, now, RESUME_WINDOW):
+                logger.warning(f"Abandoning scrape job {active.job_id}; no heartbeat since {active.heartbeat_at}")
+                await repo.finish(active.job_id, "failed", error="abandoned: worker stopped responding")
+                await session.commit()
+            else:
+                return active, active.status == "queued" or _is_stale(active, now, STALE_AFTER)
+
+        job = await repo.create(trigger, full_refresh)
+        await session.commit()
+        if job is None:
+            # Lost a race with another trigger; report the job that won.
+            active = await repo.find_active()
+            return active, False
+        return job, True
+
+
+async def run_job(job_id: UUID) -> Optional[str]:
+    """Run (or resume) *job_id* under the nightly advisory lock; returns its outcome, None if not run."""
+    from scheduled.nightly_tasks import run_nightly_task
+
+    async with advisory_lock(NIGHTLY_LOCK_KEY) as acquired:
+        if not acquired:
+            logger.info(f"Scrape job {job_id}: another worker holds the nightly lock, not starting")
+            return None
+
+        async with AsyncSessionLocal() as session:
+            job = await ScrapeJobRepository(session).get(job_id)
+            if job is None or job.status not in ("queued", "running"):
+                return None
+            full_refresh = job.full_refresh
+            completed = {
+                code for code, entry in job.checkpoint.get("leagues", {}).items() if entry.get("status") == "done"
+            }
+        if completed:
+            logger.info(f"Resuming scrape job {job_id}; skipping {len(completed)} finished league(s)")
+
+        progress = JobProgress(job_id, completed)
+        heartbeat = asyncio.create_task(_heartbeat(progress))
+        outcome, error = "succeeded", None
+        try:
+            await run_nightly_task(full_refresh=full_refresh, progress=progress)
+        except Exception as e:
+            outcome, error = "failed", f"{type(e).__name__}: {e}"
+        finally:
+            # A cancelled run skips the write below and stays 'running'; once
+            # its heartbeat goes stale the next trigger resumes it.
+            heartbeat.cancel()
+        async with AsyncSessionLocal() as session:
+            await ScrapeJobRepository(session).finish(job_id, outcome, error)
+            await session.commit()
+        logger.info(f"Scrape job {job_id} {outcome}")
+        return outcome
+
+
+async def _heartbeat(progress: JobProgress) -> None:
+    # League checkpoints also beat; this covers long stretches without one
+    # (maintenance, the geocoding drain).
+    while True:
+        await asyncio.sleep(HEARTBEAT_SECONDS)
+        try:
+            await progress.heartbeat()
+        except Exception as e:
+            logger.warning(f"Scrape job {progress.job_id} heartbeat failed: {e}")
+
+
+def launch(job_id: UUID) -> None:
+    """Run *job_id* in the background of this worker."""
+    task = asyncio.create_task(run_job(job_id))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def run_scheduled_nightly() -> Optional[UUID]:
+    """Timer entry point: run tonight's job unless one is already live."""
+    job, should_run = await start_nightly_job("timer")
+    if not should_run:
+        logger.info(f"Scrape job {job.job_id} is already {job.status}; timer run skipped")
+        return None
+    if await run_job(job.job_id) == "failed":
+        raise RuntimeError(f"Scrape job {job.job_id} failed")
+    return job.job_id
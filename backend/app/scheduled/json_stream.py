@@ -0,0 +1,103 @@
+"""
+Incremental JSON array reader
+=============================
+
+``iter_array_items(fh, "events")`` yields the elements of the top-level
+``"events"`` array in a JSON object one at a time, reading *fh* in fixed-size
+chunks.  Only the element being decoded (plus one chunk) is held in memory,
+so a multi-megabyte scoreboard never becomes a single parsed tree.
+
+Sibling values of the target key are decoded and discarded as they are
+passed.  Elements are decoded with ``json.JSONDecoder.raw_decode``; when an
+element runs past the buffered text, another chunk is read and the element
+is decoded again from its start.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any, BinaryIO, Iterator
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    def __init__(self, fh: BinaryIO, chunk_size: int):
+        self._fh = fh
+        self._chunk_size = chunk_size
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append one chunk; False once the input is exhausted."""
+        if self.eof:
+            return False
+        chunk = self._fh.read(self._chunk_size)
+        if not chunk:
+            self.eof = True
+            self.buf += self._utf8.decode(b"", final=True)
+            return False
+        # Drop consumed text so the buffer stays about one chunk long.
+        self.buf = self.buf[self.pos:] + self._utf8.decode(chunk)
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                raise ValueError("unexpected end of JSON input")
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"expected {char!r} at offset {self.pos}, found {found!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number or literal ending exactly at the buffer edge may be cut short.
+            if end == len(self.buf) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_array_items(fh: BinaryIO, key: str, chunk_size: int = 64 * 1024) -> Iterator[Any]:
+    """Yield each element of ``document[key]``; nothing if the key is absent or not an array."""
+    reader = _Reader(fh, chunk_size)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        name = reader.value()
+        reader.expect(":")
+        if name == key:
+            if reader.peek() != "[":
+                return
+            reader.expect("[")
+            if reader.peek() == "]":
+                return
+            while True:
+                yield reader.value()
+                if reader.peek() == "]":
+                    return
+                reader.expect(",")
+        reader.value()
+        if reader.peek() == "}":
+            return
+        reader.expect(",")
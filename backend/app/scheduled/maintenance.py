@@ -0,0 +1,196 @@
+"""
+Nightly maintenance
+===================
+
+Expired rows used to go in a few large ``DELETE ... WHERE id IN (subquery)``
+statements inside the scrape's own transaction, holding locks on ``events``,
+``event_chats``, ``games`` and ``safety_alerts`` for the whole run.  Each
+step here instead works through its rows ``cleanup_chunk_size`` at a time,
+committing after every chunk, until a chunk comes back short:
+
+1. Deactivate alerts that expired or whose game ended over four hours ago.
+2. Delete alerts tied to games before today (the FK would only null them).
+3. Delete events dated before today; chats and favorites go by FK cascade.
+4. Delete games before today; favorites and synthetic ids cascade, events
+   and alerts still pointing at them are nulled.
+5. Drop archived rows past ``cleanup_archive_retention_days``.
+6. Recount ``favorite_count`` on events and games whose counter drifted
+   from ``favorites`` (the counters are adjusted incrementally by the
+   favorite paths; this only corrects what slipped past them).
+
+Chunks pick rows with ``FOR UPDATE SKIP LOCKED``, so a row a user request
+holds is left for the next night instead of blocking the run.  With
+``cleanup_archive`` on, each deleted row is copied to ``archived_rows`` as
+JSON by the same statement that deletes it.
+
+``run_maintenance`` returns one report entry per step — rows, chunks and
+seconds — and logs each as it finishes.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import text
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+ALERT_GAME_GRACE = timedelta(hours=4)
+
+
+class MaintenanceStep:
+    """One chunked UPDATE or DELETE over *table*, selecting rows by *key* (a column list)."""
+
+    def __init__(
+        self,
+        name: str,
+        table: str,
+        key: str,
+        where: str,
+        *,
+        set_clause: Optional[str] = None,
+        archive: bool = False,
+    ):
+        self.name = name
+        self.table = table
+        self.key = key
+        self.where = where
+        self.set_clause = set_clause
+        self.archive = archive
+
+    def sql(self, archive: bool) -> str:
+        chunk = (
+            f"({self.key}) IN (SELECT {self.key} FROM {self.table} WHERE {self.where} "
+            "LIMIT :chunk_size FOR UPDATE SKIP LOCKED)"
+        )
+        if self.set_clause is not None:
+            return (
+                f"WITH touched AS (UPDATE {self.table} SET {self.set_clause} WHERE {chunk} RETURNING 1) "
+                "SELECT count(*) FROM touched"
+            )
+        if not (archive and self.archive):
+            return f"WITH touched AS (DELETE FROM {self.table} WHERE {chunk} RETURNING 1) SELECT count(*) FROM touched"
+        return (
+            f"WITH touched AS (DELETE FROM {self.table} WHERE {chunk} RETURNING *), "
+            "archived AS ("
+            "INSERT INTO archived_rows (source_table, row_key, payload) "
+            f"SELECT '{self.table}', {self.key}::text, to_jsonb(touched) FROM touched "
+            "ON CONFLICT (source_table, row_key) DO UPDATE "
+            "SET payload = EXCLUDED.payload, archived_at = now()"
+            ") SELECT count(*) FROM touched"
+        )
+
+
+# Order matters: alerts on past games must go before the games themselves.
+STEPS = [
+    MaintenanceStep(
+        "deactivate_alerts",
+        "safety_alerts",
+        "alert_id",
+        "is_active AND ((expires_at IS NOT NULL AND expires_at < :now_naive) "
+        "OR game_id IN (SELECT game_id FROM games WHERE date_time < :game_cutoff))",
+        set_clause="is_active = false",
+    ),
+    MaintenanceStep(
+        "purge_game_alerts",
+        "safety_alerts",
+        "alert_id",
+        "game_id IN (SELECT game_id FROM games WHERE date_time < :today)",
+        archive=True,
+    ),
+    MaintenanceStep("purge_events", "events", "event_id", "game_date < :today_naive", archive=True),
+    MaintenanceStep("purge_games", "games", "game_id", "date_time < :today", archive=True),
+    MaintenanceStep(
+        "purge_archive",
+        "archived_rows",
+        "source_table, row_key",
+        "archived_at < :archive_cutoff",
+    ),
+    MaintenanceStep(
+        "recount_event_favorites",
+        "events",
+        "event_id",
+        "event_id IN (SELECT e.event_id FROM events e LEFT JOIN "
+        "(SELECT event_id, count(*) AS n FROM favorites WHERE event_id IS NOT NULL GROUP BY event_id) c "
+        "USING (event_id) WHERE e.favorite_count <> coalesce(c.n, 0))",
+        set_clause="favorite_count = (SELECT count(*) FROM favorites WHERE favorites.event_id = events.event_id)",
+    ),
+    MaintenanceStep(
+        "recount_game_favorites",
+        "games",
+        "game_id",
+        "game_id IN (SELECT g.game_id FROM games g LEFT JOIN "
+        "(SELECT game_id, count(*) AS n FROM favorites WHERE game_id IS NOT NULL GROUP BY game_id) c "
+        "USING (game_id) WHERE g.favorite_count <> coalesce(c.n, 0))",
+        set_clause="favorite_count = (SELECT count(*) FROM favorites WHERE favorites.game_id = games.game_id)",
+    ),
+]
+
+
+def _params(now: datetime) -> dict:
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return {
+        "now_naive": now.replace(tzinfo=None),
+        "game_cutoff": now - ALERT_GAME_GRACE,
+        "today": today,
+        "today_naive": today.replace(tzinfo=None),
+        "archive_cutoff": now - timedelta(days=settings.cleanup_archive_retention_days),
+    }
+
+
+async def _run_step(session, step: MaintenanceStep, params: dict, chunk_size: int, archive: bool) -> dict:
+    statement = text(step.sql(archive))
+    bound = {**params, "chunk_size": chunk_size}
+    rows = chunks = 0
+    started = time.perf_counter()
+    while True:
+        try:
+            count = (await session.execute(statement, bound)).scalar_one()
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        rows += count
+        chunks += 1
+        if count < chunk_size:
+            break
+    return {
+        "step": step.name,
+        "table": step.table,
+        "rows": rows,
+        "chunks": chunks,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+async def run_maintenance(
+    session_factory=None,
+    *,
+    now: Optional[datetime] = None,
+    chunk_size: Optional[int] = None,
+    archive: Optional[bool] = None,
+) -> list[dict]:
+    """Run every step in order, each chunk in its own transaction."""
+    if session_factory is None:
+        from db.session import AsyncSessionLocal
+        session_factory = AsyncSessionLocal
+    now = now or datetime.now(timezone.utc)
+    chunk_size = chunk_size or settings.cleanup_chunk_size
+    archive = settings.cleanup_archive if archive is None else archive
+    params = _params(now)
+
+    report = []
+    async with session_factory() as session:
+        for step in STEPS:
+            entry = await _run_step(session, step, params, chunk_size, archive)
+            report.append(entry)
+            logger.info(
+                f"Maintenance {entry['step']}: {entry['rows']} {entry['table']} row(s) "
+                f"in {entry['chunks']} chunk(s), {entry['seconds']:.2f}s"
+            )
+    return report
@@ -2,49 +2,30 @@ import asyncio
 import json
 import logging
 import os
-from datetime import datetime, timedelta, timezone
-from functools import partial
-
-from geopy.geocoders import Nominatim
-
-from sqlalchemy import delete, select, update
+import time
+from datetime import datetime, time as day_time, timedelta, timezone
+from typing import Optional
 
+from core.cache import PostgresBackend, shared_backend
 from db.session import AsyncSessionLocal
-from models.event import Event
-from models.event_chat import EventChat
-from models.safety_alert import SafetyAlert
-from models.game import Game
 from repositories.league_repo import LeagueRepository
 from repositories.team_repo import TeamRepository
 from repositories.venue_repo import VenueRepository
 from repositories.game_repo import GameRepository
-from scheduled.espn_client import ESPNClient
+from repositories.game_synthetic_id_repo import GameSyntheticIdRepository
+from repositories.league_sync_repo import LeagueSyncRepository
+from repositories.reference_data_repo import bump_reference_version
+from repositories.geocode_cache_repo import Coordinates
+from scheduled.espn_client import ESPNClient, ESPNPayload
+from scheduled.geocoding import GeocodeQueue, VenueQuery
+from scheduled.jobs import JobProgress
+from scheduled.maintenance import run_maintenance
+from scheduled.sync_windows import SyncWindow, fingerprint, plan_windows
 
 logger = logging.getLogger(__name__)
 
-_geocoder = Nominatim(user_agent="away-game-scraper")
-
-
-async def geocode_venue(name: str, city: str | None, state: str | None) -> tuple[float | None, float | None]:
-    query = ", ".join(filter(None, [name, city, state]))
-    if not query:
-        return None, None
-    try:
-        await asyncio.sleep(1.1)  # Were rate limited: 1 request per second (its free tho)
-        loop = asyncio.get_running_loop()
-        location = await loop.run_in_executor(None, partial(_geocoder.geocode, query, timeout=10))
-        if location:
-            return location.latitude, location.longitude
-        fallback = ", ".join(filter(None, [city, state]))
-        if fallback and fallback != query:
-            await asyncio.sleep(1.1)
-            location = await loop.run_in_executor(None, partial(_geocoder.geocode, fallback, timeout=10))
-            if location:
-                return location.latitude, location.longitude
-        logger.warning(f"Geocoding returned no results for '{query}'")
-    except Exception as e:
-        logger.warning(f"Geocoding failed for '{query}': {e}")
-    return None, None
+# Upper bound on waiting for queued geocodes at the end of a run.
+GEOCODE_DRAIN_SECONDS = 300
 
 
 def load_leagues_config() -> list[dict]:
@@ -54,17 +35,92 @@ def load_leagues_config() -> list[dict]:
     return json.loads(raw)
 
 
+async def _db_step(session, db_lock: asyncio.Lock, work, *, commit: bool = False):
+    """Run *work* on the shared session while holding *db_lock*.
+
+    Leagues scrape concurrently but share one session, so every read or
+    write batch takes the lock.  Write batches commit before releasing it,
+    which keeps one league's failure from rolling back another's rows.
+    """
+    async with db_lock:
+        try:
+            result = await work()
+            if commit:
+                await session.commit()
+            return result
+        except Exception:
+            await session.rollback()
+            raise
+
+
+def _venue_query(venue_raw: dict) -> VenueQuery:
+    address = venue_raw.get("address", {})
+    return venue_raw.get("fullName", ""), address.get("city"), address.get("state")
+
+
+async def _locate_venues(
+    session,
+    db_lock: asyncio.Lock,
+    geocoder: GeocodeQueue,
+    venues_raw: dict[int, dict],
+) -> tuple[dict[int, dict], dict[int, Coordinates | None]]:
+    """Venues that are new or lack coordinates, and whatever the geocode cache knows about them."""
+    venue_repo = VenueRepository(session)
+    located = await _db_step(
+        session, db_lock, lambda: venue_repo.existing_ids(venues_raw.keys(), located_only=True)
+    )
+    unlocated = {venue_id: raw for venue_id, raw in venues_raw.items() if venue_id not in located}
+    coords = await geocoder.cached({venue_id: _venue_query(raw) for venue_id, raw in unlocated.items()})
+    return unlocated, coords
+
+
+async def _upsert_venues(
+    venue_repo: VenueRepository,
+    venues_raw: dict[int, dict],
+    coords: dict[int, Coordinates | None],
+) -> None:
+    for venue_id, venue_raw in venues_raw.items():
+        address = venue_raw.get("address", {})
+        lat, lon = coords.get(venue_id) or (None, None)
+        logger.info(f"Adding venue {venue_id} '{venue_raw.get('fullName', '')}' with lat={lat}, lon={lon}")
+        await venue_repo.upsert(
+            venue_id=venue_id,
+            name=venue_raw.get("fullName", ""),
+            city=address.get("city"),
+            state_region=address.get("state"),
+            country=address.get("country", "USA"),
+            latitude=lat,
+            longitude=lon,
+            is_indoor=venue_raw.get("indoor"),
+        )
+
+
+def _enqueue_uncached(geocoder: GeocodeQueue, venues_raw: dict[int, dict], coords: dict) -> None:
+    geocoder.enqueue({
+        venue_id: _venue_query(raw) for venue_id, raw in venues_raw.items() if venue_id not in coords
+    })
+
+
 async def scrape_teams(
     client: ESPNClient,
-    team_repo: TeamRepository,
-    venue_repo: VenueRepository,
+    session,
+    db_lock: asyncio.Lock,
+    geocoder: GeocodeQueue,
     league_code: str,
     espn_sport: str,
     espn_league: str,
 ):
     logger.info(f"Scraping {league_code} teams")
+    team_repo = TeamRepository(session)
+    venue_repo = VenueRepository(session)
 
-    data = await client.get_teams(espn_sport, espn_league)
+    payload = await client.get_teams(espn_sport, espn_league)
+    if not payload.changed:
+        payload.close()
+        logger.info(f"{league_code}: teams payload unchanged since last sync, skipping")
+        return
+    data = payload.data
+    payload.close()
 
     api_teams = []
     for sport in data.get("sports", []):
@@ -72,228 +128,348 @@ async def scrape_teams(
             for team_data in league.get("teams", []):
                 api_teams.append(team_data["team"])
 
-    db_count = await team_repo.count_by_league(league_code)
-    needs_detail = db_count < len(api_teams)
-
-    if needs_detail:
-        logger.info(f"{league_code}: DB has {db_count} teams, API has {len(api_teams)}")
-    else:
+    known_team_ids = await _db_step(session, db_lock, lambda: team_repo.map_espn_ids(league_code))
+    db_count = len(known_team_ids)
+    if db_count >= len(api_teams):
         logger.info(f"{league_code}: {db_count} teams already up to date.")
+        logger.info(f"Processed {len(api_teams)} {league_code} teams")
+        client.mark_applied(payload)
+        return
 
-    new_count = 0
-    for team_raw in api_teams:
-        espn_team_id = int(team_raw["id"])
-        logos = team_raw.get("logos", [])
-        logo_url = logos[0].get("href") if logos else None
+    logger.info(f"{league_code}: DB has {db_count} teams, API has {len(api_teams)}")
+    new_teams = [team_raw for team_raw in api_teams if int(team_raw["id"]) not in known_team_ids]
 
-        home_venue_id = None
-        if needs_detail:
-            existing = await team_repo.get_by_espn_id(espn_team_id, league_code)
-            if existing:
-                continue
-
-            try:
-                detail = await client.get_team_detail(espn_sport, espn_league, espn_team_id)
-                franchise = detail.get("team", {}).get("franchise", {})
-                venue_raw = franchise.get("venue", {})
-                if venue_raw and venue_raw.get("id"):
-                    home_venue_id = int(venue_raw["id"])
-                    address = venue_raw.get("address", {})
-                    venue_name = venue_raw.get("fullName", "")
-                    city = address.get("city")
-                    state = address.get("state")
-                    lat, lon = await geocode_venue(venue_name, city, state)
-                    logger.info(f"Adding venue {home_venue_id} '{venue_name}' with lat={lat}, lon={lon}")
-                    await venue_repo.upsert(
-                        venue_id=home_venue_id,
-                        name=venue_name,
-                        city=city,
-                        state_region=state,
-                        country=address.get("country", "USA"),
-                        latitude=lat,
-                        longitude=lon,
-                        is_indoor=venue_raw.get("indoor"),
-                    )
-            except Exception as e:
-                logger.warning(f"Could not fetch venue for {league_code} team {espn_team_id}: {e}")
+    # Detail requests fan out through the client's scheduler (per-host limit).
+    details = await asyncio.gather(
+        *(client.get_team_detail(espn_sport, espn_league, int(team_raw["id"])) for team_raw in new_teams),
+        return_exceptions=True,
+    )
 
+    home_venue_ids: list[int | None] = []
+    venues_raw: dict[int, dict] = {}
+    for team_raw, detail in zip(new_teams, details):
+        home_venue_id = None
+        try:
+            if isinstance(detail, BaseException):
+                raise detail
+            venue_raw = detail.get("team", {}).get("franchise", {}).get("venue", {})
+            if venue_raw and venue_raw.get("id"):
+                home_venue_id = int(venue_raw["id"])
+                venues_raw.setdefault(home_venue_id, venue_raw)
+        except Exception as e:
+            logger.warning(f"Could not fetch venue for {league_code} team {team_raw['id']}: {e}")
+        home_venue_ids.append(home_venue_id)
+
+    venues_raw, coords = await _locate_venues(session, db_lock, geocoder, venues_raw)
+
+    async def write():
+        await _upsert_venues(venue_repo, venues_raw, coords)
+        for team_raw, home_venue_id in zip(new_teams, home_venue_ids):
+            logos = team_raw.get("logos", [])
             await team_repo.upsert(
-                espn_team_id=espn_team_id,
+                espn_team_id=int(team_raw["id"]),
                 league_id=league_code,
                 home_location=team_raw.get("location", ""),
                 team_name=team_raw.get("name", ""),
                 display_name=team_raw.get("displayName", ""),
-                logo_url=logo_url,
+                logo_url=logos[0].get("href") if logos else None,
                 home_venue_id=home_venue_id,
             )
-            new_count += 1
 
-    if needs_detail:
-        logger.info(f"Added {new_count} new {league_code} teams")
+    await _db_step(session, db_lock, write, commit=True)
+    client.mark_applied(payload)
+    _enqueue_uncached(geocoder, venues_raw, coords)
+
+    logger.info(f"Added {len(new_teams)} new {league_code} teams")
     logger.info(f"Processed {len(api_teams)} {league_code} teams")
 
 
-async def scrape_schedule(
+async def _fetch_windows(
     client: ESPNClient,
-    team_repo: TeamRepository,
-    venue_repo: VenueRepository,
-    game_repo: GameRepository,
     league_code: str,
     espn_sport: str,
     espn_league: str,
-):
-    logger.info(f"Scraping {league_code} schedule")
+    windows: list[SyncWindow],
+) -> list[tuple[SyncWindow, ESPNPayload]]:
+    # For some reason the NCAAB API endpoint wouldnt accept a date range, so its windows are single days (groups=50 for D1)
+    groups = "50" if espn_league == "mens-college-basketball" else None
+    responses = await asyncio.gather(
+        *(
+            client.get_schedule(espn_sport, espn_league, dates=window.dates_param, groups=groups)
+            for window in windows
+        ),
+        return_exceptions=True,
+    )
+    fetched = []
+    for window, payload in zip(windows, responses):
+        if isinstance(payload, BaseException):
+            logger.warning(f"Failed to fetch {league_code} schedule for {window.dates_param}: {payload}")
+            continue
+        fetched.append((window, payload))
+    return fetched
 
-    # For some reason the NCAAB API endpoint wouldnt accept a date range. Iterating day-day for 14 days to pull the games
-    all_events = []
-    if espn_league == "mens-college-basketball":
-        for day_offset in range(14):
-            date_str = (datetime.now() + timedelta(days=day_offset)).strftime("%Y%m%d")
-            try:
-                data = await client.get_schedule(espn_sport, espn_league, dates=date_str, groups="50")
-                all_events.extend(data.get("events", []))
-            except Exception as e:
-                logger.warning(f"Failed to fetch {league_code} schedule for {date_str}: {e}")
-    else:
-        start = datetime.now().strftime("%Y%m%d")
-        end = (datetime.now() + timedelta(days=180)).strftime("%Y%m%d")
-        date_range = f"{start}-{end}"
-        data = await client.get_schedule(espn_sport, espn_league, dates=date_range)
-        all_events = data.get("events", [])
 
-    events = all_events
-    venues_count = 0
-    games_count = 0
+def _game_row(event: dict, league_code: str, team_ids: dict[int, int]) -> tuple[dict, dict | None] | None:
+    """Reduce one scoreboard event to a games row (and its raw venue), or None to skip it."""
+    game_id = int(event["id"])
+    game_datetime = datetime.fromisoformat(event["date"].replace("Z", "+00:00")).replace(tzinfo=None)
 
-    for event in events:
-        game_id = int(event["id"])
-        game_datetime = datetime.fromisoformat(event["date"].replace("Z", "+00:00")).replace(tzinfo=None)
+    competition = event["competitions"][0]
 
-        competition = event["competitions"][0]
+    home_team = next((c for c in competition["competitors"] if c["homeAway"] == "home"), None)
+    away_team = next((c for c in competition["competitors"] if c["homeAway"] == "away"), None)
 
-        home_team = next((c for c in competition["competitors"] if c["homeAway"] == "home"), None)
-        away_team = next((c for c in competition["competitors"] if c["homeAway"] == "away"), None)
+    espn_home_id = int(home_team["team"]["id"]) if home_team else None
+    espn_away_id = int(away_team["team"]["id"]) if away_team else None
 
-        espn_home_id = int(home_team["team"]["id"]) if home_team else None
-        espn_away_id = int(away_team["team"]["id"]) if away_team else None
+    if not espn_home_id or not espn_away_id:
+        logger.warning(f"Skipping game {game_id}: missing team data")
+        return None
 
-        if not espn_home_id or not espn_away_id:
-            logger.warning(f"Skipping game {game_id}: missing team data")
-            continue
+    home_team_id = team_ids.get(espn_home_id)
+    away_team_id = team_ids.get(espn_away_id)
 
-        home_team_row = await team_repo.get_by_espn_id(espn_home_id, league_code)
-        away_team_row = await team_repo.get_by_espn_id(espn_away_id, league_code)
+    if not home_team_id or not away_team_id:
+        logger.warning(f"Skipping game {game_id}: team not found (home={espn_home_id}, away={espn_away_id})")
+        return None
 
-        if not home_team_row or not away_team_row:
-            logger.warning(f"Skipping game {game_id}: team not found (home={espn_home_id}, away={espn_away_id})")
+    venue_id = None
+    venue_raw = competition.get("venue", {})
+    if venue_raw and venue_raw.get("id"):
+        venue_id = int(venue_raw["id"])
+    else:
+        venue_raw = None
+
+    row = {
+        "game_id": game_id,
+        "league_id": league_code,
+        "home_team_id": home_team_id,
+        "away_team_id": away_team_id,
+        "date_time": game_datetime,
+        "venue_id": venue_id,
+    }
+    return row, venue_raw
+
+
+async def _find_moved_games(
+    session,
+    db_lock: asyncio.Lock,
+    game_repo: GameRepository,
+    league_code: str,
+    windows: list[SyncWindow],
+    seen_ids: set[int],
+) -> set[int]:
+    """Upcoming games the DB dates inside *windows* that no fetched payload listed.
+
+    A game rescheduled out of a near window drops out of its payload, and the
+    far block it moved to may not be due this run (or lies past the horizon).
+    """
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    ranges = []
+    for window in windows:
+        # Only upcoming games: ESPN's day boundaries are not UTC, and played
+        # games are not rescheduled.
+        start = max(datetime.combine(window.start, day_time.min), now)
+        end = datetime.combine(window.end + timedelta(days=1), day_time.min)
+        if start < end:
+            ranges.append((start, end))
+    if not ranges:
+        return set()
+    scheduled = await _db_step(session, db_lock, lambda: game_repo.ids_scheduled_between(league_code, ranges))
+    return scheduled - seen_ids
+
+
+async def _fetch_moved_games(
+    client: ESPNClient,
+    league_code: str,
+    espn_sport: str,
+    espn_league: str,
+    game_ids: set[int],
+    team_ids: dict[int, int],
+) -> tuple[list[dict], dict[int, dict]]:
+    """Look each game up by id so its new date (or venue) is written this run."""
+    ids = sorted(game_ids)
+    events = await asyncio.gather(
+        *(client.get_event(espn_sport, espn_league, game_id) for game_id in ids),
+        return_exceptions=True,
+    )
+    rows: list[dict] = []
+    venues_raw: dict[int, dict] = {}
+    for game_id, event in zip(ids, events):
+        if isinstance(event, BaseException):
+            logger.warning(f"Could not look up moved {league_code} game {game_id}: {event}")
             continue
+        if event is None:
+            logger.warning(f"{league_code} game {game_id} is no longer listed by ESPN")
+            continue
+        parsed = _game_row(event, league_code, team_ids)
+        if parsed is None:
+            continue
+        row, venue_raw = parsed
+        rows.append(row)
+        if venue_raw is not None:
+            venues_raw.setdefault(row["venue_id"], venue_raw)
+    return rows, venues_raw
 
-        venue_id = None
-        venue_raw = competition.get("venue", {})
-        if venue_raw and venue_raw.get("id"):
-            venue_id = int(venue_raw["id"])
-            existing_venue = await venue_repo.get(venue_id)
-            if not existing_venue:
-                address = venue_raw.get("address", {})
-                venue_name = venue_raw.get("fullName", "")
-                city = address.get("city")
-                state = address.get("state")
-                lat, lon = await geocode_venue(venue_name, city, state)
-                await venue_repo.upsert(
-                    venue_id=venue_id,
-                    name=venue_name,
-                    city=city,
-                    state_region=state,
-                    country=address.get("country", "USA"),
-                    latitude=lat,
-                    longitude=lon,
-                    is_indoor=venue_raw.get("indoor"),
-                )
-            venues_count += 1
-
-        await game_repo.upsert(
-            game_id=game_id,
-            league_id=league_code,
-            home_team_id=home_team_row.team_id,
-            away_team_id=away_team_row.team_id,
-            date_time=game_datetime,
-            venue_id=venue_id,
-        )
-        games_count += 1
-
-    logger.info(f"Processed {games_count} {league_code} games")
-
-
-async def deactivate_expired_alerts(session) -> int:
-    """Set is_active=False for alerts whose expires_at has passed or whose
-    associated game ended more than 4 hours ago."""
-    now = datetime.utcnow()
-    game_cutoff = now - timedelta(hours=4)
-
-    # Subquery: game IDs that have already ended
-    ended_game_ids = (
-        select(Game.game_id).where(Game.date_time < game_cutoff).scalar_subquery()
-    )
 
-    result = await session.execute(
-        update(SafetyAlert)
-        .where(
-            SafetyAlert.is_active == True,
-            (
-                (SafetyAlert.expires_at != None) & (SafetyAlert.expires_at < now)
-                | (SafetyAlert.game_id != None) & SafetyAlert.game_id.in_(ended_game_ids)
-            ),
-        )
-        .values(is_active=False)
+async def scrape_schedule(
+    client: ESPNClient,
+    session,
+    db_lock: asyncio.Lock,
+    geocoder: GeocodeQueue,
+    league_code: str,
+    espn_sport: str,
+    espn_league: str,
+    full_refresh: bool = False,
+):
+    logger.info(f"Scraping {league_code} schedule")
+    team_repo = TeamRepository(session)
+    venue_repo = VenueRepository(session)
+    game_repo = GameRepository(session)
+    sync_repo = LeagueSyncRepository(session)
+
+    today = datetime.now().date()
+    synced = await _db_step(session, db_lock, lambda: sync_repo.get_windows(league_code))
+    windows = plan_windows(
+        espn_league,
+        today,
+        datetime.now(timezone.utc),
+        {start: window.synced_at for start, window in synced.items()},
+        full_refresh=full_refresh,
     )
-    count = result.rowcount or 0
-    if count:
-        logger.info(f"Deactivated {count} expired alert(s)")
-    return count
-
-
-async def cleanup_previous_day(session) -> None:
-    today_aware = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-    today_naive = today_aware.replace(tzinfo=None)
-
-    # Safety alerts tied to a game that occurred before today / admin approval alerts carry over
-    past_game_ids = select(Game.game_id).where(Game.date_time < today_aware).scalar_subquery()
-    alert_result = await session.execute(
-        delete(SafetyAlert).where(
-            SafetyAlert.game_id.in_(past_game_ids)
+    fetched = await _fetch_windows(client, league_code, espn_sport, espn_league, windows)
+
+    # Resolve every team for the league up front instead of two lookups per game.
+    team_ids = await _db_step(session, db_lock, lambda: team_repo.map_espn_ids(league_code))
+
+    # Events are decoded one at a time from each downloaded body and reduced
+    # to small row dicts, so a full scoreboard tree is never in memory.
+    game_rows: list[dict] = []
+    venues_raw: dict[int, dict] = {}
+    window_records: list[dict] = []
+    changed_windows = 0
+    changed_near: list[SyncWindow] = []
+    seen_ids: set[int] = set()
+    for window, payload in fetched:
+        rows: list[dict] = []
+        window_venues: dict[int, dict] = {}
+        try:
+            for event in payload.iter_items("events"):
+                seen_ids.add(int(event["id"]))
+                parsed = _game_row(event, league_code, team_ids)
+                if parsed is None:
+                    continue
+                row, venue_raw = parsed
+                rows.append(row)
+                if venue_raw is not None:
+                    window_venues.setdefault(row["venue_id"], venue_raw)
+        finally:
+            payload.close()
+
+        digest = fingerprint(rows)
+        window_records.append({
+            "window_start": window.start,
+            "window_end": window.end,
+            "fingerprint": digest,
+            "game_count": len(rows),
+        })
+        previous = synced.get(window.start)
+        if previous is not None and previous.fingerprint == digest:
+            continue
+        changed_windows += 1
+        if window.near_term:
+            changed_near.append(window)
+        game_rows.extend(rows)
+        for venue_id, venue_raw in window_venues.items():
+            venues_raw.setdefault(venue_id, venue_raw)
+
+    # Games that left a changed near window: fetch them by id, since the
+    # block they moved to may not be fetched for days (or ever).
+    moved = await _find_moved_games(session, db_lock, game_repo, league_code, changed_near, seen_ids)
+    if moved:
+        moved_rows, moved_venues = await _fetch_moved_games(
+            client, league_code, espn_sport, espn_league, moved, team_ids
         )
+        logger.info(f"{league_code}: {len(moved)} game(s) left the near-term window, {len(moved_rows)} re-dated")
+        game_rows.extend(moved_rows)
+        for venue_id, venue_raw in moved_venues.items():
+            venues_raw.setdefault(venue_id, venue_raw)
+
+    # Known, located venues need nothing; the rest are written with any
+    # cached coordinates and the remainder geocoded in the background.
+    unlocated, coords = await _locate_venues(session, db_lock, geocoder, venues_raw) if venues_raw else ({}, {})
+
+    async def write():
+        await _upsert_venues(venue_repo, unlocated, coords)
+        counts = await game_repo.bulk_upsert(game_rows)
+        await sync_repo.record(league_code, window_records)
+        await sync_repo.prune(league_code, before=today)
+        return counts
+
+    counts = await _db_step(session, db_lock, write, commit=True)
+    _enqueue_uncached(geocoder, unlocated, coords)
+    logger.info(
+        f"{league_code} schedule: fetched {len(fetched)}/{len(windows)} window(s), {changed_windows} changed; "
+        f"games {counts['inserted']} inserted, {counts['updated']} updated, {counts['unchanged']} unchanged"
     )
+    logger.info(f"Processed {len(game_rows)} {league_code} games")
+    return {
+        "windows_fetched": len(fetched),
+        "windows_changed": changed_windows,
+        "games_moved": len(moved),
+        "games": counts,
+    }
 
-    past_event_ids = select(Event.event_id).where(Event.game_date < today_naive).scalar_subquery()
-    await session.execute(
-        delete(EventChat).where(EventChat.event_id.in_(past_event_ids))
-    )
-
-    event_result = await session.execute(
-        delete(Event).where(Event.game_date < today_naive)
-    )
 
-    game_result = await session.execute(
-        delete(Game).where(Game.date_time < today_aware)
-    )
+async def scrape_league(
+    client: ESPNClient,
+    session,
+    db_lock: asyncio.Lock,
+    geocoder: GeocodeQueue,
+    league_code: str,
+    espn_sport: str,
+    espn_league: str,
+    full_refresh: bool = False,
+    progress: Optional[JobProgress] = None,
+) -> None:
+    """Scrape one league; never raises, so one league cannot cancel the others.
+
+    Takes plain strings rather than the ``League`` row: a rollback after
+    another league's failure expires every instance on the shared session.
+    """
+    args = (client, session, db_lock, geocoder, league_code, espn_sport, espn_league)
+    started = time.perf_counter()
+    try:
+        await scrape_teams(*args)
+        stats = await scrape_schedule(*args, full_refresh=full_refresh)
+    except Exception as e:
+        logger.exception(f"{league_code} scrape failed, skipping: {e}")
+        if progress is not None:
+            try:
+                await progress.league_failed(league_code, f"{type(e).__name__}: {e}", time.perf_counter() - started)
+            except Exception as progress_error:
+                logger.warning(f"Could not record {league_code} failure: {progress_error}")
+        return
+    if progress is not None:
+        try:
+            await progress.league_done(league_code, stats, time.perf_counter() - started)
+        except Exception as e:
+            logger.warning(f"Could not record {league_code} progress: {e}")
 
-    logger.info(
-        f"Cleanup: deleted {alert_result.rowcount} game-linked alert(s), "
-        f"{event_result.rowcount} event(s), "
-        f"{game_result.rowcount} game(s) prior to {today_naive.date()}"
-    )
 
+async def run_nightly_task(full_refresh: bool = False, progress: Optional[JobProgress] = None):
+    """Scrape every active league; *full_refresh* refetches far-future schedule windows too.
 
-async def run_nightly_task():
-    logger.info("Starting nightly scraper")
+    With *progress* (see ``scheduled.jobs``), leagues it already lists as
+    completed are skipped and each league's outcome is checkpointed.
+    """
+    logger.info(f"Starting nightly scraper (full_refresh={full_refresh})")
 
     client = ESPNClient()
+    geocoder = GeocodeQueue()
     try:
         async with AsyncSessionLocal() as session:
             league_repo = LeagueRepository(session)
-            team_repo = TeamRepository(session)
-            venue_repo = VenueRepository(session)
-            game_repo = GameRepository(session)
 
             leagues_config = load_leagues_config()
             for league_data in leagues_config:
@@ -306,22 +482,63 @@ async def run_nightly_task():
                 )
             await session.commit()
 
-            active_leagues = await league_repo.list_active()
-            for league in active_leagues:
-                try:
-                    await scrape_teams(client, team_repo, venue_repo, league.league_code, league.espn_sport, league.espn_league)
-                    await scrape_schedule(client, team_repo, venue_repo, game_repo, league.league_code, league.espn_sport, league.espn_league)
-                    await session.commit()
-                except Exception as e:
-                    await session.rollback()
-                    logger.exception(f"{league.league_code} scrape failed, skipping: {e}")
-
-            await deactivate_expired_alerts(session)
-            await cleanup_previous_day(session)
+            # Leagues scrape concurrently: HTTP fetches and geocoding overlap,
+            # while reads and writes on the shared session take db_lock in turn.
+            # Copied out as plain strings: ORM rows on the shared session
+            # expire whenever a failing league rolls it back.
+            active_leagues = [
+                (league.league_code, league.espn_sport, league.espn_league)
+                for league in await league_repo.list_active()
+            ]
+            if progress is not None:
+                await progress.started(len(active_leagues))
+                active_leagues = [league for league in active_leagues if league[0] not in progress.completed]
+            db_lock = asyncio.Lock()
+            async with asyncio.TaskGroup() as leagues:
+                for league_code, espn_sport, espn_league in active_leagues:
+                    leagues.create_task(
+                        scrape_league(
+                            client, session, db_lock, geocoder,
+                            league_code, espn_sport, espn_league, full_refresh, progress,
+                        )
+                    )
+
+            backfilled = await GameSyntheticIdRepository(session).backfill_missing()
+            if backfilled:
+                logger.info(f"Registered synthetic ids for {backfilled} game(s)")
+
+            # Teams and venues may have changed; every worker reloads its snapshot.
+            await bump_reference_version(session)
             await session.commit()
+
+            # Chunked, in its own transactions; never holds locks for the scrape.
+            if progress is not None:
+                await progress.stage("maintenance")
+            report = await run_maintenance()
+            if progress is not None:
+                await progress.set("maintenance", report)
+                await progress.stage("geocoding")
+
+            # Venues left for the background geocoder were queued as leagues
+            # finished; give it a bounded window before the run exits.
+            if not await geocoder.drain(timeout=GEOCODE_DRAIN_SECONDS):
+                logger.warning(f"{geocoder.pending} venue(s) still awaiting geocoding; retrying next run")
+            logger.info(
+                f"Geocoding: {geocoder.lookups} lookup(s), {geocoder.filled} venue(s) located, "
+                f"{geocoder.not_found} not found"
+            )
+            if geocoder.filled:
+                await bump_reference_version(session)
+                await session.commit()
+
+            if isinstance(shared_backend, PostgresBackend):
+                purged = await shared_backend.purge_expired()
+                if purged:
+                    logger.info(f"Purged {purged} expired shared cache row(s)")
             logger.info("Scraper ran successfully")
     except Exception as e:
         logger.exception(f"Scraper run failed: {e}")
         raise
     finally:
+        await geocoder.close()
         await client.close()
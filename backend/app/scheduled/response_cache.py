@@ -0,0 +1,161 @@
+"""
+On-disk ESPN response cache
+===========================
+
+``ESPNClient`` stores each response body next to its ``ETag`` /
+``Last-Modified`` validators and a SHA-256 of the body.  The next request for
+the same URL is conditional; a ``304`` is answered from disk.
+
+Each entry also records the hash the scraper last *applied* — written only
+after that payload's rows were committed.  A payload is "changed" when its
+hash differs from the applied one, so a fetch whose ingest failed is still
+processed next time even though the server says nothing changed.  Only the
+teams lists use this; schedules are compared per window by fingerprint
+(``scheduled.sync_windows``).
+
+Entries are two files per request key: ``<key>.json`` (metadata) and
+``<key>.body``.  Bodies are streamed to a temp file in the cache directory
+and renamed into place, so they are never held in memory whole.  Any
+filesystem error degrades to an uncached fetch.
+
+Keys include the requested dates, so most entries are never asked for again
+once their day has passed.  A ``304`` refreshes an entry's mtime, and
+``prune`` deletes entries (and stray temp files) not touched for a given age;
+the client prunes once when it opens the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Mapping, Optional
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(fh: BinaryIO, chunk_size: int = 64 * 1024) -> str:
+    """SHA-256 of *fh* from the start, read in chunks; leaves it rewound."""
+    digest = hashlib.sha256()
+    fh.seek(0)
+    for chunk in iter(lambda: fh.read(chunk_size), b""):
+        digest.update(chunk)
+    fh.seek(0)
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    def __init__(self, directory: str | os.PathLike):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        query = urlencode(sorted((params or {}).items()))
+        return hashlib.sha256(f"{url}?{query}".encode()).hexdigest()
+
+    def load(self, key: str) -> Optional[dict]:
+        try:
+            return json.loads((self.directory / f"{key}.json").read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable response cache entry {key}: {e}")
+            return None
+
+    def body_path(self, key: str) -> Path:
+        return self.directory / f"{key}.body"
+
+    def spool_file(self) -> BinaryIO:
+        """A temp file in the cache directory, so ``store`` can rename it into place."""
+        return tempfile.NamedTemporaryFile(dir=self.directory, prefix=".tmp-", delete=False)
+
+    def store(
+        self,
+        key: str,
+        spooled: BinaryIO,
+        *,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> tuple[str, Path]:
+        """Move the body downloaded into *spooled* into the entry.
+
+        Returns the body's hash and the path to read it from (the spool file
+        itself if the entry could not be written).
+        """
+        digest = content_hash(spooled)
+        spooled.close()
+        previous = self.load(key) or {}
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_hash": digest,
+            "applied_hash": previous.get("applied_hash"),
+        }
+        try:
+            os.replace(spooled.name, self.body_path(key))
+            self._write(f"{key}.json", json.dumps(meta).encode())
+        except OSError as e:
+            logger.warning(f"Could not write response cache entry {key}: {e}")
+            if os.path.exists(spooled.name):
+                return digest, Path(spooled.name)
+        return digest, self.body_path(key)
+
+    def touch(self, key: str) -> None:
+        """Mark the entry as still in use so ``prune`` keeps it."""
+        for name in (f"{key}.json", f"{key}.body"):
+            try:
+                os.utime(self.directory / name)
+            except OSError:
+                pass
+
+    def prune(self, max_age_seconds: float, now: Optional[float] = None) -> int:
+        """Delete entry and temp files last modified more than *max_age_seconds* ago; returns the file count."""
+        cutoff = (now if now is not None else time.time()) - max_age_seconds
+        removed = 0
+        try:
+            candidates = list(os.scandir(self.directory))
+        except OSError as e:
+            logger.warning(f"Could not list response cache {self.directory}: {e}")
+            return 0
+        for entry in candidates:
+            if not (entry.name.endswith((".json", ".body")) or entry.name.startswith(".tmp-")):
+                continue
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    removed += 1
+            except OSError as e:
+                logger.warning(f"Could not prune response cache file {entry.name}: {e}")
+        return removed
+
+    def mark_applied(self, key: str, digest: str) -> None:
+        meta = self.load(key)
+        if meta is None or meta.get("content_hash") != digest:
+            return
+        meta["applied_hash"] = digest
+        try:
+            self._write(f"{key}.json", json.dumps(meta).encode())
+        except OSError as e:
+            logger.warning(f"Could not update response cache entry {key}: {e}")
+
+    def _write(self, name: str, data: bytes) -> None:
+        # Write-then-rename so a crashed run never leaves a torn entry.
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp_path, self.directory / name)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
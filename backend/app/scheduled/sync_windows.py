@@ -0,0 +1,109 @@
+"""
+Schedule sync windows
+=====================
+
+``scrape_schedule`` used to pull today through +180 days every night and
+re-upsert every game.  The horizon is now split into date windows:
+
+- **Near term** — today up to the first window boundary at least
+  ``NEAR_TERM_DAYS`` out.  Fetched every run; this is where reschedules,
+  venue changes and newly announced games land.
+- **Far future** — fixed ``FAR_WINDOW_DAYS`` blocks aligned to
+  ``WINDOW_EPOCH`` out to ``HORIZON_DAYS``.  Fetched only when the block has
+  never been synced or its last sync is older than ``FAR_REFRESH``.
+
+NCAAB's scoreboard does not accept date ranges, so each of its next
+``NEAR_TERM_DAYS`` days is its own near-term window.
+
+Every fetched window's game rows are fingerprinted; ``league_sync_windows``
+keeps the fingerprint and sync time per (league, window_start).  A window
+whose fingerprint is unchanged is not written at all.  Far blocks have
+fixed boundaries, so their fingerprints compare like-for-like from one week
+to the next; the near window starts today, so its fingerprint only short-
+circuits reruns on the same day.
+
+A game rescheduled out of the near window simply drops out of its payload,
+and the far block it moved to may not be due for days (or lie past the
+horizon).  So whenever a near window's fingerprint changes, ``scrape_schedule``
+compares the upcoming games the DB has dated in it with the ids the run
+fetched, and looks each missing game up by id to write its new date.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import date, datetime, timedelta
+from typing import Iterable
+
+NEAR_TERM_DAYS = 14
+FAR_WINDOW_DAYS = 28
+HORIZON_DAYS = 180
+FAR_REFRESH = timedelta(days=7)
+WINDOW_EPOCH = date(2024, 1, 1)
+
+DAILY_ONLY_LEAGUES = {"mens-college-basketball"}
+
+
+class SyncWindow:
+    def __init__(self, start: date, end: date, near_term: bool):
+        self.start = start
+        self.end = end  # inclusive
+        self.near_term = near_term
+
+    @property
+    def dates_param(self) -> str:
+        if self.start == self.end:
+            return self.start.strftime("%Y%m%d")
+        return f"{self.start.strftime('%Y%m%d')}-{self.end.strftime('%Y%m%d')}"
+
+    def __repr__(self) -> str:
+        kind = "near" if self.near_term else "far"
+        return f"SyncWindow({self.start}..{self.end}, {kind})"
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, SyncWindow)
+            and (self.start, self.end, self.near_term) == (other.start, other.end, other.near_term)
+        )
+
+
+def _next_boundary(day: date) -> date:
+    """First far-window boundary on or after *day*."""
+    offset = (day - WINDOW_EPOCH).days % FAR_WINDOW_DAYS
+    return day if offset == 0 else day + timedelta(days=FAR_WINDOW_DAYS - offset)
+
+
+def plan_windows(
+    espn_league: str,
+    today: date,
+    now: datetime,
+    synced_at: dict[date, datetime],
+    full_refresh: bool = False,
+) -> list[SyncWindow]:
+    """Windows to fetch this run; *synced_at* maps window_start to its last sync."""
+    if espn_league in DAILY_ONLY_LEAGUES:
+        return [
+            SyncWindow(today + timedelta(days=offset), today + timedelta(days=offset), near_term=True)
+            for offset in range(NEAR_TERM_DAYS)
+        ]
+
+    far_start = _next_boundary(today + timedelta(days=NEAR_TERM_DAYS))
+    windows = [SyncWindow(today, far_start - timedelta(days=1), near_term=True)]
+
+    horizon = today + timedelta(days=HORIZON_DAYS)
+    start = far_start
+    while start < horizon:
+        last = synced_at.get(start)
+        if full_refresh or last is None or now - last >= FAR_REFRESH:
+            windows.append(SyncWindow(start, start + timedelta(days=FAR_WINDOW_DAYS - 1), near_term=False))
+        start += timedelta(days=FAR_WINDOW_DAYS)
+    return windows
+
+
+def fingerprint(rows: Iterable[dict]) -> str:
+    """Order-independent hash of a window's game rows."""
+    canonical = sorted(
+        json.dumps(row, sort_keys=True, default=str) for row in rows
+    )
+    return hashlib.sha256("\n".join(canonical).encode()).hexdigest()
@@ -15,10 +15,12 @@ def convert_league_to_read(league: League) -> LeagueRead:
     return LeagueRead.model_validate(league, from_attributes=True)
 
 
-def convert_team_to_read(team: Team) -> TeamRead:
+def convert_team_to_read(team: Team, league=None) -> TeamRead:
+    """*league* (e.g. from the reference-data snapshot) saves loading ``team.league``."""
+    league = league or team.league
     league_read = None
-    if team.league:
-        league_read = convert_league_to_read(team.league)
+    if league:
+        league_read = convert_league_to_read(league)
 
     return TeamRead(
         team_id=team.team_id,
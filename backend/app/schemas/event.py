@@ -92,6 +92,8 @@ class EventSearchFilters(BaseModel):
     location_query: str = ""
     saved_only: bool = False
     event_types: list[EventTypeEnum] = Field(default_factory=list)
+    # Fuzzy keyword matching ordered by similarity instead of date.
+    rank_by_relevance: bool = False
 
     @field_validator("start_date", "end_date", mode="before")
     @classmethod
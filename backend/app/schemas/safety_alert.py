@@ -60,6 +60,13 @@ class SafetyAlertUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
+class SafetyAlertAcknowledgeRequest(BaseModel):
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+    # None acknowledges every pending non-official alert.
+    alert_ids: Optional[list[UUID]] = None
+
+
 class SafetyAlertRead(SafetyAlertBase):
     alert_id: UUID
     is_active: bool
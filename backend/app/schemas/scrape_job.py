@@ -0,0 +1,54 @@
+from __future__ import annotations
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+from pydantic.alias_generators import to_camel
+
+
+class ScrapeJobRead(BaseModel):
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True, from_attributes=True)
+
+    job_id: UUID
+    status: str
+    trigger: str
+    full_refresh: bool
+    attempts: int
+    leagues_total: int
+    leagues_done: int
+    stage: Optional[str] = None
+    leagues: dict[str, Any] = {}
+    maintenance: Optional[list[dict[str, Any]]] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    heartbeat_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    elapsed_seconds: Optional[float] = None
+
+    @classmethod
+    def from_db_model(cls, job) -> "ScrapeJobRead":
+        checkpoint = job.checkpoint or {}
+        elapsed = None
+        if job.started_at is not None:
+            end = job.finished_at or job.heartbeat_at or job.started_at
+            elapsed = round((end - job.started_at).total_seconds(), 1)
+        return cls(
+            job_id=job.job_id,
+            status=job.status,
+            trigger=job.trigger,
+            full_refresh=job.full_refresh,
+            attempts=job.attempts,
+            leagues_total=job.leagues_total,
+            leagues_done=job.leagues_done,
+            stage=checkpoint.get("stage"),
+            leagues=checkpoint.get("leagues", {}),
+            maintenance=checkpoint.get("maintenance"),
+            error=job.error,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            heartbeat_at=job.heartbeat_at,
+            finished_at=job.finished_at,
+            elapsed_seconds=elapsed,
+        )
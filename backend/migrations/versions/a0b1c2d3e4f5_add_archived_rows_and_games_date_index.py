@@ -0,0 +1,38 @@
+"""add archived_rows and games.date_time index for chunked cleanup
+
+Revision ID: a0b1c2d3e4f5
+Revises: f8a9b0c1d2e3
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = 'a0b1c2d3e4f5'
+down_revision: Union[str, Sequence[str], None] = 'f8a9b0c1d2e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'archived_rows',
+        sa.Column('source_table', sa.String(length=32), nullable=False),
+        sa.Column('row_key', sa.String(length=64), nullable=False),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('source_table', 'row_key'),
+    )
+    op.create_index('ix_archived_rows_archived_at', 'archived_rows', ['archived_at'], unique=False)
+    # Each cleanup chunk selects past games by date.
+    op.create_index('ix_games_date_time', 'games', ['date_time'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_games_date_time', table_name='games')
+    op.drop_index('ix_archived_rows_archived_at', table_name='archived_rows')
+    op.drop_table('archived_rows')
@@ -0,0 +1,55 @@
+"""add game_synthetic_ids lookup table
+
+Revision ID: a3b4c5d6e7f8
+Revises: f1e2d3c4b5a6
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = 'a3b4c5d6e7f8'
+down_revision: Union[str, Sequence[str], None] = 'f1e2d3c4b5a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'game_synthetic_ids',
+        sa.Column('synthetic_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('game_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['game_id'], ['games.game_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('synthetic_id'),
+        sa.UniqueConstraint('game_id', name='uq_game_synthetic_ids_game_id'),
+    )
+
+    # Backfill existing games. uuid5 is computed in Python so the migration does
+    # not depend on the uuid-ossp extension being installed.
+    bind = op.get_bind()
+    game_ids = [row[0] for row in bind.execute(sa.text("SELECT game_id FROM games"))]
+    if game_ids:
+        table = sa.table(
+            'game_synthetic_ids',
+            sa.column('synthetic_id', postgresql.UUID(as_uuid=True)),
+            sa.column('game_id', sa.Integer()),
+        )
+        op.bulk_insert(
+            table,
+            [
+                {
+                    'synthetic_id': uuid.uuid5(uuid.NAMESPACE_DNS, f"game:{game_id}"),
+                    'game_id': game_id,
+                }
+                for game_id in game_ids
+            ],
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('game_synthetic_ids')
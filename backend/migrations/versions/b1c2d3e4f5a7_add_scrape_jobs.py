@@ -0,0 +1,54 @@
+"""add scrape_jobs for resumable nightly runs
+
+Revision ID: b1c2d3e4f5a7
+Revises: a0b1c2d3e4f5
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = 'b1c2d3e4f5a7'
+down_revision: Union[str, Sequence[str], None] = 'a0b1c2d3e4f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'scrape_jobs',
+        sa.Column('job_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('kind', sa.String(length=20), server_default='nightly', nullable=False),
+        sa.Column('status', sa.String(length=10), server_default='queued', nullable=False),
+        sa.Column('trigger', sa.String(length=10), nullable=False),
+        sa.Column('full_refresh', sa.Boolean(), server_default='false', nullable=False),
+        sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('leagues_total', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('leagues_done', sa.Integer(), server_default='0', nullable=False),
+        sa.Column(
+            'checkpoint', postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("""'{"leagues": {}}'::jsonb"""), nullable=False,
+        ),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint("status IN ('queued', 'running', 'succeeded', 'failed')", name='chk_scrape_job_status'),
+        sa.PrimaryKeyConstraint('job_id'),
+    )
+    op.create_index('ix_scrape_jobs_created_at', 'scrape_jobs', ['created_at'], unique=False)
+    op.create_index(
+        'uq_scrape_jobs_active_kind', 'scrape_jobs', ['kind'], unique=True,
+        postgresql_where=sa.text("status IN ('queued', 'running')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_scrape_jobs_active_kind', table_name='scrape_jobs')
+    op.drop_index('ix_scrape_jobs_created_at', table_name='scrape_jobs')
+    op.drop_table('scrape_jobs')
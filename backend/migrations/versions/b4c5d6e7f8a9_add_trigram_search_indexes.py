@@ -0,0 +1,44 @@
+"""add pg_trgm GIN indexes for text search
+
+Revision ID: b4c5d6e7f8a9
+Revises: a3b4c5d6e7f8
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'b4c5d6e7f8a9'
+down_revision: Union[str, Sequence[str], None] = 'a3b4c5d6e7f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, indexed expression)
+TRIGRAM_INDEXES = [
+    ('ix_teams_team_name_trgm', 'teams', 'team_name'),
+    ('ix_teams_display_name_trgm', 'teams', 'display_name'),
+    ('ix_teams_home_location_trgm', 'teams', 'home_location'),
+    ('ix_venues_name_trgm', 'venues', 'name'),
+    ('ix_venues_city_trgm', 'venues', 'city'),
+    ('ix_venues_state_region_trgm', 'venues', 'state_region'),
+    ('ix_events_title_trgm', 'events', 'title'),
+    ('ix_events_description_trgm', 'events', 'description'),
+    # username is CITEXT, which has no trigram opclass; index the text cast.
+    ('ix_users_username_trgm', 'users', '(username::text)'),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, expression in TRIGRAM_INDEXES:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({expression} gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    for name, _table, _expression in reversed(TRIGRAM_INDEXES):
+        op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,33 @@
+"""add reference_data_version counter
+
+Revision ID: c3d4e5f6a7b9
+Revises: b1c2d3e4f5a7
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c3d4e5f6a7b9'
+down_revision: Union[str, Sequence[str], None] = 'b1c2d3e4f5a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'reference_data_version',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('version', sa.BigInteger(), server_default='1', nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.CheckConstraint('id = 1', name='chk_reference_data_version_single_row'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.execute("INSERT INTO reference_data_version (id, version) VALUES (1, 1)")
+
+
+def downgrade() -> None:
+    op.drop_table('reference_data_version')
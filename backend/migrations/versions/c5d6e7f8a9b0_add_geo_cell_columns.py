@@ -0,0 +1,49 @@
+"""add geo_cell grid columns for nearby queries
+
+Revision ID: c5d6e7f8a9b0
+Revises: b4c5d6e7f8a9
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c5d6e7f8a9b0'
+down_revision: Union[str, Sequence[str], None] = 'b4c5d6e7f8a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 0.5-degree cells numbered row-major from (-90, -180); must match
+# core.geo_grid.geo_cell_sql (360 rows x 720 columns).
+GEO_CELL_SQL = (
+    "(LEAST(FLOOR((latitude + 90) / 0.5), 359)::integer * 720"
+    " + LEAST(FLOOR((longitude + 180) / 0.5), 719)::integer)"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        'venues',
+        sa.Column('geo_cell', sa.Integer(), sa.Computed(GEO_CELL_SQL, persisted=True), nullable=True),
+    )
+    op.add_column(
+        'events',
+        sa.Column('geo_cell', sa.Integer(), sa.Computed(GEO_CELL_SQL, persisted=True), nullable=True),
+    )
+    op.create_index('ix_venues_geo_cell', 'venues', ['geo_cell'], unique=False)
+    op.create_index('ix_events_geo_cell_game_date', 'events', ['geo_cell', 'game_date'], unique=False)
+    op.create_index('ix_events_venue_id_game_date', 'events', ['venue_id', 'game_date'], unique=False)
+    op.create_index('ix_games_venue_id_date_time', 'games', ['venue_id', 'date_time'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_games_venue_id_date_time', table_name='games')
+    op.drop_index('ix_events_venue_id_game_date', table_name='events')
+    op.drop_index('ix_events_geo_cell_game_date', table_name='events')
+    op.drop_index('ix_venues_geo_cell', table_name='venues')
+    op.drop_column('events', 'geo_cell')
+    op.drop_column('venues', 'geo_cell')
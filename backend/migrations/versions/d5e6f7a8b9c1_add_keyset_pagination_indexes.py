@@ -0,0 +1,40 @@
+"""add composite indexes backing keyset pagination
+
+Revision ID: d5e6f7a8b9c1
+Revises: c3d4e5f6a7b9
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'd5e6f7a8b9c1'
+down_revision: Union[str, Sequence[str], None] = 'c3d4e5f6a7b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One index per list order: sort columns followed by the primary key.
+    # (date_time, game_id) also covers cleanup's date scans, replacing ix_games_date_time.
+    op.create_index('ix_games_date_time_game_id', 'games', ['date_time', 'game_id'], unique=False)
+    op.drop_index('ix_games_date_time', table_name='games')
+    op.create_index('ix_games_league_id_date_time', 'games', ['league_id', 'date_time', 'game_id'], unique=False)
+    op.create_index('ix_teams_display_name_team_id', 'teams', ['display_name', 'team_id'], unique=False)
+    op.create_index(
+        'ix_favorites_user_id_date_time', 'favorites', ['user_id', 'date_time', 'favorite_id'], unique=False
+    )
+    op.create_index('ix_users_created_at_user_id', 'users', ['created_at', 'user_id'], unique=False)
+    op.create_index('ix_alerts_created_at_alert_id', 'safety_alerts', ['created_at', 'alert_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_alerts_created_at_alert_id', table_name='safety_alerts')
+    op.drop_index('ix_users_created_at_user_id', table_name='users')
+    op.drop_index('ix_favorites_user_id_date_time', table_name='favorites')
+    op.drop_index('ix_teams_display_name_team_id', table_name='teams')
+    op.drop_index('ix_games_league_id_date_time', table_name='games')
+    op.create_index('ix_games_date_time', 'games', ['date_time'], unique=False)
+    op.drop_index('ix_games_date_time_game_id', table_name='games')
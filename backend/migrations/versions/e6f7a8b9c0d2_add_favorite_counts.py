@@ -0,0 +1,47 @@
+"""add favorite_count counters to events and games
+
+Revision ID: e6f7a8b9c0d2
+Revises: d5e6f7a8b9c1
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'e6f7a8b9c0d2'
+down_revision: Union[str, Sequence[str], None] = 'd5e6f7a8b9c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('events', sa.Column('favorite_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('games', sa.Column('favorite_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        "UPDATE events SET favorite_count = counts.n FROM ("
+        "SELECT event_id, count(*) AS n FROM favorites WHERE event_id IS NOT NULL GROUP BY event_id"
+        ") AS counts WHERE events.event_id = counts.event_id"
+    )
+    op.execute(
+        "UPDATE games SET favorite_count = counts.n FROM ("
+        "SELECT game_id, count(*) AS n FROM favorites WHERE game_id IS NOT NULL GROUP BY game_id"
+        ") AS counts WHERE games.game_id = counts.game_id"
+    )
+    op.create_index(
+        'ix_events_favorite_count', 'events', ['favorite_count'], unique=False,
+        postgresql_where=sa.text('favorite_count > 0'),
+    )
+    op.create_index(
+        'ix_games_favorite_count', 'games', ['favorite_count'], unique=False,
+        postgresql_where=sa.text('favorite_count > 0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_games_favorite_count', table_name='games')
+    op.drop_index('ix_events_favorite_count', table_name='events')
+    op.drop_column('games', 'favorite_count')
+    op.drop_column('events', 'favorite_count')
@@ -0,0 +1,35 @@
+"""add league_sync_windows for incremental schedule sync
+
+Revision ID: f8a9b0c1d2e3
+Revises: e7f8a9b0c1d2
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'f8a9b0c1d2e3'
+down_revision: Union[str, Sequence[str], None] = 'e7f8a9b0c1d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'league_sync_windows',
+        sa.Column('league_code', sa.String(length=10), nullable=False),
+        sa.Column('window_start', sa.Date(), nullable=False),
+        sa.Column('window_end', sa.Date(), nullable=False),
+        sa.Column('fingerprint', sa.String(length=64), nullable=False),
+        sa.Column('game_count', sa.Integer(), nullable=False),
+        sa.Column('synced_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['league_code'], ['leagues.league_code'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('league_code', 'window_start'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('league_sync_windows')
@@ -0,0 +1,114 @@
+"""
+Unit tests for the single-statement admin overview and its cache.
+
+No database required; the session is faked.
+
+Run with:
+    cd backend
+    python -m pytest test_admin_overview.py -v
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, "app")
+
+# Settings are read at import time; provide dummies so no .env is needed.
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
+os.environ.setdefault("DATABASE_URL_ASYNC", "postgresql+asyncpg://test@localhost/test")
+os.environ.setdefault("CLERK_SECRET_KEY", "test")
+os.environ.setdefault("CLERK_DOMAIN", "example.com")
+
+from sqlalchemy.dialects import postgresql  # noqa: E402
+
+import repositories.admin_repo as admin_repo  # type: ignore[import]  # noqa: E402
+
+COUNTS = {
+    "total_users": 10,
+    "active_users": 9,
+    "verified_creators": 2,
+    "pending_approvals": 1,
+    "total_events": 40,
+    "events_today": 3,
+    "games_today": 5,
+}
+
+
+class _Row:
+    _mapping = COUNTS
+
+
+class _Result:
+    def one(self):
+        return _Row()
+
+
+class _FakeSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return _Result()
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestOverviewStatement(unittest.TestCase):
+    def setUp(self):
+        self.sql = _sql(admin_repo._build_overview_stats(datetime(2026, 10, 18), datetime(2026, 10, 18, 23, 59)))
+
+    def test_each_table_is_read_once(self):
+        self.assertEqual(self.sql.count("FROM users"), 1)
+        self.assertEqual(self.sql.count("FROM events"), 1)
+        self.assertEqual(self.sql.count("FROM games"), 1)
+
+    def test_user_counts_use_filter(self):
+        self.assertEqual(self.sql.count("FILTER (WHERE users."), 3)
+        self.assertIn("FILTER (WHERE events.game_date", self.sql)
+
+    def test_selects_every_overview_field(self):
+        stmt = admin_repo._build_overview_stats(datetime(2026, 10, 18), datetime(2026, 10, 18, 23, 59))
+        self.assertEqual(set(stmt.selected_columns.keys()), set(COUNTS))
+
+
+class TestOverviewCache(unittest.TestCase):
+    def setUp(self):
+        admin_repo._OVERVIEW_CACHE.clear()
+
+    def tearDown(self):
+        admin_repo._OVERVIEW_CACHE.clear()
+
+    def test_one_query_then_cached(self):
+        db = _FakeSession()
+
+        async def run():
+            first = await admin_repo.get_overview_stats_service(db)
+            second = await admin_repo.get_overview_stats_service(db)
+            return first, second
+
+        first, second = asyncio.run(run())
+        self.assertEqual(first, COUNTS)
+        self.assertEqual(second, COUNTS)
+        self.assertEqual(len(db.statements), 1)
+
+    def test_invalidate_forces_reload(self):
+        db = _FakeSession()
+
+        async def run():
+            await admin_repo.get_overview_stats_service(db)
+            admin_repo.invalidate_overview_stats()
+            await admin_repo.get_overview_stats_service(db)
+
+        asyncio.run(run())
+        self.assertEqual(len(db.statements), 2)
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)
@@ -0,0 +1,99 @@
+"""
+Unit tests for set-based safety alert acknowledgment.
+
+No database required; the session is faked and statements are compiled
+for PostgreSQL.
+
+Run with:
+    cd backend
+    python -m pytest test_alert_acknowledgments.py -v
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+import uuid
+
+sys.path.insert(0, "app")
+
+# Settings are read at import time; provide dummies so no .env is needed.
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
+os.environ.setdefault("DATABASE_URL_ASYNC", "postgresql+asyncpg://test@localhost/test")
+os.environ.setdefault("CLERK_SECRET_KEY", "test")
+os.environ.setdefault("CLERK_DOMAIN", "example.com")
+
+from sqlalchemy.dialects import postgresql  # noqa: E402
+
+from repositories.user_alert_acknowledgment_repo import UserAlertAcknowledgmentRepository  # type: ignore[import]  # noqa: E402
+from schemas.safety_alert import SafetyAlertAcknowledgeRequest  # type: ignore[import]  # noqa: E402
+
+
+class _Result:
+    def __init__(self, rowcount):
+        self.rowcount = rowcount
+
+
+class _FakeSession:
+    def __init__(self, rowcount=0):
+        self.rowcount = rowcount
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return _Result(self.rowcount)
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"render_postcompile": True}))
+
+
+class TestAcknowledgeMany(unittest.TestCase):
+    def setUp(self):
+        self.user_id = uuid.uuid4()
+
+    def test_pending_set_is_one_insert_select(self):
+        db = _FakeSession(rowcount=4)
+        count = asyncio.run(UserAlertAcknowledgmentRepository(db).acknowledge_many(self.user_id))
+        self.assertEqual(count, 4)
+        self.assertEqual(len(db.statements), 1)
+        sql = _sql(db.statements[0])
+        self.assertTrue(sql.startswith("INSERT INTO user_alert_acknowledgments (user_id, alert_id) SELECT"))
+        self.assertIn("ON CONFLICT (user_id, alert_id) DO NOTHING", sql)
+        self.assertIn("safety_alerts.is_official = false", sql)
+        self.assertIn("safety_alerts.is_active = true", sql)
+
+    def test_explicit_ids_are_acknowledged_as_given(self):
+        db = _FakeSession(rowcount=2)
+        ids = [uuid.uuid4(), uuid.uuid4(), uuid.uuid4()]
+        count = asyncio.run(UserAlertAcknowledgmentRepository(db).acknowledge_many(self.user_id, ids))
+        self.assertEqual(count, 2)
+        sql = _sql(db.statements[0])
+        self.assertIn("safety_alerts.alert_id IN (", sql)
+        self.assertNotIn("is_official", sql)
+        self.assertIn("ON CONFLICT (user_id, alert_id) DO NOTHING", sql)
+
+    def test_empty_id_list_runs_nothing(self):
+        db = _FakeSession(rowcount=9)
+        count = asyncio.run(UserAlertAcknowledgmentRepository(db).acknowledge_many(self.user_id, []))
+        self.assertEqual(count, 0)
+        self.assertEqual(db.statements, [])
+
+    def test_missing_rowcount_counts_as_zero(self):
+        db = _FakeSession(rowcount=None)
+        self.assertEqual(asyncio.run(UserAlertAcknowledgmentRepository(db).acknowledge_many(self.user_id)), 0)
+
+
+class TestAcknowledgeRequest(unittest.TestCase):
+    def test_empty_body_means_all_pending(self):
+        self.assertIsNone(SafetyAlertAcknowledgeRequest.model_validate({}).alert_ids)
+
+    def test_accepts_camel_case_ids(self):
+        alert_id = uuid.uuid4()
+        request = SafetyAlertAcknowledgeRequest.model_validate({"alertIds": [str(alert_id)]})
+        self.assertEqual(request.alert_ids, [alert_id])
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)
@@ -0,0 +1,131 @@
+"""
+Unit tests for the read-through cache layer.
+
+No database required; the shared backend is replaced by an in-memory dict.
+
+Run with:
+    cd backend
+    python -m pytest test_cache.py -v
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, "app")
+
+# Settings are read at import time; provide dummies so no .env is needed.
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
+os.environ.setdefault("DATABASE_URL_ASYNC", "postgresql+asyncpg://test@localhost/test")
+os.environ.setdefault("CLERK_SECRET_KEY", "test")
+os.environ.setdefault("CLERK_DOMAIN", "example.com")
+
+from core.cache import Cache, NullBackend  # type: ignore[import]  # noqa: E402
+
+
+class DictBackend:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl_seconds):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+
+def _counting_loader(value, calls, delay=0.0):
+    async def load():
+        calls.append(1)
+        if delay:
+            await asyncio.sleep(delay)
+        return value
+    return load
+
+
+class TestCache(unittest.IsolatedAsyncioTestCase):
+    async def test_hit_after_miss(self):
+        cache = Cache("t-hit", list[int], ttl_seconds=60, backend=NullBackend())
+        calls = []
+        self.assertEqual(await cache.get_or_load("k", _counting_loader([1], calls)), [1])
+        self.assertEqual(await cache.get_or_load("k", _counting_loader([2], calls)), [1])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    async def test_lru_evicts_least_recently_used(self):
+        cache = Cache("t-lru", int, ttl_seconds=60, max_entries=2, backend=NullBackend())
+        calls = []
+        await cache.get_or_load("a", _counting_loader(1, calls))
+        await cache.get_or_load("b", _counting_loader(2, calls))
+        await cache.get_or_load("a", _counting_loader(1, calls))  # a is now most recent
+        await cache.get_or_load("c", _counting_loader(3, calls))  # evicts b
+        self.assertEqual(cache.stats()["entries"], 2)
+        await cache.get_or_load("a", _counting_loader(1, calls))
+        self.assertEqual(len(calls), 3)
+        await cache.get_or_load("b", _counting_loader(2, calls))
+        self.assertEqual(len(calls), 4)
+
+    async def test_expired_entry_reloads(self):
+        cache = Cache("t-ttl", int, ttl_seconds=10, backend=NullBackend())
+        calls = []
+        with patch("core.cache.time.monotonic", return_value=100.0):
+            await cache.get_or_load("k", _counting_loader(1, calls))
+        with patch("core.cache.time.monotonic", return_value=111.0):
+            await cache.get_or_load("k", _counting_loader(1, calls))
+        self.assertEqual(len(calls), 2)
+
+    async def test_concurrent_misses_share_one_load(self):
+        cache = Cache("t-flight", int, ttl_seconds=60, backend=NullBackend())
+        calls = []
+        results = await asyncio.gather(
+            *(cache.get_or_load("k", _counting_loader(7, calls, delay=0.01)) for _ in range(10))
+        )
+        self.assertEqual(results, [7] * 10)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.coalesced, 9)
+
+    async def test_load_error_reaches_every_waiter_and_is_not_cached(self):
+        cache = Cache("t-error", int, ttl_seconds=60, backend=NullBackend())
+
+        async def boom():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("down")
+
+        results = await asyncio.gather(
+            *(cache.get_or_load("k", boom) for _ in range(3)), return_exceptions=True
+        )
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+        self.assertEqual(cache.load_errors, 1)
+        self.assertEqual(await cache.get_or_load("k", _counting_loader(1, [])), 1)
+
+    async def test_shared_backend_serves_other_workers(self):
+        backend = DictBackend()
+        first = Cache("t-shared-a", list[int], ttl_seconds=60, backend=backend)
+        second = Cache("t-shared-b", list[int], ttl_seconds=60, backend=backend)
+        second.name = first.name  # same logical cache on another worker
+        calls = []
+        await first.get_or_load("k", _counting_loader([1, 2], calls))
+        self.assertEqual(await second.get_or_load("k", _counting_loader([9], calls)), [1, 2])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(second.shared_hits, 1)
+
+    async def test_invalidate_drops_local_and_shared(self):
+        backend = DictBackend()
+        cache = Cache("t-invalidate", int, ttl_seconds=60, backend=backend)
+        calls = []
+        await cache.get_or_load("k", _counting_loader(1, calls))
+        cache.invalidate("k")
+        await asyncio.sleep(0)
+        self.assertEqual(backend.data, {})
+        await cache.get_or_load("k", _counting_loader(1, calls))
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)
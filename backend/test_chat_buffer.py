@@ -0,0 +1,158 @@
+"""
+Unit tests for the in-memory event-chat ring buffer.
+
+No database required.
+
+Run with:
+    cd backend
+    python -m pytest test_chat_buffer.py -v
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, "app")
+
+# Settings are read at import time; provide dummies so no .env is needed.
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
+os.environ.setdefault("DATABASE_URL_ASYNC", "postgresql+asyncpg://test@localhost/test")
+os.environ.setdefault("CLERK_SECRET_KEY", "test")
+os.environ.setdefault("CLERK_DOMAIN", "example.com")
+
+from core.chat_buffer import EventChatBuffer  # type: ignore[import]  # noqa: E402
+from schemas.event_chat import EventChatRead  # type: ignore[import]  # noqa: E402
+
+BASE = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _msg(event_id, seconds, text="hi"):
+    return EventChatRead(
+        message_id=uuid.uuid4(),
+        event_id=event_id,
+        user_id=uuid.uuid4(),
+        message_text=text,
+        timestamp=BASE + timedelta(seconds=seconds),
+    )
+
+
+def _seed(buffer, event_id, messages, limit):
+    version = buffer.begin_seed(event_id)
+    buffer.seed(event_id, messages, limit, version)
+
+
+class TestEventChatBuffer(unittest.TestCase):
+    def setUp(self):
+        self.event_id = uuid.uuid4()
+
+    def test_unknown_room_misses(self):
+        buffer = EventChatBuffer(capacity=10)
+        self.assertIsNone(buffer.read(self.event_id, limit=5))
+
+    def test_unseeded_room_misses(self):
+        buffer = EventChatBuffer(capacity=10)
+        buffer.begin_seed(self.event_id)
+        self.assertIsNone(buffer.read(self.event_id, limit=5))
+
+    def test_complete_history_serves_initial_load_and_polls(self):
+        buffer = EventChatBuffer(capacity=10)
+        messages = [_msg(self.event_id, i) for i in range(3)]
+        _seed(buffer, self.event_id, messages, limit=10)
+
+        self.assertEqual(buffer.read(self.event_id, limit=50), messages)
+        self.assertEqual(buffer.read(self.event_id, limit=50, since=BASE), messages[1:])
+        self.assertEqual(buffer.read(self.event_id, limit=1, since=BASE), messages[1:2])
+        self.assertEqual(buffer.read(self.event_id, limit=50, since=BASE - timedelta(days=1)), messages)
+
+    def test_cursor_older_than_floor_misses(self):
+        buffer = EventChatBuffer(capacity=10)
+        messages = [_msg(self.event_id, i) for i in range(5, 10)]
+        _seed(buffer, self.event_id, messages, limit=5)
+
+        self.assertIsNone(buffer.read(self.event_id, limit=50, since=BASE))
+        self.assertEqual(
+            buffer.read(self.event_id, limit=50, since=BASE + timedelta(seconds=7)),
+            messages[3:],
+        )
+        # Only five rows buffered, and older history exists.
+        self.assertIsNone(buffer.read(self.event_id, limit=6))
+
+    def test_capacity_trims_oldest_and_raises_floor(self):
+        buffer = EventChatBuffer(capacity=3)
+        _seed(buffer, self.event_id, [], limit=3)
+        messages = [_msg(self.event_id, i) for i in range(5)]
+        for message in messages:
+            buffer.add(message)
+
+        self.assertEqual(buffer.read(self.event_id, limit=3), messages[2:])
+        self.assertIsNone(buffer.read(self.event_id, limit=50, since=BASE))
+        self.assertEqual(
+            buffer.read(self.event_id, limit=50, since=BASE + timedelta(seconds=1)),
+            messages[2:],
+        )
+
+    def test_out_of_order_add_keeps_timestamp_order(self):
+        buffer = EventChatBuffer(capacity=10)
+        _seed(buffer, self.event_id, [], limit=10)
+        late, early = _msg(self.event_id, 5), _msg(self.event_id, 2)
+        buffer.add(late)
+        buffer.add(early)
+        buffer.add(early)
+        self.assertEqual(buffer.read(self.event_id, limit=10), [early, late])
+
+    def test_delete_notification_discards(self):
+        buffer = EventChatBuffer(capacity=10)
+        messages = [_msg(self.event_id, i) for i in range(3)]
+        _seed(buffer, self.event_id, messages, limit=10)
+
+        buffer.on_notification(str(self.event_id), "delete", str(messages[1].message_id))
+        self.assertEqual(buffer.read(self.event_id, limit=10), [messages[0], messages[2]])
+
+    def test_remote_post_marks_stale_until_caught_up(self):
+        buffer = EventChatBuffer(capacity=10)
+        messages = [_msg(self.event_id, i) for i in range(2)]
+        _seed(buffer, self.event_id, messages, limit=10)
+        remote = _msg(self.event_id, 3)
+
+        # Our own posts are already buffered and do not invalidate.
+        buffer.on_notification(str(self.event_id), "post", str(messages[0].message_id))
+        self.assertFalse(buffer.is_stale(self.event_id))
+
+        buffer.on_notification(str(self.event_id), "post", str(remote.message_id))
+        self.assertTrue(buffer.is_stale(self.event_id))
+        self.assertIsNone(buffer.read(self.event_id, limit=10))
+
+        calls = []
+
+        async def fetch(since, limit):
+            calls.append(since)
+            return [messages[1], remote]
+
+        asyncio.run(buffer.refresh_stale(self.event_id, fetch))
+        self.assertEqual(len(calls), 1)
+        self.assertLess(calls[0], messages[1].timestamp)
+        self.assertEqual(buffer.read(self.event_id, limit=10), messages + [remote])
+
+    def test_notification_during_seed_leaves_room_stale(self):
+        buffer = EventChatBuffer(capacity=10)
+        version = buffer.begin_seed(self.event_id)
+        buffer.on_notification(str(self.event_id), "post", str(uuid.uuid4()))
+        buffer.seed(self.event_id, [_msg(self.event_id, 0)], 10, version)
+        self.assertTrue(buffer.is_stale(self.event_id))
+
+    def test_room_count_is_bounded(self):
+        buffer = EventChatBuffer(capacity=10, max_rooms=2)
+        rooms = [uuid.uuid4() for _ in range(3)]
+        for event_id in rooms:
+            _seed(buffer, event_id, [], limit=10)
+        self.assertEqual(len(buffer), 2)
+        self.assertIsNone(buffer.read(rooms[0], limit=10))
+        self.assertEqual(buffer.read(rooms[2], limit=10), [])
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)
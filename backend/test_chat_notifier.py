@@ -0,0 +1,118 @@
+"""
+Unit tests for the event-chat listener's reconnect behaviour.
+
+No database required; ``asyncpg.connect`` is replaced with a fake.
+
+Run with:
+    cd backend
+    python -m pytest test_chat_notifier.py -v
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.insert(0, "app")
+
+# Settings are read at import time; provide dummies so no .env is needed.
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
+os.environ.setdefault("DATABASE_URL_ASYNC", "postgresql+asyncpg://test@localhost/test")
+os.environ.setdefault("CLERK_SECRET_KEY", "test")
+os.environ.setdefault("CLERK_DOMAIN", "example.com")
+
+import core.chat_notifier as chat_notifier_module  # type: ignore[import]  # noqa: E402
+from core.chat_notifier import EventChatNotifier  # type: ignore[import]  # noqa: E402
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def add_listener(self, channel, callback):
+        pass
+
+    def add_termination_listener(self, callback):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeConnect:
+    def __init__(self, fail: bool = True):
+        self.fail = fail
+        self.calls = []
+
+    async def __call__(self, dsn, timeout=None):
+        self.calls.append(timeout)
+        if self.fail:
+            raise OSError("connection refused")
+        return _FakeConnection()
+
+
+class TestListenerReconnect(unittest.TestCase):
+    def setUp(self):
+        self._connect = chat_notifier_module.asyncpg.connect
+        self.connect = _FakeConnect()
+        chat_notifier_module.asyncpg.connect = self.connect
+
+    def tearDown(self):
+        chat_notifier_module.asyncpg.connect = self._connect
+
+    def test_failed_connect_backs_off(self):
+        notifier = EventChatNotifier("postgresql://test@localhost/test", connect_timeout=2.0, retry_after=30.0)
+
+        async def run():
+            first = await notifier._ensure_listener()
+            second = await notifier._ensure_listener()
+            return first, second
+
+        self.assertEqual(asyncio.run(run()), (False, False))
+        self.assertEqual(self.connect.calls, [2.0])
+
+    def test_retries_once_backoff_elapses(self):
+        notifier = EventChatNotifier("postgresql://test@localhost/test", retry_after=0.0)
+
+        async def run():
+            await notifier._ensure_listener()
+            self.connect.fail = False
+            return await notifier._ensure_listener()
+
+        self.assertTrue(asyncio.run(run()))
+        self.assertEqual(len(self.connect.calls), 2)
+        self.assertTrue(notifier.is_listening)
+
+    def test_poll_does_not_wait_for_connect(self):
+        notifier = EventChatNotifier("postgresql://test@localhost/test")
+        self.connect.fail = False
+
+        async def run():
+            listening = notifier.listening_or_reconnect()
+            self.assertEqual(self.connect.calls, [])
+            await notifier._reconnect
+            return listening
+
+        self.assertFalse(asyncio.run(run()))
+        self.assertTrue(notifier.is_listening)
+        self.assertTrue(notifier.listening_or_reconnect())
+
+    def test_poll_skips_reconnect_while_backing_off(self):
+        notifier = EventChatNotifier("postgresql://test@localhost/test", retry_after=30.0)
+
+        async def run():
+            await notifier._ensure_listener()
+            notifier._reconnect = None
+            self.assertFalse(notifier.listening_or_reconnect())
+            return notifier._reconnect
+
+        self.assertIsNone(asyncio.run(run()))
+        self.assertEqual(len(self.connect.calls), 1)
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)
@@ -0,0 +1,175 @@
+"""
+Unit tests for ESPNClient's conditional fetches and on-disk response cache.
+
+Runs against a local stub HTTP server; no network access to ESPN.
+
+Run with:
+    cd backend
+    python -m pytest test_espn_response_cache.py -v
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, "app")
+
+# Settings are read at import time; provide dummies so no .env is needed.
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
+os.environ.setdefault("DATABASE_URL_ASYNC", "postgresql+asyncpg://test@localhost/test")
+os.environ.setdefault("CLERK_SECRET_KEY", "test")
+os.environ.setdefault("CLERK_DOMAIN", "example.com")
+
+from scheduled.espn_client import ESPNClient  # type: ignore[import]  # noqa: E402
+from scheduled.response_cache import ResponseCache  # type: ignore[import]  # noqa: E402
+
+
+class StubESPN:
+    """Serves one teams payload; honours If-None-Match when use_etag is set."""
+
+    def __init__(self):
+        self.body = json.dumps({"sports": [{"leagues": [{"teams": []}]}]}).encode()
+        self.use_etag = True
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                etag = f'"{hash(stub.body)}"'
+                stub.requests.append(dict(self.headers))
+                if stub.use_etag and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(stub.body)))
+                if stub.use_etag:
+                    self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(stub.body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestESPNResponseCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.stub = StubESPN()
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.stub.stop()
+        self.tmp.cleanup()
+
+    def _client(self):
+        return ESPNClient(cache=ResponseCache(self.tmp.name), base_url=self.stub.base_url)
+
+    async def _teams(self):
+        client = self._client()
+        try:
+            return client, await client.get_teams("basketball", "nba")
+        finally:
+            await client.close()
+
+    async def test_unchanged_after_applied_and_served_from_304(self):
+        client, first = await self._teams()
+        self.assertTrue(first.changed)
+        client.mark_applied(first)
+
+        _, second = await self._teams()
+        self.assertFalse(second.changed)
+        self.assertEqual(second.data, first.data)
+        self.assertIn("if-none-match", {k.lower() for k in self.stub.requests[-1]})
+
+    async def test_not_applied_stays_changed(self):
+        await self._teams()
+        _, second = await self._teams()
+        self.assertTrue(second.changed)
+
+    async def test_new_content_is_changed(self):
+        client, first = await self._teams()
+        client.mark_applied(first)
+        self.stub.body = json.dumps({"sports": []}).encode()
+        _, second = await self._teams()
+        self.assertTrue(second.changed)
+        self.assertEqual(second.data, {"sports": []})
+
+    async def test_identical_body_without_validators_is_unchanged(self):
+        self.stub.use_etag = False
+        client, first = await self._teams()
+        client.mark_applied(first)
+        _, second = await self._teams()
+        self.assertFalse(second.changed)
+
+    async def test_304_keeps_entry_fresh(self):
+        client, first = await self._teams()
+        key = first.cache_key
+        cache = ResponseCache(self.tmp.name)
+        old = time.time() - 30 * 86400
+        for suffix in (".json", ".body"):
+            os.utime(os.path.join(self.tmp.name, key + suffix), (old, old))
+
+        await self._teams()
+        self.assertEqual(cache.prune(7 * 86400), 0)
+        self.assertIsNotNone(cache.load(key))
+
+    async def test_schedule_payloads_do_not_track_applied(self):
+        client = self._client()
+        try:
+            first = await client.get_schedule("basketball", "nba")
+            client.mark_applied(first)
+            second = await client.get_schedule("basketball", "nba")
+        finally:
+            await client.close()
+        self.assertTrue(second.changed)
+
+
+class TestResponseCachePrune(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, name: str, age_days: float) -> str:
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "wb") as fh:
+            fh.write(b"{}")
+        mtime = time.time() - age_days * 86400
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_removes_only_old_cache_files(self):
+        old = [self._write("a.json", 10), self._write("a.body", 10), self._write(".tmp-abc", 10)]
+        fresh = [self._write("b.json", 1), self._write("b.body", 1)]
+        unrelated = self._write("notes.txt", 10)
+
+        self.assertEqual(self.cache.prune(7 * 86400), 3)
+        for path in old:
+            self.assertFalse(os.path.exists(path))
+        for path in fresh + [unrelated]:
+            self.assertTrue(os.path.exists(path))
+
+    def test_nothing_to_prune(self):
+        self.assertEqual(self.cache.prune(7 * 86400), 0)
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)
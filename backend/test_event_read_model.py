@@ -0,0 +1,171 @@
+"""
+Unit tests for the event listing read model and reference-data snapshot.
+
+No database required; rows are plain namespaces and the session is faked.
+
+Run with:
+    cd backend
+    python -m pytest test_event_read_model.py -v
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+sys.path.insert(0, "app")
+
+# Settings are read at import time; provide dummies so no .env is needed.
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
+os.environ.setdefault("DATABASE_URL_ASYNC", "postgresql+asyncpg://test@localhost/test")
+os.environ.setdefault("CLERK_SECRET_KEY", "test")
+os.environ.setdefault("CLERK_DOMAIN", "example.com")
+
+from repositories.event_read_model_repo import EventView, GameView  # type: ignore[import]  # noqa: E402
+from repositories.event_repo import _map_event_to_read, _map_game_to_read  # type: ignore[import]  # noqa: E402
+from repositories.reference_data_repo import (  # type: ignore[import]  # noqa: E402
+    LeagueRef,
+    ReferenceSnapshot,
+    ReferenceStore,
+    TeamRef,
+    TypeRef,
+    VenueRef,
+)
+from schemas.converters import convert_event_to_read  # type: ignore[import]  # noqa: E402
+
+GAME_TIME = datetime(2026, 11, 1, 19, 30)
+
+
+def make_ref() -> ReferenceSnapshot:
+    return ReferenceSnapshot(
+        version=1,
+        leagues={"NBA": LeagueRef(league_code="NBA", league_name="NBA")},
+        teams={
+            1: TeamRef(team_id=1, league_id="NBA", team_name="Lakers", display_name="Los Angeles Lakers", logo_url="lal.png"),
+            2: TeamRef(team_id=2, league_id="NBA", team_name="Celtics", display_name="Boston Celtics", logo_url="bos.png"),
+        },
+        venues={7: VenueRef(venue_id=7, name="Crypto.com Arena", latitude=34.04, longitude=-118.27)},
+        event_types={"tailgate": TypeRef(code="tailgate", type_name="Tailgate")},
+        alert_types={},
+    )
+
+
+def event_row(**overrides):
+    fields = dict(
+        event_id=uuid.uuid4(), game_id=99, event_type_id="tailgate", title="Pregame", description=None,
+        picture_url=None, game_date=GAME_TIME, created_at=GAME_TIME, latitude=None, longitude=None,
+        venue_id=7, game_date_time=GAME_TIME, home_team_id=1, away_team_id=2, league_id="NBA", game_venue_id=7,
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+class TestViewsFeedExistingMappers(unittest.TestCase):
+    def test_event_view(self):
+        read = _map_event_to_read(EventView(event_row(), make_ref()), is_saved=True)
+        self.assertEqual(read.event_type.value.upper(), "TAILGATE")
+        self.assertEqual(read.venue_name, "Crypto.com Arena")
+        self.assertEqual((read.location.lat, read.location.lng), (34.04, -118.27))
+        self.assertEqual((read.team_logos.home, read.team_logos.away), ("lal.png", "bos.png"))
+        self.assertEqual(read.league.value, "NBA")
+        self.assertTrue(read.is_user_created)
+        self.assertTrue(read.is_saved)
+
+    def test_event_without_game(self):
+        row = event_row(game_id=None, game_date_time=None, home_team_id=None, away_team_id=None,
+                        league_id=None, game_venue_id=None, venue_id=None, latitude=40.0, longitude=-74.0)
+        view = EventView(row, make_ref())
+        self.assertIsNone(view.game)
+        read = convert_event_to_read(view)
+        self.assertIsNone(read.team_logos)
+        self.assertEqual((read.location.lat, read.location.lng), (40.0, -74.0))
+
+    def test_game_view(self):
+        view = GameView(99, GAME_TIME, 1, 2, "NBA", 7, make_ref())
+        read = _map_game_to_read(view)
+        self.assertEqual(read.event_name, "Boston Celtics @ Los Angeles Lakers")
+        self.assertEqual(read.image_url, "lal.png")
+        self.assertEqual(read.game_id, 99)
+
+
+class _Rows:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+    def scalar_one_or_none(self):
+        return self.rows[0] if self.rows else None
+
+
+class FakeDB:
+    def __init__(self, version: int = 1):
+        self.version = version
+        self.statements = []
+
+    async def execute(self, stmt):
+        sql = str(stmt)
+        self.statements.append(sql)
+        if "FROM reference_data_version" in sql:
+            return _Rows([self.version])
+        if "FROM teams" in sql:
+            row = dict(team_id=3, league_id="NBA", team_name="Knicks", display_name="New York Knicks", logo_url=None)
+            return _Rows([SimpleNamespace(_mapping=row, **row)] if "IN" in sql else [])
+        return _Rows([])
+
+
+class TestReferenceStore(unittest.TestCase):
+    def test_tops_up_missing_ids_copy_on_write(self):
+        async def run():
+            store = ReferenceStore()
+            db = FakeDB()
+            first = await store.current(db)
+            self.assertEqual(len(db.statements), 6)
+            again = await store.current(db, team_ids=[3])
+            self.assertIsNot(first, again)
+            self.assertNotIn(3, first.teams)
+            self.assertEqual(again.team(3).display_name, "New York Knicks")
+            self.assertIs(store.snapshot, again)
+            await store.current(db, team_ids=[3])
+            self.assertEqual(len(db.statements), 7)
+
+        asyncio.run(run())
+
+    def test_reloads_only_when_version_moves(self):
+        async def run():
+            store = ReferenceStore(check_interval=0)
+            db = FakeDB(version=1)
+            first = await store.current(db)
+            self.assertIs(await store.current(db), first)
+            self.assertEqual(store.loads, 1)
+            db.version = 2
+            second = await store.current(db)
+            self.assertIsNot(second, first)
+            self.assertEqual((second.version, store.loads), (2, 2))
+
+        asyncio.run(run())
+
+    def test_concurrent_misses_load_once(self):
+        async def run():
+            store = ReferenceStore()
+            db = FakeDB()
+            snapshots = await asyncio.gather(*(store.current(db) for _ in range(5)))
+            self.assertEqual(store.loads, 1)
+            self.assertTrue(all(snapshot is snapshots[0] for snapshot in snapshots))
+
+        asyncio.run(run())
+
+    def test_snapshot_is_read_only(self):
+        ref = make_ref()
+        with self.assertRaises(TypeError):
+            ref.teams[9] = ref.team(1)
+        self.assertEqual(ref.event_type("tailgate").type_name, "Tailgate")
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)
@@ -0,0 +1,55 @@
+"""
+Unit tests for the favorite counters behind featured events.
+
+No database required; the session is faked and statements are compiled.
+
+Run with:
+    cd backend
+    python -m pytest test_favorite_counts.py -v
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+import uuid
+
+sys.path.insert(0, "app")
+
+# Settings are read at import time; provide dummies so no .env is needed.
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
+os.environ.setdefault("DATABASE_URL_ASYNC", "postgresql+asyncpg://test@localhost/test")
+os.environ.setdefault("CLERK_SECRET_KEY", "test")
+os.environ.setdefault("CLERK_DOMAIN", "example.com")
+
+from sqlalchemy.dialects import postgresql  # noqa: E402
+
+from repositories.favorite_repo import adjust_favorite_count  # type: ignore[import]  # noqa: E402
+
+
+class FakeDB:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+
+
+class TestAdjustFavoriteCount(unittest.TestCase):
+    def test_event_counter_clamps_and_keeps_updated_at(self):
+        db = FakeDB()
+        asyncio.run(adjust_favorite_count(db, event_id=uuid.uuid4(), delta=-1))
+        (sql,) = db.statements
+        self.assertIn("UPDATE events SET favorite_count=greatest(events.favorite_count +", sql)
+        self.assertIn("updated_at=events.updated_at", sql)
+
+    def test_game_counter(self):
+        db = FakeDB()
+        asyncio.run(adjust_favorite_count(db, game_id=7, delta=1))
+        (sql,) = db.statements
+        self.assertIn("UPDATE games SET favorite_count=greatest(games.favorite_count +", sql)
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)
@@ -0,0 +1,87 @@
+"""
+Unit tests for the nightly scraper's fetch scheduler.
+
+No network required; requests are served by an httpx.MockTransport.
+
+Run with:
+    cd backend
+    python -m pytest test_fetch_scheduler.py -v
+"""
+
+import asyncio
+import sys
+import unittest
+
+import httpx
+
+sys.path.insert(0, "app")
+
+from scheduled.fetch_scheduler import FetchScheduler  # type: ignore[import]  # noqa: E402
+
+
+def _scheduler(**kwargs):
+    kwargs.setdefault("base_delay", 0.001)
+    kwargs.setdefault("max_delay", 0.001)
+    return FetchScheduler(**kwargs)
+
+
+class TestFetchScheduler(unittest.IsolatedAsyncioTestCase):
+    async def test_retries_server_errors_then_succeeds(self):
+        statuses = [503, 502, 200]
+
+        def handler(request):
+            return httpx.Response(statuses.pop(0))
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            response = await _scheduler().get(client, "https://espn.test/a")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(statuses, [])
+
+    async def test_client_errors_are_not_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(404)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            response = await _scheduler().get(client, "https://espn.test/a")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(len(calls), 1)
+
+    async def test_gives_up_after_max_attempts(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ConnectError("refused", request=request)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with self.assertRaises(httpx.ConnectError):
+                await _scheduler(max_attempts=3).get(client, "https://espn.test/a")
+        self.assertEqual(len(calls), 3)
+
+    async def test_per_host_limit(self):
+        in_flight = {"espn.test": 0, "other.test": 0}
+        peak = dict(in_flight)
+
+        async def handler(request):
+            host = request.url.host
+            in_flight[host] += 1
+            peak[host] = max(peak[host], in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            return httpx.Response(200)
+
+        scheduler = _scheduler(per_host_limit=2)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            await asyncio.gather(
+                *(scheduler.get(client, f"https://espn.test/{i}") for i in range(8)),
+                *(scheduler.get(client, f"https://other.test/{i}") for i in range(8)),
+            )
+        self.assertEqual(peak, {"espn.test": 2, "other.test": 2})
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)
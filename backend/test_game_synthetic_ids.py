@@ -0,0 +1,68 @@
+"""
+Unit tests for the synthetic game UUID helpers.
+
+No database required.
+
+Run with:
+    cd backend
+    python -m pytest test_game_synthetic_ids.py -v
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+import uuid
+
+sys.path.insert(0, "app")
+
+# Settings are read at import time; provide dummies so no .env is needed.
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
+os.environ.setdefault("DATABASE_URL_ASYNC", "postgresql+asyncpg://test@localhost/test")
+os.environ.setdefault("CLERK_SECRET_KEY", "test")
+os.environ.setdefault("CLERK_DOMAIN", "example.com")
+
+from repositories import game_synthetic_id_repo  # type: ignore[import]  # noqa: E402
+from repositories.game_synthetic_id_repo import (  # type: ignore[import]  # noqa: E402
+    GameSyntheticIdRepository,
+    synthetic_game_event_id,
+)
+
+
+class _NoQuerySession:
+    """Fails the test if the repository reaches the database."""
+
+    async def execute(self, *_args, **_kwargs):
+        raise AssertionError("lookup should have been served from the reverse cache")
+
+
+class TestSyntheticGameEventId(unittest.TestCase):
+    def setUp(self):
+        game_synthetic_id_repo._REVERSE_CACHE.clear()
+
+    def test_matches_legacy_uuid5_scheme(self):
+        self.assertEqual(
+            synthetic_game_event_id(401547),
+            uuid.uuid5(uuid.NAMESPACE_DNS, "game:401547"),
+        )
+
+    def test_generated_ids_resolve_without_a_query(self):
+        synthetic_id = synthetic_game_event_id(42)
+        repo = GameSyntheticIdRepository(_NoQuerySession())
+        self.assertEqual(asyncio.run(repo.get_game_id(synthetic_id)), 42)
+
+    def test_reverse_cache_is_bounded(self):
+        original = game_synthetic_id_repo._REVERSE_CACHE_MAX
+        game_synthetic_id_repo._REVERSE_CACHE_MAX = 3
+        try:
+            for game_id in range(10):
+                synthetic_game_event_id(game_id)
+            self.assertEqual(len(game_synthetic_id_repo._REVERSE_CACHE), 3)
+            self.assertEqual(list(game_synthetic_id_repo._REVERSE_CACHE.values()), [7, 8, 9])
+        finally:
+            game_synthetic_id_repo._REVERSE_CACHE_MAX = original
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)
@@ -0,0 +1,77 @@
+"""
+Unit tests for the nearby-search grid cells.
+
+No database required.
+
+Run with:
+    cd backend
+    python -m pytest test_geo_grid.py -v
+"""
+
+import math
+import random
+import sys
+import unittest
+
+sys.path.insert(0, "app")
+
+from core.geo_grid import GRID_COLS, GRID_ROWS, cell_for, cell_ranges  # type: ignore[import]  # noqa: E402
+
+
+def _haversine_miles(lat1, lng1, lat2, lng2):
+    lng1, lat1, lng2, lat2 = map(math.radians, [lng1, lat1, lng2, lat2])
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    return 2 * 3959 * math.asin(math.sqrt(a))
+
+
+def _destination(lat, lng, bearing_deg, miles):
+    """Point *miles* from (lat, lng) along *bearing_deg*."""
+    d = miles / 3959
+    lat1, lng1, brng = map(math.radians, [lat, lng, bearing_deg])
+    lat2 = math.asin(math.sin(lat1) * math.cos(d) + math.cos(lat1) * math.sin(d) * math.cos(brng))
+    lng2 = lng1 + math.atan2(
+        math.sin(brng) * math.sin(d) * math.cos(lat1),
+        math.cos(d) - math.sin(lat1) * math.sin(lat2),
+    )
+    lng2 = (math.degrees(lng2) + 540) % 360 - 180
+    return math.degrees(lat2), lng2
+
+
+def _covered(cell, ranges):
+    return any(lo <= cell <= hi for lo, hi in ranges)
+
+
+class TestGeoGrid(unittest.TestCase):
+    def test_cell_bounds(self):
+        self.assertEqual(cell_for(-90, -180), 0)
+        self.assertEqual(cell_for(90, 180), GRID_ROWS * GRID_COLS - 1)
+
+    def test_ranges_cover_every_point_in_radius(self):
+        rng = random.Random(42)
+        centres = [(42.35, -71.06), (33.45, -112.07), (64.8, -147.7), (-33.9, 151.2), (0.0, 179.9), (10.0, -179.8)]
+        for lat, lng in centres:
+            for radius in (1, 50, 250, 500):
+                ranges = cell_ranges(lat, lng, radius)
+                for _ in range(200):
+                    miles = radius * math.sqrt(rng.random())
+                    p_lat, p_lng = _destination(lat, lng, rng.uniform(0, 360), miles)
+                    self.assertLessEqual(_haversine_miles(lat, lng, p_lat, p_lng), radius + 1e-6)
+                    self.assertTrue(
+                        _covered(cell_for(p_lat, p_lng), ranges),
+                        f"{(p_lat, p_lng)} within {radius}mi of {(lat, lng)} not covered",
+                    )
+
+    def test_small_radius_is_a_few_ranges(self):
+        ranges = cell_ranges(42.35, -71.06, 50)
+        self.assertLessEqual(len(ranges), 4)
+        self.assertLessEqual(sum(hi - lo + 1 for lo, hi in ranges), 24)
+
+    def test_antimeridian_wraps_without_scanning_whole_rows(self):
+        ranges = cell_ranges(0.0, 179.9, 50)
+        self.assertTrue(_covered(cell_for(0.0, -179.9), ranges))
+        self.assertLess(sum(hi - lo + 1 for lo, hi in ranges), 50)
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)
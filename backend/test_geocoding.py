@@ -0,0 +1,123 @@
+"""
+Unit tests for the venue geocoding queue.
+
+No database or network required: the geocoder is a stub and the cache and
+venue rows live in an in-memory store.
+
+Run with:
+    cd backend
+    python -m pytest test_geocoding.py -v
+"""
+
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, "app")
+
+# Settings are read at import time; provide dummies so no .env is needed.
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
+os.environ.setdefault("DATABASE_URL_ASYNC", "postgresql+asyncpg://test@localhost/test")
+os.environ.setdefault("CLERK_SECRET_KEY", "test")
+os.environ.setdefault("CLERK_DOMAIN", "example.com")
+
+from scheduled.geocoding import GeocodeQueue, normalize_query  # type: ignore[import]  # noqa: E402
+
+FENWAY = ("Fenway Park", "Boston", "MA")
+
+
+class MemoryStore:
+    def __init__(self):
+        self.cache = {}
+        self.venues = {}
+
+    async def get(self, query_keys):
+        return {key: self.cache[key][0] for key in query_keys if key in self.cache}
+
+    async def put(self, query_key, coordinates, ttl_seconds):
+        self.cache[query_key] = (coordinates, ttl_seconds)
+
+    async def fill_venue(self, venue_id, coordinates):
+        self.venues.setdefault(venue_id, coordinates)
+
+
+class StubGeocoder:
+    def __init__(self, answers):
+        self.answers = answers
+        self.calls = []
+
+    def __call__(self, query):
+        self.calls.append((query, time.monotonic()))
+        answer = self.answers.get(query)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+
+def _queue(store, geocoder, **kwargs):
+    kwargs.setdefault("min_interval", 0.0)
+    return GeocodeQueue(store, geocoder, ttl_seconds=100, miss_ttl_seconds=10, **kwargs)
+
+
+class TestGeocodeQueue(unittest.IsolatedAsyncioTestCase):
+    async def test_fills_venue_and_caches_hit(self):
+        store = MemoryStore()
+        geocoder = StubGeocoder({"Fenway Park, Boston, MA": (42.35, -71.10)})
+        queue = _queue(store, geocoder)
+        queue.enqueue({1: FENWAY})
+        self.assertTrue(await queue.drain(timeout=1))
+        await queue.close()
+        self.assertEqual(store.venues, {1: (42.35, -71.10)})
+        self.assertEqual(store.cache[normalize_query("Fenway Park, Boston, MA")], ((42.35, -71.10), 100))
+        self.assertEqual(await queue.cached({2: FENWAY}), {2: (42.35, -71.10)})
+
+    async def test_falls_back_and_negative_caches_the_miss(self):
+        store = MemoryStore()
+        geocoder = StubGeocoder({"Boston, MA": (42.36, -71.06)})
+        queue = _queue(store, geocoder)
+        queue.enqueue({1: FENWAY})
+        await queue.drain(timeout=1)
+        await queue.close()
+        self.assertEqual([q for q, _ in geocoder.calls], ["Fenway Park, Boston, MA", "Boston, MA"])
+        self.assertEqual(store.cache[normalize_query("Fenway Park, Boston, MA")], (None, 10))
+        self.assertEqual(store.venues, {1: (42.36, -71.06)})
+        self.assertEqual(await queue.cached({1: FENWAY}), {1: (42.36, -71.06)})
+
+    async def test_all_misses_are_settled_by_the_cache(self):
+        store = MemoryStore()
+        queue = _queue(store, StubGeocoder({}))
+        queue.enqueue({1: FENWAY})
+        await queue.drain(timeout=1)
+        await queue.close()
+        self.assertEqual(queue.not_found, 1)
+        self.assertEqual(await queue.cached({1: FENWAY}), {1: None})
+
+    async def test_errors_are_not_cached(self):
+        store = MemoryStore()
+        queue = _queue(store, StubGeocoder({"Fenway Park, Boston, MA": TimeoutError("slow")}))
+        queue.enqueue({1: FENWAY})
+        await queue.drain(timeout=1)
+        await queue.close()
+        self.assertEqual(store.cache, {})
+        self.assertEqual(await queue.cached({1: FENWAY}), {})
+
+    async def test_shared_query_is_looked_up_once_and_rate_limited(self):
+        store = MemoryStore()
+        geocoder = StubGeocoder({
+            "Arena, Boston, MA": (42.0, -71.0),
+            "Stadium, Denver, CO": (39.7, -105.0),
+        })
+        queue = _queue(store, geocoder, min_interval=0.05)
+        queue.enqueue({1: ("Arena", "Boston", "MA"), 2: ("Arena", "Boston", "MA"), 3: ("Stadium", "Denver", "CO")})
+        queue.enqueue({1: ("Arena", "Boston", "MA")})  # already pending
+        await queue.drain(timeout=2)
+        await queue.close()
+        self.assertEqual(len(geocoder.calls), 2)
+        self.assertGreaterEqual(geocoder.calls[1][1] - geocoder.calls[0][1], 0.045)
+        self.assertEqual(set(store.venues), {1, 2, 3})
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)
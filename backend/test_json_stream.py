@@ -0,0 +1,65 @@
+"""
+Unit tests for the incremental JSON array reader used on ESPN scoreboards.
+
+Run with:
+    cd backend
+    python -m pytest test_json_stream.py -v
+"""
+
+import io
+import json
+import sys
+import unittest
+
+sys.path.insert(0, "app")
+
+from scheduled.json_stream import iter_array_items  # type: ignore[import]  # noqa: E402
+
+
+def _events(n):
+    return [
+        {
+            "id": str(401000000 + i),
+            "name": f"Team é{i} at \"Club\" {i}",
+            "competitions": [{"competitors": [{"homeAway": "home", "score": 1.5e2}], "notes": []}],
+            "flag": i % 2 == 0,
+            "extra": None,
+        }
+        for i in range(n)
+    ]
+
+
+def _stream(document, key="events", chunk_size=7):
+    raw = json.dumps(document, ensure_ascii=False).encode("utf-8")
+    return list(iter_array_items(io.BytesIO(raw), key, chunk_size=chunk_size))
+
+
+class TestIterArrayItems(unittest.TestCase):
+    def test_matches_full_parse_for_any_chunk_size(self):
+        document = {
+            "leagues": [{"calendar": ["2026-10-01", {"events": ["not", "this"]}]}],
+            "season": {"type": 2},
+            "events": _events(25),
+            "trailer": {"x": [1, 2, 3]},
+        }
+        for chunk_size in (1, 3, 7, 64, 1 << 16):
+            self.assertEqual(_stream(document, chunk_size=chunk_size), document["events"])
+
+    def test_scalar_elements_split_across_chunks(self):
+        self.assertEqual(_stream({"events": [12345, 6.25, True, None, "x"]}, chunk_size=2), [12345, 6.25, True, None, "x"])
+
+    def test_missing_empty_and_non_array(self):
+        self.assertEqual(_stream({"leagues": []}), [])
+        self.assertEqual(_stream({}), [])
+        self.assertEqual(_stream({"events": []}), [])
+        self.assertEqual(_stream({"events": None}), [])
+
+    def test_truncated_input_raises(self):
+        raw = json.dumps({"events": _events(3)}).encode()[:-20]
+        with self.assertRaises(ValueError):
+            list(iter_array_items(io.BytesIO(raw), "events", chunk_size=16))
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)
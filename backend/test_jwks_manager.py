@@ -0,0 +1,143 @@
+"""
+Unit tests for the async JWKS manager.
+
+Uses an in-process JWKS stand-in (httpx.MockTransport) — no network needed.
+
+Run with:
+    cd backend
+    python -m pytest test_jwks_manager.py -v
+"""
+
+import asyncio
+import json
+import sys
+import time
+import unittest
+
+import httpx
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+sys.path.insert(0, "app")
+
+from core.jwks import JWKSManager  # type: ignore[import]  # noqa: E402
+
+JWKS_URL = "https://clerk.example.com/.well-known/jwks.json"
+
+
+def _make_key(kid):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update({"kid": kid, "use": "sig", "alg": "RS256"})
+    return private_key, jwk
+
+
+class _JWKSStandIn:
+    """Serves whatever keys are currently published and counts fetches."""
+
+    def __init__(self, *jwks, delay=0.0):
+        self.keys = list(jwks)
+        self.delay = delay
+        self.calls = 0
+
+    async def handler(self, request):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return httpx.Response(200, json={"keys": self.keys})
+
+    def manager(self, **kwargs):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        return JWKSManager(JWKS_URL, client=client, **kwargs)
+
+
+def _sign(private_key, kid, **claims):
+    payload = {"clerk_id": "user_123", "exp": int(time.time()) + 60, **claims}
+    return jwt.encode(payload, private_key, algorithm="RS256", headers={"kid": kid})
+
+
+class TestJWKSManager(unittest.TestCase):
+    def test_decode_valid_token(self):
+        private_key, jwk = _make_key("k1")
+        stand_in = _JWKSStandIn(jwk)
+
+        async def run():
+            manager = stand_in.manager()
+            await manager.start()
+            try:
+                return await manager.decode(_sign(private_key, "k1"), algorithms=["RS256"])
+            finally:
+                await manager.stop()
+
+        self.assertEqual(asyncio.run(run())["clerk_id"], "user_123")
+        self.assertEqual(stand_in.calls, 1)
+
+    def test_lazy_load_without_start(self):
+        private_key, jwk = _make_key("k1")
+        stand_in = _JWKSStandIn(jwk)
+
+        async def run():
+            manager = stand_in.manager()
+            try:
+                return await manager.decode(_sign(private_key, "k1"), algorithms=["RS256"])
+            finally:
+                await manager.stop()
+
+        self.assertEqual(asyncio.run(run())["clerk_id"], "user_123")
+
+    def test_concurrent_refreshes_are_deduplicated(self):
+        private_key, jwk = _make_key("k1")
+        stand_in = _JWKSStandIn(jwk, delay=0.05)
+
+        async def run():
+            manager = stand_in.manager()
+            token = _sign(private_key, "k1")
+            try:
+                await asyncio.gather(
+                    *[manager.decode(token, algorithms=["RS256"]) for _ in range(20)]
+                )
+            finally:
+                await manager.stop()
+
+        asyncio.run(run())
+        self.assertEqual(stand_in.calls, 1)
+
+    def test_unknown_kid_triggers_one_refresh(self):
+        old_key, old_jwk = _make_key("old")
+        new_key, new_jwk = _make_key("new")
+        stand_in = _JWKSStandIn(old_jwk)
+
+        async def run():
+            manager = stand_in.manager(min_refresh_interval=0)
+            try:
+                await manager.start()
+                stand_in.keys = [old_jwk, new_jwk]  # Clerk rotates keys
+                return await manager.decode(_sign(new_key, "new"), algorithms=["RS256"])
+            finally:
+                await manager.stop()
+
+        self.assertEqual(asyncio.run(run())["clerk_id"], "user_123")
+        self.assertEqual(stand_in.calls, 2)
+
+    def test_unknown_kid_refresh_is_rate_limited(self):
+        _, jwk = _make_key("k1")
+        other_key, _ = _make_key("missing")
+        stand_in = _JWKSStandIn(jwk)
+
+        async def run():
+            manager = stand_in.manager(min_refresh_interval=3600)
+            try:
+                await manager.start()
+                for _ in range(3):
+                    with self.assertRaises(jwt.PyJWKClientError):
+                        await manager.decode(_sign(other_key, "missing"), algorithms=["RS256"])
+            finally:
+                await manager.stop()
+
+        asyncio.run(run())
+        self.assertEqual(stand_in.calls, 1)
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)
@@ -0,0 +1,113 @@
+"""
+Unit tests for the chunked nightly maintenance pipeline.
+
+No database required; a fake session replays per-step row counts.
+
+Run with:
+    cd backend
+    python -m pytest test_maintenance.py -v
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from datetime import datetime, timezone
+
+sys.path.insert(0, "app")
+
+# Settings are read at import time; provide dummies so no .env is needed.
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
+os.environ.setdefault("DATABASE_URL_ASYNC", "postgresql+asyncpg://test@localhost/test")
+os.environ.setdefault("CLERK_SECRET_KEY", "test")
+os.environ.setdefault("CLERK_DOMAIN", "example.com")
+
+from scheduled.maintenance import STEPS, run_maintenance  # type: ignore[import]  # noqa: E402
+
+NOW = datetime(2026, 10, 17, 6, 30, tzinfo=timezone.utc)
+
+
+class _Result:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one(self):
+        return self.value
+
+
+class FakeSession:
+    """Answers each chunk with the next count queued for the statement's table."""
+
+    def __init__(self, counts: dict[str, list[int]], fail_on: str | None = None):
+        self.counts = counts
+        self.fail_on = fail_on
+        self.statements = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params):
+        sql = statement.text
+        self.statements.append((sql, params))
+        if self.fail_on and self.fail_on in sql:
+            raise RuntimeError("boom")
+        for step in STEPS:
+            if sql == step.sql(archive=False) or sql == step.sql(archive=True):
+                queue = self.counts.get(step.name, [])
+                return _Result(queue.pop(0) if queue else 0)
+        raise AssertionError(f"unexpected statement: {sql}")
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestRunMaintenance(unittest.TestCase):
+    def test_chunks_until_short_and_commits_each(self):
+        session = FakeSession({"purge_events": [10, 10, 3], "purge_games": [4]})
+        report = run(run_maintenance(lambda: session, now=NOW, chunk_size=10, archive=False))
+
+        by_step = {entry["step"]: entry for entry in report}
+        self.assertEqual([entry["step"] for entry in report], [step.name for step in STEPS])
+        self.assertEqual((by_step["purge_events"]["rows"], by_step["purge_events"]["chunks"]), (23, 3))
+        self.assertEqual((by_step["purge_games"]["rows"], by_step["purge_games"]["chunks"]), (4, 1))
+        self.assertEqual(session.commits, len(session.statements))
+        self.assertTrue(all(params["chunk_size"] == 10 for _, params in session.statements))
+
+    def test_cutoffs(self):
+        session = FakeSession({})
+        run(run_maintenance(lambda: session, now=NOW, chunk_size=10, archive=False))
+        params = session.statements[0][1]
+        self.assertEqual(params["today"], datetime(2026, 10, 17, tzinfo=timezone.utc))
+        self.assertIsNone(params["today_naive"].tzinfo)
+        self.assertEqual(params["game_cutoff"], datetime(2026, 10, 17, 2, 30, tzinfo=timezone.utc))
+
+    def test_archive_only_for_purges(self):
+        session = FakeSession({})
+        run(run_maintenance(lambda: session, now=NOW, chunk_size=10, archive=True))
+        archived = [sql for sql, _ in session.statements if "INSERT INTO archived_rows" in sql]
+        self.assertEqual(len(archived), 3)
+        self.assertTrue(all("DELETE FROM" in sql for sql in archived))
+
+    def test_failure_rolls_back_and_stops(self):
+        session = FakeSession({}, fail_on="DELETE FROM events")
+        with self.assertRaises(RuntimeError):
+            run(run_maintenance(lambda: session, now=NOW, chunk_size=10, archive=False))
+        self.assertEqual(session.rollbacks, 1)
+        self.assertFalse(any("DELETE FROM games" in sql for sql, _ in session.statements))
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)
@@ -0,0 +1,93 @@
+"""
+Unit tests for keyset pagination (db.pagination).
+
+No database required; statements are compiled, not executed.
+
+Run with:
+    cd backend
+    python -m pytest test_pagination.py -v
+"""
+
+import os
+import sys
+import unittest
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+sys.path.insert(0, "app")
+
+# Settings are read at import time; provide dummies so no .env is needed.
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
+os.environ.setdefault("DATABASE_URL_ASYNC", "postgresql+asyncpg://test@localhost/test")
+os.environ.setdefault("CLERK_SECRET_KEY", "test")
+os.environ.setdefault("CLERK_DOMAIN", "example.com")
+
+from fastapi import HTTPException, Response  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+from sqlalchemy.dialects import postgresql  # noqa: E402
+
+from db.pagination import NEXT_CURSOR_HEADER, Keyset, with_next_cursor  # type: ignore[import]  # noqa: E402
+from models.game import Game  # type: ignore[import]  # noqa: E402
+from models.safety_alert import SafetyAlert  # type: ignore[import]  # noqa: E402
+
+GAMES = Keyset(Game.date_time, Game.game_id)
+ALERTS = Keyset(SafetyAlert.created_at, SafetyAlert.alert_id, descending=True)
+
+
+def compile_sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestCursor(unittest.TestCase):
+    def test_round_trip_keeps_types(self):
+        when = datetime(2026, 11, 1, 19, 30, tzinfo=timezone.utc)
+        alert_id = uuid.uuid4()
+        self.assertEqual(GAMES.decode(GAMES.encode([when, 42])), [when, 42])
+        self.assertEqual(ALERTS.decode(ALERTS.encode([when.replace(tzinfo=None), alert_id])),
+                         [when.replace(tzinfo=None), alert_id])
+
+    def test_garbage_cursor_is_a_400(self):
+        for cursor in ("not-a-cursor", GAMES.encode([1])):
+            with self.assertRaises(HTTPException) as ctx:
+                GAMES.decode(cursor)
+            self.assertEqual(ctx.exception.status_code, 400)
+
+
+class TestPaginate(unittest.TestCase):
+    def test_cursor_becomes_row_comparison(self):
+        cursor = ALERTS.encode([datetime(2026, 10, 1), uuid.uuid4()])
+        sql = compile_sql(ALERTS.paginate(select(SafetyAlert), limit=20, cursor=cursor, offset=40))
+        self.assertIn("(safety_alerts.created_at, safety_alerts.alert_id) < (", sql)
+        self.assertIn("ORDER BY safety_alerts.created_at DESC, safety_alerts.alert_id DESC", sql)
+        self.assertNotIn("OFFSET", sql)
+
+    def test_offset_without_cursor(self):
+        sql = compile_sql(GAMES.paginate(select(Game), limit=20, offset=40))
+        self.assertIn("ORDER BY games.date_time ASC, games.game_id ASC", sql)
+        self.assertIn("OFFSET", sql)
+        self.assertNotIn("(games.date_time, games.game_id) >", sql)
+
+
+class TestPage(unittest.TestCase):
+    def rows(self, n):
+        return [SimpleNamespace(date_time=datetime(2026, 11, i + 1), game_id=i) for i in range(n)]
+
+    def test_last_page_has_no_cursor(self):
+        page = GAMES.page(self.rows(3), limit=3)
+        self.assertEqual(len(page), 3)
+        self.assertIsNone(page.next_cursor)
+
+    def test_look_ahead_row_is_trimmed_and_cursor_points_at_last_row(self):
+        page = GAMES.page(self.rows(4), limit=3)
+        self.assertEqual([row.game_id for row in page], [0, 1, 2])
+        self.assertEqual(GAMES.decode(page.next_cursor), [datetime(2026, 11, 3), 2])
+
+        response = Response()
+        self.assertIs(with_next_cursor(response, page), page)
+        self.assertEqual(response.headers[NEXT_CURSOR_HEADER], page.next_cursor)
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)
@@ -0,0 +1,115 @@
+"""
+Unit tests for fanning independent reads out across pooled sessions.
+
+No database required; the session factory is faked.
+
+Run with:
+    cd backend
+    python -m pytest test_parallel_reads.py -v
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.insert(0, "app")
+
+# Settings are read at import time; provide dummies so no .env is needed.
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
+os.environ.setdefault("DATABASE_URL_ASYNC", "postgresql+asyncpg://test@localhost/test")
+os.environ.setdefault("CLERK_SECRET_KEY", "test")
+os.environ.setdefault("CLERK_DOMAIN", "example.com")
+
+import db.parallel as parallel  # type: ignore[import]  # noqa: E402
+from core.config import settings  # type: ignore[import]  # noqa: E402
+
+
+class _FakeSession:
+    def __init__(self, factory):
+        self.factory = factory
+        self.closed = False
+
+    async def __aenter__(self):
+        self.factory.open += 1
+        self.factory.peak = max(self.factory.peak, self.factory.open)
+        self.factory.sessions.append(self)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.factory.open -= 1
+        self.closed = True
+
+
+class _FakeFactory:
+    def __init__(self):
+        self.open = 0
+        self.peak = 0
+        self.sessions = []
+
+    def __call__(self):
+        return _FakeSession(self)
+
+
+def _sleeper(value, delay=0.01):
+    async def load(session):
+        await asyncio.sleep(delay)
+        return value, session
+    return load
+
+
+class TestGatherReads(unittest.TestCase):
+    def setUp(self):
+        self._slots = parallel._READ_SLOTS
+
+    def tearDown(self):
+        parallel._READ_SLOTS = self._slots
+
+    def test_results_keep_loader_order_and_sessions_are_separate(self):
+        factory = _FakeFactory()
+        results = asyncio.run(parallel.gather_reads(
+            _sleeper("slow", 0.03), _sleeper("fast", 0.0), _sleeper("mid", 0.01), session_factory=factory,
+        ))
+        self.assertEqual([value for value, _ in results], ["slow", "fast", "mid"])
+        self.assertEqual(len({id(session) for _, session in results}), 3)
+        self.assertTrue(all(session.closed for session in factory.sessions))
+
+    def test_loaders_overlap(self):
+        factory = _FakeFactory()
+        asyncio.run(parallel.gather_reads(*(_sleeper(i) for i in range(3)), session_factory=factory))
+        self.assertEqual(factory.peak, 3)
+
+    def test_concurrency_is_capped(self):
+        parallel._READ_SLOTS = asyncio.Semaphore(2)
+        factory = _FakeFactory()
+        results = asyncio.run(parallel.gather_reads(*(_sleeper(i) for i in range(6)), session_factory=factory))
+        self.assertEqual([value for value, _ in results], list(range(6)))
+        self.assertEqual(factory.peak, 2)
+
+    def test_error_propagates_and_session_closes(self):
+        factory = _FakeFactory()
+
+        async def boom(session):
+            raise RuntimeError("query failed")
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(parallel.gather_reads(boom, session_factory=factory))
+        self.assertTrue(factory.sessions[0].closed)
+
+    def test_default_limit_is_half_the_pool(self):
+        original = (settings.db_parallel_reads, settings.db_pool_size)
+        try:
+            settings.db_parallel_reads = 0
+            settings.db_pool_size = 10
+            self.assertEqual(parallel.parallel_read_limit(), 5)
+            settings.db_pool_size = 1
+            self.assertEqual(parallel.parallel_read_limit(), 1)
+            settings.db_parallel_reads = 3
+            self.assertEqual(parallel.parallel_read_limit(), 3)
+        finally:
+            settings.db_parallel_reads, settings.db_pool_size = original
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)
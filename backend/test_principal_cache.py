@@ -0,0 +1,87 @@
+"""
+Unit tests for the authenticated principal cache.
+
+No database required.
+
+Run with:
+    cd backend
+    python -m pytest test_principal_cache.py -v
+"""
+
+import os
+import sys
+import time
+import unittest
+import uuid
+
+sys.path.insert(0, "app")
+
+# Settings are read at import time; provide dummies so no .env is needed.
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
+os.environ.setdefault("DATABASE_URL_ASYNC", "postgresql+asyncpg://test@localhost/test")
+os.environ.setdefault("CLERK_SECRET_KEY", "test")
+os.environ.setdefault("CLERK_DOMAIN", "example.com")
+
+from core.principal_cache import Principal, PrincipalCache  # type: ignore[import]  # noqa: E402
+
+
+def _principal(user_id=None, role="user"):
+    return Principal(user_id=user_id or uuid.uuid4(), role=role, username="tester")
+
+
+class TestPrincipalCache(unittest.TestCase):
+    def setUp(self):
+        self.exp = int(time.time()) + 3600
+
+    def test_hit_after_put(self):
+        cache = PrincipalCache(max_entries=10, ttl_seconds=60)
+        principal = _principal()
+        cache.put(str(principal.user_id), self.exp, principal)
+        self.assertEqual(cache.get(str(principal.user_id), self.exp), principal)
+
+    def test_different_exp_is_a_miss(self):
+        """A freshly issued token (new exp) must not reuse the old entry."""
+        cache = PrincipalCache(max_entries=10, ttl_seconds=60)
+        principal = _principal()
+        cache.put(str(principal.user_id), self.exp, principal)
+        self.assertIsNone(cache.get(str(principal.user_id), self.exp + 1))
+
+    def test_ttl_expiry(self):
+        cache = PrincipalCache(max_entries=10, ttl_seconds=0.01)
+        principal = _principal()
+        cache.put(str(principal.user_id), self.exp, principal)
+        time.sleep(0.02)
+        self.assertIsNone(cache.get(str(principal.user_id), self.exp))
+
+    def test_expired_token_is_not_cached(self):
+        cache = PrincipalCache(max_entries=10, ttl_seconds=60)
+        principal = _principal()
+        cache.put(str(principal.user_id), int(time.time()) - 1, principal)
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction(self):
+        cache = PrincipalCache(max_entries=2, ttl_seconds=60)
+        first, second, third = _principal(), _principal(), _principal()
+        cache.put(str(first.user_id), self.exp, first)
+        cache.put(str(second.user_id), self.exp, second)
+        cache.get(str(first.user_id), self.exp)  # first is now most recent
+        cache.put(str(third.user_id), self.exp, third)
+        self.assertIsNotNone(cache.get(str(first.user_id), self.exp))
+        self.assertIsNone(cache.get(str(second.user_id), self.exp))
+
+    def test_invalidate_user_drops_every_token(self):
+        cache = PrincipalCache(max_entries=10, ttl_seconds=60)
+        principal = _principal(role="verified_creator")
+        other = _principal()
+        cache.put(str(principal.user_id), self.exp, principal)
+        cache.put(str(principal.user_id), self.exp + 60, principal)
+        cache.put(str(other.user_id), self.exp, other)
+        cache.invalidate_user(principal.user_id)
+        self.assertIsNone(cache.get(str(principal.user_id), self.exp))
+        self.assertIsNone(cache.get(str(principal.user_id), self.exp + 60))
+        self.assertEqual(cache.get(str(other.user_id), self.exp), other)
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)
@@ -0,0 +1,198 @@
+"""
+Unit tests for the per-user saved-set cache and the is_saved overlay.
+
+No database required; the session is faked.
+
+Run with:
+    cd backend
+    python -m pytest test_saved_sets.py -v
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+import uuid
+from datetime import datetime
+
+sys.path.insert(0, "app")
+
+# Settings are read at import time; provide dummies so no .env is needed.
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
+os.environ.setdefault("DATABASE_URL_ASYNC", "postgresql+asyncpg://test@localhost/test")
+os.environ.setdefault("CLERK_SECRET_KEY", "test")
+os.environ.setdefault("CLERK_DOMAIN", "example.com")
+
+import repositories.saved_set_repo as saved_set_repo  # type: ignore[import]  # noqa: E402
+from core.chat_notifier import chat_notifier  # type: ignore[import]  # noqa: E402
+from repositories.game_synthetic_id_repo import synthetic_game_event_id  # type: ignore[import]  # noqa: E402
+from repositories.saved_set_repo import (  # type: ignore[import]  # noqa: E402
+    EMPTY_SAVED_SET,
+    SAVED_SETS_CHANNEL,
+    SavedSet,
+    get_saved_set,
+    invalidate_saved_set,
+    notify_saved_set_changed,
+    overlay_saved,
+)
+from repositories.search_repo import _overlay_saved_games  # type: ignore[import]  # noqa: E402
+from schemas.event import EventRead  # type: ignore[import]  # noqa: E402
+from schemas.search import SearchResult, SearchTypeEnum  # type: ignore[import]  # noqa: E402
+from schemas.types import EventTypeEnum  # type: ignore[import]  # noqa: E402
+
+WHEN = datetime(2026, 11, 1, 19, 30)
+
+
+def event_item(**fields) -> EventRead:
+    fields.setdefault("event_type", EventTypeEnum.TAILGATE)
+    return EventRead(event_name="x", date_time=WHEN, venue_name="", **fields)
+
+
+class _Rows:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class FakeDB:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+
+    async def execute(self, stmt):
+        self.queries += 1
+        return _Rows(self.rows)
+
+
+class _OpenConnection:
+    def is_closed(self):
+        return False
+
+
+class TestSavedSetCache(unittest.TestCase):
+    def setUp(self):
+        # Pretend this worker's LISTEN connection is up.
+        self._conn = chat_notifier._conn
+        chat_notifier._conn = _OpenConnection()
+        saved_set_repo._SAVED_SETS.clear()
+
+    def tearDown(self):
+        chat_notifier._conn = self._conn
+        saved_set_repo._SAVED_SETS.clear()
+
+    def test_loads_once_until_invalidated(self):
+        user_id, event_id = uuid.uuid4(), uuid.uuid4()
+        # A saved event on game 5, and game 7 saved directly.
+        db = FakeDB([(event_id, 5), (None, 7)])
+
+        async def run():
+            first = await get_saved_set(db, user_id)
+            self.assertEqual(first.event_ids, {event_id})
+            self.assertEqual(first.game_ids, {5, 7})
+            await get_saved_set(db, user_id)
+            self.assertEqual(db.queries, 1)
+            invalidate_saved_set(user_id)
+            await get_saved_set(db, user_id)
+            self.assertEqual(db.queries, 2)
+
+        asyncio.run(run())
+
+    def test_notification_from_another_worker_invalidates(self):
+        user_id = uuid.uuid4()
+        db = FakeDB([(None, 7)])
+
+        async def run():
+            await get_saved_set(db, user_id)
+            chat_notifier._on_channel_notify(None, 0, SAVED_SETS_CHANNEL, str(user_id))
+            await get_saved_set(db, user_id)
+            self.assertEqual(db.queries, 2)
+
+        asyncio.run(run())
+
+    def test_load_overlapping_an_invalidation_is_not_kept(self):
+        user_id = uuid.uuid4()
+
+        class RacingDB(FakeDB):
+            async def execute(self, stmt):
+                # Another worker's save lands while this load is in flight.
+                invalidate_saved_set(user_id)
+                return await super().execute(stmt)
+
+        db = RacingDB([(None, 7)])
+
+        async def run():
+            await get_saved_set(db, user_id)
+            await get_saved_set(db, user_id)
+            self.assertEqual(db.queries, 2)
+
+        asyncio.run(run())
+
+    def test_lost_listener_clears_and_bypasses_cache(self):
+        user_id = uuid.uuid4()
+        db = FakeDB([(None, 7)])
+
+        async def run():
+            await get_saved_set(db, user_id)
+            saved_set_repo._on_listener_lost()
+            chat_notifier._conn = None
+            chat_notifier._failed_at = float("inf")  # keep the test from reconnecting
+            try:
+                await get_saved_set(db, user_id)
+                await get_saved_set(db, user_id)
+            finally:
+                chat_notifier._failed_at = None
+            self.assertEqual(db.queries, 3)
+            self.assertEqual(len(saved_set_repo._SAVED_SETS._entries), 0)
+
+        asyncio.run(run())
+
+    def test_notify_is_queued_on_the_callers_transaction(self):
+        user_id = uuid.uuid4()
+        captured = []
+
+        class CapturingDB:
+            async def execute(self, stmt):
+                captured.append(stmt)
+
+        asyncio.run(notify_saved_set_changed(CapturingDB(), user_id))
+        compiled = captured[0].compile()
+        self.assertIn("pg_notify", str(compiled))
+        self.assertIn(str(user_id), compiled.params.values())
+
+    def test_anonymous_needs_no_query(self):
+        db = FakeDB([])
+        self.assertIs(asyncio.run(get_saved_set(db, None)), EMPTY_SAVED_SET)
+        self.assertEqual(db.queries, 0)
+
+
+class TestOverlay(unittest.TestCase):
+    def test_marks_saved_events_and_games_without_touching_shared_list(self):
+        saved_event, other_event = uuid.uuid4(), uuid.uuid4()
+        shared = [
+            event_item(event_id=saved_event, game_id=5),
+            event_item(event_id=other_event, game_id=7),
+            event_item(event_id=synthetic_game_event_id(7), game_id=7, event_type=EventTypeEnum.GAME),
+        ]
+        saved = SavedSet(event_ids=frozenset({saved_event}), game_ids=frozenset({7}))
+
+        overlaid = overlay_saved(shared, saved)
+
+        self.assertEqual([item.is_saved for item in overlaid], [True, False, True])
+        self.assertFalse(any(item.is_saved for item in shared))
+
+    def test_search_game_results(self):
+        shared = [
+            SearchResult(id="7", type=SearchTypeEnum.GAME, title="g", metadata={"saved": False}),
+            SearchResult(id="3", type=SearchTypeEnum.TEAM, title="t", metadata={}),
+        ]
+        overlaid = _overlay_saved_games(shared, SavedSet(game_ids=frozenset({7})))
+        self.assertTrue(overlaid[0].metadata["saved"])
+        self.assertFalse(shared[0].metadata["saved"])
+        self.assertIs(overlaid[1], shared[1])
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)
@@ -0,0 +1,138 @@
+"""
+Unit tests for scrape job staleness and the job status schema.
+
+Run with:
+    cd backend
+    python -m pytest test_scrape_jobs.py -v
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, "app")
+
+# Settings are read at import time; provide dummies so no .env is needed.
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
+os.environ.setdefault("DATABASE_URL_ASYNC", "postgresql+asyncpg://test@localhost/test")
+os.environ.setdefault("CLERK_SECRET_KEY", "test")
+os.environ.setdefault("CLERK_DOMAIN", "example.com")
+
+import scheduled.nightly_tasks as nightly_tasks  # type: ignore[import]  # noqa: E402
+from models.scrape_job import ScrapeJob  # type: ignore[import]  # noqa: E402
+from scheduled.jobs import RESUME_WINDOW, STALE_AFTER, _is_stale  # type: ignore[import]  # noqa: E402
+from schemas.scrape_job import ScrapeJobRead  # type: ignore[import]  # noqa: E402
+
+NOW = datetime(2026, 10, 17, 5, 30, tzinfo=timezone.utc)
+
+
+def make_job(**overrides) -> ScrapeJob:
+    fields = dict(
+        job_id=uuid.uuid4(),
+        status="running",
+        trigger="timer",
+        full_refresh=False,
+        attempts=1,
+        leagues_total=3,
+        leagues_done=1,
+        checkpoint={"leagues": {"NBA": {"status": "done", "seconds": 4.2}}, "stage": None},
+        created_at=NOW - timedelta(minutes=30),
+        started_at=NOW - timedelta(minutes=30),
+        heartbeat_at=NOW - timedelta(minutes=1),
+    )
+    fields.update(overrides)
+    return ScrapeJob(**fields)
+
+
+class TestStaleness(unittest.TestCase):
+    def test_recent_heartbeat_is_live(self):
+        self.assertFalse(_is_stale(make_job(), NOW, STALE_AFTER))
+
+    def test_silent_running_job_is_stale_then_abandoned(self):
+        job = make_job(heartbeat_at=NOW - timedelta(minutes=20))
+        self.assertTrue(_is_stale(job, NOW, STALE_AFTER))
+        self.assertFalse(_is_stale(job, NOW, RESUME_WINDOW))
+        old = make_job(heartbeat_at=NOW - RESUME_WINDOW - timedelta(minutes=1))
+        self.assertTrue(_is_stale(old, NOW, RESUME_WINDOW))
+
+    def test_queued_job_is_never_stale(self):
+        job = make_job(status="queued", heartbeat_at=None, created_at=NOW - timedelta(days=1))
+        self.assertFalse(_is_stale(job, NOW, STALE_AFTER))
+
+
+class TestScrapeJobRead(unittest.TestCase):
+    def test_progress_fields_come_from_checkpoint(self):
+        job = make_job(checkpoint={"leagues": {"NBA": {"status": "done"}}, "stage": "maintenance"})
+        read = ScrapeJobRead.from_db_model(job)
+        self.assertEqual(read.stage, "maintenance")
+        self.assertEqual(read.leagues, {"NBA": {"status": "done"}})
+        self.assertEqual(read.elapsed_seconds, 29 * 60)
+        dumped = read.model_dump(by_alias=True)
+        self.assertIn("leaguesDone", dumped)
+        self.assertIn("elapsedSeconds", dumped)
+
+    def test_unstarted_job_has_no_elapsed(self):
+        read = ScrapeJobRead.from_db_model(make_job(status="queued", started_at=None, heartbeat_at=None))
+        self.assertIsNone(read.elapsed_seconds)
+
+
+class _Progress:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.done = []
+        self.failed = []
+
+    async def league_done(self, league_code, stats, seconds):
+        if self.fail:
+            raise RuntimeError("checkpoint write failed")
+        self.done.append(league_code)
+
+    async def league_failed(self, league_code, error, seconds):
+        if self.fail:
+            raise RuntimeError("checkpoint write failed")
+        self.failed.append(league_code)
+
+
+class TestScrapeLeagueIsolation(unittest.TestCase):
+    def setUp(self):
+        self._teams, self._schedule = nightly_tasks.scrape_teams, nightly_tasks.scrape_schedule
+
+        async def scrape_teams(client, session, db_lock, geocoder, league_code, *rest):
+            if league_code == "BAD":
+                raise RuntimeError("ESPN down")
+
+        async def scrape_schedule(*args, full_refresh=False):
+            await asyncio.sleep(0.01)
+            return {"games": 1}
+
+        nightly_tasks.scrape_teams = scrape_teams
+        nightly_tasks.scrape_schedule = scrape_schedule
+
+    def tearDown(self):
+        nightly_tasks.scrape_teams, nightly_tasks.scrape_schedule = self._teams, self._schedule
+
+    def _run(self, progress):
+        async def run():
+            async with asyncio.TaskGroup() as leagues:
+                for code in ("BAD", "NBA", "NFL"):
+                    leagues.create_task(nightly_tasks.scrape_league(
+                        None, None, asyncio.Lock(), None, code, "sport", code.lower(), progress=progress,
+                    ))
+        asyncio.run(run())
+
+    def test_failing_league_does_not_cancel_the_others(self):
+        progress = _Progress()
+        self._run(progress)
+        self.assertEqual(progress.failed, ["BAD"])
+        self.assertEqual(sorted(progress.done), ["NBA", "NFL"])
+
+    def test_progress_errors_are_contained(self):
+        self._run(_Progress(fail=True))
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)
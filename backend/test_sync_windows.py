@@ -0,0 +1,232 @@
+"""
+Unit tests for incremental schedule sync window planning.
+
+Run with:
+    cd backend
+    python -m pytest test_sync_windows.py -v
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from datetime import date, datetime, timedelta, timezone
+
+sys.path.insert(0, "app")
+
+# Settings are read at import time; provide dummies so no .env is needed.
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
+os.environ.setdefault("DATABASE_URL_ASYNC", "postgresql+asyncpg://test@localhost/test")
+os.environ.setdefault("CLERK_SECRET_KEY", "test")
+os.environ.setdefault("CLERK_DOMAIN", "example.com")
+
+import scheduled.nightly_tasks as nightly_tasks  # type: ignore[import]  # noqa: E402
+from scheduled.sync_windows import (  # type: ignore[import]  # noqa: E402
+    FAR_WINDOW_DAYS,
+    HORIZON_DAYS,
+    NEAR_TERM_DAYS,
+    WINDOW_EPOCH,
+    fingerprint,
+    plan_windows,
+)
+
+TODAY = date(2026, 10, 17)
+NOW = datetime(2026, 10, 17, 9, 0, tzinfo=timezone.utc)
+
+
+class TestPlanWindows(unittest.TestCase):
+    def test_first_run_covers_horizon_contiguously(self):
+        windows = plan_windows("nba", TODAY, NOW, {})
+        self.assertTrue(windows[0].near_term)
+        self.assertEqual(windows[0].start, TODAY)
+        self.assertGreaterEqual((windows[0].end - TODAY).days + 1, NEAR_TERM_DAYS)
+        for prev, nxt in zip(windows, windows[1:]):
+            self.assertEqual(nxt.start, prev.end + timedelta(days=1))
+        self.assertGreaterEqual(windows[-1].end, TODAY + timedelta(days=HORIZON_DAYS - 1))
+        for window in windows[1:]:
+            self.assertFalse(window.near_term)
+            self.assertEqual((window.start - WINDOW_EPOCH).days % FAR_WINDOW_DAYS, 0)
+            self.assertEqual((window.end - window.start).days + 1, FAR_WINDOW_DAYS)
+
+    def test_recently_synced_far_windows_are_skipped(self):
+        first = plan_windows("nba", TODAY, NOW, {})
+        synced = {w.start: NOW for w in first[1:]}
+        tomorrow = plan_windows("nba", TODAY + timedelta(days=1), NOW + timedelta(days=1), synced)
+        self.assertEqual([w.near_term for w in tomorrow], [True])
+
+    def test_far_windows_refresh_weekly_and_on_full_refresh(self):
+        first = plan_windows("nba", TODAY, NOW, {})
+        synced = {w.start: NOW for w in first[1:]}
+        later = NOW + timedelta(days=7)
+        week_on = plan_windows("nba", later.date(), later, synced)
+        self.assertTrue(any(not w.near_term for w in week_on))
+        forced = plan_windows("nba", TODAY, NOW, synced, full_refresh=True)
+        self.assertEqual(forced, first)
+
+    def test_ncaab_is_daily_near_term(self):
+        windows = plan_windows("mens-college-basketball", TODAY, NOW, {})
+        self.assertEqual(len(windows), NEAR_TERM_DAYS)
+        self.assertEqual(windows[0].dates_param, "20261017")
+        self.assertTrue(all(w.near_term and w.start == w.end for w in windows))
+
+    def test_fingerprint_ignores_order_but_sees_reschedules(self):
+        a = {"game_id": 1, "date_time": datetime(2026, 11, 1, 19), "venue_id": 5}
+        b = {"game_id": 2, "date_time": datetime(2026, 11, 2, 19), "venue_id": None}
+        self.assertEqual(fingerprint([a, b]), fingerprint([b, a]))
+        moved = {**a, "date_time": datetime(2026, 11, 3, 19)}
+        self.assertNotEqual(fingerprint([a, b]), fingerprint([moved, b]))
+
+
+def _event(game_id: int, when: datetime) -> dict:
+    return {
+        "id": str(game_id),
+        "date": when.strftime("%Y-%m-%dT%H:%MZ"),
+        "competitions": [{"competitors": [
+            {"homeAway": "home", "team": {"id": "10"}},
+            {"homeAway": "away", "team": {"id": "20"}},
+        ]}],
+    }
+
+
+class _Payload:
+    def __init__(self, events):
+        self.events = events
+
+    def iter_items(self, key):
+        return iter(self.events)
+
+    def close(self):
+        pass
+
+
+class _Client:
+    def __init__(self, schedule_events, lookups):
+        self.schedule_events = schedule_events
+        self.lookups = lookups
+        self.schedule_calls = []
+        self.event_calls = []
+
+    async def get_schedule(self, espn_sport, espn_league, dates=None, groups=None):
+        self.schedule_calls.append(dates)
+        return _Payload(self.schedule_events)
+
+    async def get_event(self, espn_sport, espn_league, event_id):
+        self.event_calls.append(event_id)
+        return self.lookups.get(event_id)
+
+
+class _Session:
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+class _Geocoder:
+    def enqueue(self, queries):
+        pass
+
+
+class _Window:
+    def __init__(self, fingerprint, synced_at):
+        self.fingerprint = fingerprint
+        self.synced_at = synced_at
+
+
+class TestMovedGames(unittest.TestCase):
+    """A game rescheduled out of the near window into a far block not due this run."""
+
+    def setUp(self):
+        self.today = datetime.now().date()
+        self.now = datetime.now(timezone.utc)
+        self.tomorrow = datetime.combine(self.today + timedelta(days=1), datetime.min.time()).replace(hour=19)
+        self.upserted = []
+        self.ranges = []
+        # The near window changed since the last run; every far block was synced an hour ago.
+        far_start = nightly_tasks.plan_windows("nba", self.today, self.now, {})[1].start
+        synced = {self.today: _Window("previous", self.now - timedelta(days=1))}
+        start = far_start
+        while start < self.today + timedelta(days=HORIZON_DAYS):
+            synced[start] = _Window("far", self.now - timedelta(hours=1))
+            start += timedelta(days=FAR_WINDOW_DAYS)
+        test = self
+
+        class Teams:
+            def __init__(self, session):
+                pass
+
+            async def map_espn_ids(self, league_code):
+                return {10: 1, 20: 2}
+
+        class Games:
+            def __init__(self, session):
+                pass
+
+            async def ids_scheduled_between(self, league_id, ranges):
+                test.ranges.extend(ranges)
+                return {7, 42}
+
+            async def bulk_upsert(self, rows):
+                test.upserted.extend(rows)
+                return {"inserted": 0, "updated": len(rows), "unchanged": 0}
+
+        class Syncs:
+            def __init__(self, session):
+                pass
+
+            async def get_windows(self, league_code):
+                return synced
+
+            async def record(self, league_code, windows):
+                pass
+
+            async def prune(self, league_code, before):
+                return 0
+
+        self._patched = {
+            name: getattr(nightly_tasks, name)
+            for name in ("TeamRepository", "GameRepository", "LeagueSyncRepository", "VenueRepository")
+        }
+        nightly_tasks.TeamRepository = Teams
+        nightly_tasks.GameRepository = Games
+        nightly_tasks.LeagueSyncRepository = Syncs
+        nightly_tasks.VenueRepository = lambda session: None
+
+    def tearDown(self):
+        for name, value in self._patched.items():
+            setattr(nightly_tasks, name, value)
+
+    def _scrape(self, client):
+        return asyncio.run(nightly_tasks.scrape_schedule(
+            client, _Session(), asyncio.Lock(), _Geocoder(), "NBA", "basketball", "nba",
+        ))
+
+    def test_game_moved_to_unfetched_far_block_is_redated(self):
+        moved_to = self.tomorrow + timedelta(days=60)
+        client = _Client([_event(7, self.tomorrow)], {42: _event(42, moved_to)})
+        stats = self._scrape(client)
+
+        self.assertEqual(len(client.schedule_calls), 1)  # only the near window was due
+        self.assertEqual(client.event_calls, [42])
+        self.assertEqual(stats["games_moved"], 1)
+        dates = {row["game_id"]: row["date_time"] for row in self.upserted}
+        self.assertEqual(dates[42], moved_to)
+        self.assertEqual(dates[7], self.tomorrow)
+        # Only upcoming games within the near window are checked.
+        self.assertEqual(len(self.ranges), 1)
+        start, end = self.ranges[0]
+        self.assertGreaterEqual(start, datetime.combine(self.today, datetime.min.time()))
+        self.assertLessEqual(end - start, timedelta(days=NEAR_TERM_DAYS + FAR_WINDOW_DAYS + 1))
+
+    def test_game_no_longer_listed_is_left_alone(self):
+        client = _Client([_event(7, self.tomorrow)], {})
+        stats = self._scrape(client)
+        self.assertEqual(client.event_calls, [42])
+        self.assertEqual(stats["games_moved"], 1)
+        self.assertEqual([row["game_id"] for row in self.upserted], [7])
+
+
+if __name__ == "__main__":
+    result = unittest.main(verbosity=2, exit=False)
+    sys.exit(0 if result.result.wasSuccessful() else 1)